@@ -0,0 +1,65 @@
+import numpy as np
+
+
+class AggregateRegistry:
+    """running sums and counts over the members of a population
+
+    phenotype values are fixed at birth, so per-group means only change when
+    a member is added or removed. behavioral state counts change only on
+    state transitions. every query is O(1).
+    """
+
+    def __init__(self, attributes):
+        self.attributes = tuple(attributes)
+        self.index = {name: i for i, name in enumerate(self.attributes)}
+        self.sums = {}  # group -> per-attribute sums
+        self.counts = {}  # group -> member count
+        self.state_counts = {}  # behavioral state -> member count
+
+    def clear(self):
+        self.sums = {}
+        self.counts = {}
+        self.state_counts = {}
+
+    def add(self, group, values):
+        """count a member of group with the given attribute values"""
+        if group not in self.sums:
+            self.sums[group] = np.zeros(len(self.attributes))
+            self.counts[group] = 0
+        self.sums[group] += values
+        self.counts[group] += 1
+
+    def remove(self, group, values):
+        self.sums[group] -= values
+        self.counts[group] -= 1
+
+    def change_state(self, old_state, new_state):
+        """move one member between behavioral states (None means no state)"""
+        if old_state == new_state:
+            return
+        if old_state is not None:
+            remaining = self.state_counts[old_state] - 1
+            if remaining:
+                self.state_counts[old_state] = remaining
+            else:
+                del self.state_counts[old_state]
+        if new_state is not None:
+            self.state_counts[new_state] = self.state_counts.get(new_state, 0) + 1
+
+    def count(self, group=None):
+        """members in group, or in every group"""
+        if group is None:
+            return sum(self.counts.values())
+        return self.counts.get(group, 0)
+
+    def mean(self, attribute, group=None):
+        """mean attribute value over group (or everyone), None when empty"""
+        count = self.count(group)
+        if not count:
+            return None
+        i = self.index[attribute]
+        if group is None:
+            total = sum(sums[i] for sums in self.sums.values())
+        else:
+            total = self.sums[group][i]
+        return float(total / count)
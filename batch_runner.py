@@ -0,0 +1,228 @@
+import os
+import sys
+import time
+import traceback
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from queue import Empty
+from sim_config import SimConfig
+from simulation import Simulation
+
+
+def configure(overrides):
+    """a default SimConfig with overrides applied
+
+    keys name SimConfig attributes; a dotted key such as
+    'season_food_multiplier.winter' sets one entry of a dict-valued setting.
+    unknown keys raise ValueError.
+    """
+    config = SimConfig()
+    for key, value in overrides.items():
+        name, _, entry = key.partition('.')
+        if not hasattr(config, name):
+            raise ValueError(f"unknown config setting: {name}")
+        if not entry:
+            setattr(config, name, value)
+            continue
+        setting = getattr(config, name)
+        if not isinstance(setting, dict) or entry not in setting:
+            raise ValueError(f"unknown config entry: {key}")
+        # copy so runs never share a mutated default dict
+        setting = dict(setting)
+        setting[entry] = value
+        setattr(config, name, setting)
+    return config
+
+
+def run_simulation(index, overrides, seed, ticks, progress_queue=None, progress_interval=100):
+    """run one headless simulation and return its trait history
+
+    executed in a worker process; progress is posted to progress_queue as
+    (index, time_step) every progress_interval ticks.
+    """
+    config = configure(overrides)
+    config.random_seed = seed
+
+    start = time.perf_counter()
+    sim = Simulation(config)
+    try:
+        for _ in range(ticks):
+            sim.update()
+            if progress_queue is not None and sim.time_step % progress_interval == 0:
+                progress_queue.put((index, sim.time_step))
+        analyzer = sim.get_trait_analyzer()
+        history = {name: analyzer.column(name).copy() for name in analyzer.trait_history.columns}
+        generation_rows = {generation: list(rows) for generation, rows in analyzer.generation_rows.items()}
+        stats = dict(sim.stats)
+    finally:
+        sim.close()
+
+    return {
+        'history': history,
+        'generation_rows': generation_rows,
+        'stats': stats,
+        'elapsed': time.perf_counter() - start
+    }
+
+
+def _guarded_run(index, overrides, seed, ticks, progress_queue, progress_interval):
+    """run_simulation with any exception returned as a traceback instead of raised"""
+    # the start notice is what tells a crashed run from one that never ran
+    if progress_queue is not None:
+        progress_queue.put((index, 0))
+    try:
+        return run_simulation(index, overrides, seed, ticks, progress_queue, progress_interval)
+    except Exception:
+        return {'error': traceback.format_exc()}
+
+
+def print_progress(run, time_step, ticks):
+    print(f"run {run['index']} (seed {run['seed']}): {time_step}/{ticks} ticks")
+
+
+class BatchResult:
+    """outcome of every run in a batch, in submission order
+
+    each run is a dict with index, overrides, seed and status ('ok' or
+    'failed'); successful runs carry their TraitAnalyzer columns under
+    'history', failed ones the worker traceback under 'error'.
+    """
+
+    def __init__(self, runs, ticks):
+        self.runs = runs
+        self.ticks = ticks
+
+    def __len__(self):
+        return len(self.runs)
+
+    @property
+    def succeeded(self):
+        return [run for run in self.runs if run['status'] == 'ok']
+
+    @property
+    def failed(self):
+        return [run for run in self.runs if run['status'] == 'failed']
+
+    def combined(self):
+        """every successful run's history stacked into one set of columns
+
+        a 'run' column holds each row's run index; a field a run never logged
+        is nan in that run's rows.
+        """
+        runs = self.succeeded
+        names = []
+        for run in runs:
+            names.extend(name for name in run['history'] if name not in names)
+
+        columns = {'run': np.concatenate([np.full(len(run['history'].get('time_step', ())), run['index'])
+                                          for run in runs]) if runs else np.empty(0, dtype=int)}
+        for name in names:
+            parts = []
+            for run in runs:
+                rows = len(run['history'].get('time_step', ()))
+                parts.append(run['history'].get(name, np.full(rows, np.nan)))
+            columns[name] = np.concatenate(parts)
+        return columns
+
+    def column(self, name):
+        """one history field across all successful runs, one array per run"""
+        return [run['history'].get(name) for run in self.succeeded]
+
+
+def run_batch(overrides_list, seeds, ticks, max_workers=None, progress=print_progress, progress_interval=100):
+    """run every overrides x seed combination headless for ticks ticks in a process pool
+
+    overrides_list holds dicts of SimConfig settings (see configure); each is
+    run once per seed.
+    """
+    jobs = [(overrides, seed) for overrides in overrides_list for seed in seeds]
+    return run_jobs(jobs, ticks, max_workers, progress, progress_interval)
+
+
+def run_jobs(jobs, ticks, max_workers=None, progress=print_progress, progress_interval=100, finished=None):
+    """run (overrides, seed) pairs headless for ticks ticks in a process pool
+
+    finished, if given, is called with each run as soon as it succeeds or
+    fails. runs are spread over max_workers processes (default: all cores). an
+    exception inside a run marks only that run failed. a worker process that
+    dies outright breaks the whole pool: the runs in flight at that moment
+    are marked failed and the runs not yet started are resubmitted, once,
+    to a fresh pool.
+    """
+    runs = []
+    for overrides, seed in jobs:
+        configure(overrides)  # reject bad settings before starting any process
+        runs.append({'index': len(runs), 'overrides': dict(overrides), 'seed': seed,
+                     'status': 'pending', 'attempts': 0})
+    if not runs:
+        return BatchResult(runs, ticks)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    manager = multiprocessing.Manager()
+    progress_queue = manager.Queue()
+    started = set()
+    pending = list(runs)
+
+    def drain_progress():
+        while True:
+            try:
+                index, time_step = progress_queue.get_nowait()
+            except Empty:
+                return
+            started.add(index)
+            if progress is not None:
+                progress(runs[index], time_step, ticks)
+
+    try:
+        while pending:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+                for run in pending:
+                    run['attempts'] += 1
+                futures = {pool.submit(_guarded_run, run['index'], run['overrides'], run['seed'], ticks,
+                                       progress_queue, progress_interval): run for run in pending}
+                pending = []
+                while futures:
+                    done, _ = wait(futures, timeout=0.5, return_when=FIRST_COMPLETED)
+                    drain_progress()
+                    for future in done:
+                        run = futures.pop(future)
+                        try:
+                            outcome = future.result()
+                        except BrokenProcessPool:
+                            if run['index'] in started or run['attempts'] > 1:
+                                outcome = {'error': 'worker process terminated abruptly'}
+                            else:
+                                pending.append(run)
+                                continue
+                        if 'error' in outcome:
+                            run['status'] = 'failed'
+                            run['error'] = outcome['error']
+                        else:
+                            run['status'] = 'ok'
+                            run.update(outcome)
+                        if finished is not None:
+                            finished(run)
+                drain_progress()
+    finally:
+        manager.shutdown()
+
+    return BatchResult(runs, ticks)
+
+
+def main():
+    # usage: python batch_runner.py [ticks] [replicates]
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    replicates = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+
+    result = run_batch([{}], range(replicates), ticks)
+    for run in result.runs:
+        if run['status'] == 'ok':
+            print(f"run {run['index']} (seed {run['seed']}): {run['stats']['alive_organisms']} organisms, "
+                  f"{run['stats']['species_count']} species, {run['elapsed']:.1f}s")
+        else:
+            print(f"run {run['index']} (seed {run['seed']}) failed:\n{run['error']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+import json
+import numpy as np
+from organism import Organism, DNA
+from environment import Environment, Food, Obstacle
+from spatial_grid import FoodIndex, ObstacleField, OrganismGrid
+from population import PopulationStore
+from genome import TRAIT_COUNT, TraitView
+from timeseries import RingBuffer, SnapshotSeries
+from trait_analyzer import TraitAnalyzer
+from trait_exporter import TraitExporter
+from recorder import TrajectoryRecorder
+
+CHECKPOINT_VERSION = 6
+
+# organism attributes rebuilt on restore rather than saved
+ORGANISM_SKIP = {'_store', '_row', 'config', 'dna', 'neighborhood', 'rng'}
+
+SIMULATION_FIELDS = ['time_step', 'paused', 'camera_x', 'camera_y', 'species_count', 'species_history',
+                     'species_ids', 'lineage_tree', 'next_species_id', 'stats', 'trait_history']
+
+HISTORY_FIELDS = ['evolutionary_pressure_history', 'adaptation_history', 'diversity_history',
+                  'extinction_history', 'environmental_stress_history', 'resource_competition_history',
+                  'territorial_conflict_history', 'learning_effectiveness_history', 'innovation_history',
+                  'behavioral_adaptation_history']
+
+WEATHER_FIELDS = ['time_step', 'day_night_progress', 'is_night', 'light_level', 'season_progress',
+                  'current_season', 'season_index', 'current_temperature_modifier', 'current_food_multiplier']
+
+
+class _Encoder:
+    """turns attribute values into json, replacing object references by index
+
+    organisms are numbered in population order; organisms that are only
+    referenced (dead hunting targets, old group members) are numbered as
+    they are found, so they can be saved too.
+    """
+
+    def __init__(self, organisms, food_list, obstacles):
+        self.organisms = []
+        self._refs = {}
+        self._food_refs = {id(food): i for i, food in enumerate(food_list)}
+        self._obstacle_refs = {id(obstacle): i for i, obstacle in enumerate(obstacles)}
+        for organism in organisms:
+            self.organism_ref(organism)
+
+    def organism_ref(self, organism):
+        ref = self._refs.get(id(organism))
+        if ref is None:
+            ref = len(self.organisms)
+            self._refs[id(organism)] = ref
+            self.organisms.append(organism)
+        return ref
+
+    def food_ref(self, food):
+        return self._food_refs[id(food)]
+
+    def encode(self, value):
+        if value is None or isinstance(value, (bool, str)):
+            return value
+        if isinstance(value, np.bool_):
+            return bool(value)
+        if isinstance(value, (int, np.integer)):
+            return int(value)
+        if isinstance(value, (float, np.floating)):
+            return float(value)
+        if isinstance(value, Organism):
+            return {'$organism': self.organism_ref(value)}
+        if isinstance(value, Food):
+            return {'$food': self.food_ref(value)}
+        if isinstance(value, Obstacle):
+            return {'$obstacle': self._obstacle_refs[id(value)]}
+        if isinstance(value, RingBuffer):
+            return {'$ring': value.capacity, 'dtype': value.dtype.str,
+                    'items': [self.encode(item) for item in value]}
+        if isinstance(value, tuple):
+            return {'$tuple': [self.encode(item) for item in value]}
+        if isinstance(value, (set, frozenset)):
+            return {'$set': [self.encode(item) for item in value]}
+        if isinstance(value, list):
+            return [self.encode(item) for item in value]
+        if isinstance(value, dict):
+            if all(isinstance(key, str) and not key.startswith('$') for key in value):
+                return {key: self.encode(item) for key, item in value.items()}
+            return {'$items': [[self.encode(key), self.encode(item)] for key, item in value.items()]}
+        raise TypeError(f"cannot checkpoint a {type(value).__name__}")
+
+
+class _Decoder:
+    def __init__(self, organisms, food_list, obstacles):
+        self.organisms = organisms
+        self.food_list = food_list
+        self.obstacles = obstacles
+
+    def decode(self, value):
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if '$organism' in value:
+            return self.organisms[value['$organism']]
+        if '$food' in value:
+            return self.food_list[value['$food']]
+        if '$obstacle' in value:
+            return self.obstacles[value['$obstacle']]
+        if '$ring' in value:
+            ring = RingBuffer(value['$ring'], dtype=np.dtype(value['dtype']))
+            ring.extend(self.decode(item) for item in value['items'])
+            return ring
+        if '$tuple' in value:
+            return tuple(self.decode(item) for item in value['$tuple'])
+        if '$set' in value:
+            return set(self.decode(item) for item in value['$set'])
+        if '$items' in value:
+            return {_hashable(self.decode(key)): self.decode(item) for key, item in value['$items']}
+        return {key: self.decode(item) for key, item in value.items()}
+
+
+def _hashable(key):
+    return tuple(key) if isinstance(key, list) else key
+
+
+def _matrix(rows, width, dtype=float):
+    """rows as a (len(rows), width) array, also when there are no rows"""
+    return np.array(rows, dtype=dtype).reshape(len(rows), width)
+
+
+def _pack_json(data):
+    return np.frombuffer(json.dumps(data).encode('utf-8'), dtype=np.uint8)
+
+
+def _unpack_json(array):
+    return json.loads(array.tobytes().decode('utf-8'))
+
+
+def save_checkpoint(sim, path):
+    """write the full simulation state to a compressed .npz file"""
+    environment = sim.environment
+    encoder = _Encoder(sim.organisms, environment.food_list, environment.obstacles)
+
+    meta = {
+        'version': CHECKPOINT_VERSION,
+        'config': encoder.encode(vars(sim.config)),
+        'simulation': {name: encoder.encode(getattr(sim, name)) for name in SIMULATION_FIELDS
+                       if hasattr(sim, name)},
+        'trait_snapshots': encoder.encode(list(sim.trait_snapshots)),
+        'analyzer_generation_rows': encoder.encode(dict(sim.trait_analyzer.generation_rows)),
+        'stats_engine': {name: [metric.stale, metric.last_refresh]
+                         for name, metric in sim.stats_engine.metrics.items()},
+        'stats_engine_counts': encoder.encode(sim.stats_engine.refresh_counts),
+        'weather': {name: encoder.encode(getattr(sim.weather_system, name)) for name in WEATHER_FIELDS},
+        'organism_grid_species': list(sim.organism_grid.grids),
+        'population_count': len(sim.population),
+        'next_organism_id': sim.population.next_id,
+        'exported_rows': sim.trait_exporter.rows_written if sim.trait_exporter else None,
+        'recorded_ticks': sim.trajectory_recorder.ticks_written if sim.trajectory_recorder else None,
+    }
+
+    # running aggregates, saved as is so sums keep their rounding and order
+    aggregates = sim.population.aggregates
+    meta['aggregate_groups'] = encoder.encode(list(aggregates.sums))
+    meta['aggregate_counts'] = [aggregates.counts[group] for group in aggregates.sums]
+    meta['aggregate_states'] = encoder.encode(list(aggregates.state_counts.items()))
+
+    # organisms: the living population in row order, then every organism
+    # they reference (dead hunting targets, old group members), as found
+    misc = []
+    while len(misc) < len(encoder.organisms):
+        organism = encoder.organisms[len(misc)]
+        misc.append({key: encoder.encode(value) for key, value in vars(organism).items()
+                     if key not in ORGANISM_SKIP})
+    organisms = encoder.organisms
+    rows = [(organism._store, organism._row) for organism in organisms]
+    meta['organism_misc'] = misc
+    meta['organism_groups'] = [store.groups[row] for store, row in rows]
+
+    arrays = {
+        'aggregate_sums': _matrix(list(aggregates.sums.values()), len(aggregates.attributes)),
+        'organism_data': _matrix([store.data[row] for store, row in rows], len(PopulationStore.COLUMNS)),
+        'organism_genomes': _matrix([store.genomes[row] for store, row in rows], TRAIT_COUNT),
+        'organism_alive': np.array([store.alive[row] for store, row in rows], dtype=bool),
+        'dna_genomes': _matrix([organism.dna.genome for organism in organisms], TRAIT_COUNT),
+        'food': _matrix([[food.x, food.y, food.available] for food in environment.food_list], 3),
+        'obstacles': _matrix([[obstacle.x, obstacle.y, obstacle.size]
+                              for obstacle in environment.obstacles], 3),
+    }
+
+    # food index: grid insertion order, occupied extent and pending regrowth
+    food_index = environment.food_index
+    arrays['food_grid_order'] = np.array([encoder.food_ref(food) for food in food_index.grid],
+                                         dtype=np.int64)
+    arrays['food_regrowth'] = _matrix([[ready, encoder.food_ref(food)]
+                                       for ready, food in food_index.regrowth_queue], 2, dtype=np.int64)
+    grid = food_index.grid
+    meta['food_index_time_step'] = food_index.time_step
+    meta['food_grid_extent'] = [grid._min_cx, grid._min_cy, grid._max_cx, grid._max_cy]
+
+    # bounded histories and the trait analyzer's columns
+    for name in HISTORY_FIELDS:
+        arrays['history_' + name] = np.array(getattr(sim, name).values(), dtype=float)
+    analyzer = sim.trait_analyzer
+    meta['analyzer_names'] = list(analyzer.trait_history.columns)
+    arrays['analyzer_columns'] = _matrix([analyzer.column(name) for name in meta['analyzer_names']],
+                                         len(analyzer.trait_history))
+
+    # the simulation's random streams
+    meta['random_streams'] = sim.rng.get_state()
+
+    arrays['meta'] = _pack_json(meta)
+    np.savez_compressed(path, **arrays)
+
+
+def load_checkpoint(sim, path):
+    """restore a simulation saved by save_checkpoint, continuing the same trajectory"""
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    meta = _unpack_json(arrays.pop('meta'))
+    if meta.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"unsupported checkpoint version {meta.get('version')}")
+
+    # config first: everything rebuilt below reads it
+    config = sim.config
+    shell = _Decoder([], [], [])
+    for name, value in meta['config'].items():
+        setattr(config, name, shell.decode(value))
+
+    # environment: food in list order, re-indexed in saved grid order
+    environment = Environment.__new__(Environment)
+    environment.config = config
+    environment.rng = sim.rng.environment
+    environment.food_list = []
+    environment.food_index = FoodIndex(config)
+    for x, y, available in arrays['food']:
+        food = Food(float(x), float(y), config)
+        food.available = bool(available)
+        food.index = environment.food_index
+        environment.food_list.append(food)
+    for i in arrays['food_grid_order']:
+        environment.food_index.add(environment.food_list[i])
+    for ready, i in arrays['food_regrowth']:
+        environment.food_index.regrowth_queue.append((int(ready), environment.food_list[i]))
+    environment.food_index.time_step = meta['food_index_time_step']
+    food_grid = environment.food_index.grid
+    food_grid._min_cx, food_grid._min_cy, food_grid._max_cx, food_grid._max_cy = meta['food_grid_extent']
+    environment.obstacles = [Obstacle(float(x), float(y), float(size), config)
+                             for x, y, size in arrays['obstacles']]
+    environment.obstacle_field = ObstacleField(environment.obstacles, config,
+                                               reach=config.organism_size * 2.0)
+    sim.environment = environment
+
+    # organisms: shells first so references between them can be resolved
+    population = PopulationStore(capacity=max(1, meta['population_count']))
+    organisms = []
+    for ref, group in enumerate(meta['organism_groups']):
+        organism = Organism.__new__(Organism)
+        store = population if ref < meta['population_count'] else PopulationStore(capacity=1)
+        organism._store = store
+        organism._row = store.add(organism)
+        store.data[organism._row] = arrays['organism_data'][ref]
+        store.genomes[organism._row] = arrays['organism_genomes'][ref]
+        store.alive[organism._row] = arrays['organism_alive'][ref]
+        store.groups[organism._row] = group
+        if group is not None:
+            store.aggregates.add(group, store.data[organism._row, PopulationStore.PHENOTYPE_SLICE])
+        organisms.append(organism)
+
+    decoder = _Decoder(organisms, environment.food_list, environment.obstacles)
+    for organism, genome, misc in zip(organisms, arrays['dna_genomes'], meta['organism_misc']):
+        dna = DNA.__new__(DNA)
+        dna.config = config
+        dna.rng = sim.rng.reproduction.np
+        dna.genome = np.array(genome, dtype=float)
+        dna.traits = TraitView(dna.genome)
+        organism.config = config
+        organism.rng = sim.rng
+        organism.dna = dna
+        organism.neighborhood = None
+        for key, value in misc.items():
+            organism.__dict__[key] = decoder.decode(value)
+        organism._store.aggregates.change_state(None, organism.__dict__.get('_current_state'))
+        if organism._store is population:
+            population.by_id[organism.id] = organism
+    population.next_id = meta['next_organism_id']
+
+    # detached organisms rebuilt their private aggregates above; the
+    # population's are replaced by the saved sums to keep their rounding
+    population.aggregates.sums = {}
+    population.aggregates.counts = {}
+    for group, sums, count in zip(decoder.decode(meta['aggregate_groups']), arrays['aggregate_sums'],
+                                  meta['aggregate_counts']):
+        population.aggregates.sums[group] = np.array(sums, dtype=float)
+        population.aggregates.counts[group] = count
+    population.aggregates.state_counts = {state: count for state, count in
+                                          decoder.decode(meta['aggregate_states'])}
+    sim.population = population
+
+    sim.organism_grid = OrganismGrid(config.spatial_grid_cell_size)
+    for species_type in meta['organism_grid_species']:
+        sim.organism_grid._grid_for(species_type)
+
+    # weather phase
+    for name, value in meta['weather'].items():
+        setattr(sim.weather_system, name, decoder.decode(value))
+
+    # simulation counters, stats and histories
+    for name, value in meta['simulation'].items():
+        setattr(sim, name, decoder.decode(value))
+    for name in HISTORY_FIELDS:
+        history = RingBuffer(config.max_stat_history)
+        history.extend(arrays['history_' + name])
+        setattr(sim, name, history)
+    sim.trait_snapshots = SnapshotSeries(config.max_trait_history)
+    for snapshot in decoder.decode(meta['trait_snapshots']):
+        sim.trait_snapshots.append(snapshot)
+
+    sim.trait_analyzer = TraitAnalyzer(config)
+    sim.trait_analyzer.restore_columns(dict(zip(meta['analyzer_names'], arrays['analyzer_columns'])),
+                                       decoder.decode(meta['analyzer_generation_rows']))
+
+    for name, (stale, last_refresh) in meta['stats_engine'].items():
+        metric = sim.stats_engine.metrics[name]
+        metric.stale = stale
+        metric.last_refresh = last_refresh
+    sim.stats_engine.refresh_counts.update(decoder.decode(meta['stats_engine_counts']))
+    sim.stats_engine.time_step = sim.time_step
+
+    # keep streaming to the same export and trajectory files, from where the checkpoint was
+    if sim.trait_exporter:
+        sim.trait_exporter.close()
+    sim.trait_exporter = None
+    if config.trait_export_path:
+        sim.trait_exporter = TraitExporter(config.trait_export_path, config.trait_export_chunk_rows,
+                                           append=True, keep_rows=meta['exported_rows'])
+    if sim.trajectory_recorder:
+        sim.trajectory_recorder.close()
+    sim.trajectory_recorder = None
+    if config.trajectory_path:
+        sim.trajectory_recorder = TrajectoryRecorder(config.trajectory_path, append=True,
+                                                     keep_ticks=meta['recorded_ticks'])
+
+    # random streams last, so nothing above consumes them
+    sim.rng.seed = config.random_seed
+    sim.rng.set_state(meta['random_streams'])
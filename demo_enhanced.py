@@ -4,6 +4,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from simulation import Simulation
+from renderer import create_window_renderer
+from fast_forward import FastForward
 from sim_config import SimConfig
 from trait_analyzer import TraitAnalyzer
 
@@ -30,14 +32,18 @@ def run_enhanced_simulation():
     
     # create enhanced simulation
     sim = Simulation(config)
+    sim.attach_renderer(create_window_renderer(config))
+    fast_forward = FastForward(sim, config)
     
     # main game loop
     running = True
     clock = pygame.time.Clock()
+    last_report = 0
     
     print("Controls:")
     print("- Space: Pause/Resume")
     print("- R: Reset")
+    print("- F: Toggle fast-forward")
     print("- Escape: Quit")
     print("- 1-9: Toggle visualization features")
     print()
@@ -55,7 +61,11 @@ def run_enhanced_simulation():
                     print(f"Simulation {'Paused' if sim.paused else 'Resumed'}")
                 elif event.key == pygame.K_r:
                     sim.reset()
+                    last_report = 0
                     print("Simulation Reset")
+                elif event.key == pygame.K_f:
+                    fast_forward.toggle()
+                    print(f"Fast-forward: {'On' if fast_forward.enabled else 'Off'}")
                 elif event.key == pygame.K_1:
                     config.show_energy_bars = not config.show_energy_bars
                     print(f"Energy Bars: {'On' if config.show_energy_bars else 'Off'}")
@@ -84,23 +94,24 @@ def run_enhanced_simulation():
                     config.show_season_indicator = not config.show_season_indicator
                     print(f"Season Indicator: {'On' if config.show_season_indicator else 'Off'}")
         
-        # update simulation
-        sim.update()
+        # update and render the simulation, many ticks per frame when fast-forwarding
+        fast_forward.run_frame()
         
-        # render
-        sim.render()
+        # control frame rate; fast-forward runs as fast as the cpu allows
+        clock.tick(0 if fast_forward.enabled else config.fps)
         
-        # control frame rate
-        clock.tick(config.fps)
-        
-        # print periodic status updates
-        if sim.time_step % 1000 == 0:
+        # print periodic status updates, once per 1000 ticks however many ran this frame
+        if sim.time_step // 1000 > last_report:
+            last_report = sim.time_step // 1000
+            sim.refresh_stats()
             print(f"Time: {sim.time_step}, Organisms: {sim.stats['alive_organisms']}, "
                   f"Species: {sim.stats['species_count']}, "
                   f"Adaptation: {sim.stats['average_adaptation_score']:.2f}, "
                   f"Pressure: {sim.stats['evolutionary_pressure']:.2f}")
     
+    sim.close()
     pygame.quit()
+    sim.refresh_stats()
     
     # comprehensive analysis
     print("\n" + "=" * 60)
@@ -166,11 +177,12 @@ def create_enhanced_analysis_plots(sim, analyzer):
     
     # 1. Population and Species Dynamics
     ax1 = plt.subplot(3, 3, 1)
-    times = [s['time_step'] for s in sim.trait_snapshots]
-    populations = [s['population'] for s in sim.trait_snapshots]
-    predators = [s['predators'] for s in sim.trait_snapshots]
-    prey = [s['prey'] for s in sim.trait_snapshots]
-    species_counts = [s['species_count'] for s in sim.trait_snapshots]
+    snapshots = sim.trait_snapshots
+    times = snapshots.column('time_step')
+    populations = snapshots.column('population')
+    predators = snapshots.column('predators')
+    prey = snapshots.column('prey')
+    species_counts = snapshots.column('species_count')
     
     ax1.plot(times, populations, 'b-', linewidth=2, label='Total Population')
     ax1.plot(times, predators, 'r-', linewidth=2, label='Predators')
@@ -187,9 +199,9 @@ def create_enhanced_analysis_plots(sim, analyzer):
     
     # 2. Enhanced Evolution Metrics
     ax2 = plt.subplot(3, 3, 2)
-    adaptation_scores = [s['average_adaptation_score'] for s in sim.trait_snapshots]
-    energy_efficiencies = [s['average_energy_efficiency'] for s in sim.trait_snapshots]
-    evolutionary_pressures = [s['evolutionary_pressure'] for s in sim.trait_snapshots]
+    adaptation_scores = snapshots.column('average_adaptation_score')
+    energy_efficiencies = snapshots.column('average_energy_efficiency')
+    evolutionary_pressures = snapshots.column('evolutionary_pressure')
     
     ax2.plot(times, adaptation_scores, 'g-', linewidth=2, label='Adaptation Score')
     ax2.plot(times, energy_efficiencies, 'b-', linewidth=2, label='Energy Efficiency')
@@ -205,9 +217,9 @@ def create_enhanced_analysis_plots(sim, analyzer):
     
     # 3. Environmental and Competition Analysis
     ax3 = plt.subplot(3, 3, 3)
-    environmental_stress = [s['environmental_stress'] for s in sim.trait_snapshots]
-    resource_competition = [s['resource_competition_level'] for s in sim.trait_snapshots]
-    population_diversity = [s['population_diversity'] for s in sim.trait_snapshots]
+    environmental_stress = snapshots.column('environmental_stress')
+    resource_competition = snapshots.column('resource_competition_level')
+    population_diversity = snapshots.column('population_diversity')
     
     ax3.plot(times, environmental_stress, 'r-', linewidth=2, label='Environmental Stress')
     ax3.plot(times, resource_competition, 'orange', linewidth=2, label='Resource Competition')
@@ -223,15 +235,8 @@ def create_enhanced_analysis_plots(sim, analyzer):
     
     # 4. Trait Evolution - Speed and Vision
     ax4 = plt.subplot(3, 3, 4)
-    speed_means = []
-    vision_means = []
-    for snapshot in sim.trait_snapshots:
-        if 'traits' in snapshot and 'speed' in snapshot['traits']:
-            speed_means.append(snapshot['traits']['speed']['mean'])
-            vision_means.append(snapshot['traits']['vision']['mean'])
-        else:
-            speed_means.append(0)
-            vision_means.append(0)
+    speed_means = snapshots.column('traits.speed.mean')
+    vision_means = snapshots.column('traits.vision.mean')
     
     ax4.plot(times, speed_means, 'b-', linewidth=2, label='Speed')
     ax4.plot(times, vision_means, 'g-', linewidth=2, label='Vision')
@@ -243,15 +248,8 @@ def create_enhanced_analysis_plots(sim, analyzer):
     
     # 5. Behavioral Trait Evolution
     ax5 = plt.subplot(3, 3, 5)
-    intelligence_means = []
-    social_behavior_means = []
-    for snapshot in sim.trait_snapshots:
-        if 'traits' in snapshot and 'intelligence' in snapshot['traits']:
-            intelligence_means.append(snapshot['traits']['intelligence']['mean'])
-            social_behavior_means.append(snapshot['traits']['social_behavior']['mean'])
-        else:
-            intelligence_means.append(0)
-            social_behavior_means.append(0)
+    intelligence_means = snapshots.column('traits.intelligence.mean')
+    social_behavior_means = snapshots.column('traits.social_behavior.mean')
     
     ax5.plot(times, intelligence_means, 'purple', linewidth=2, label='Intelligence')
     ax5.plot(times, social_behavior_means, 'orange', linewidth=2, label='Social Behavior')
@@ -263,15 +261,8 @@ def create_enhanced_analysis_plots(sim, analyzer):
     
     # 6. Enhanced Trait Evolution
     ax6 = plt.subplot(3, 3, 6)
-    efficiency_means = []
-    adaptability_means = []
-    for snapshot in sim.trait_snapshots:
-        if 'traits' in snapshot and 'efficiency' in snapshot['traits']:
-            efficiency_means.append(snapshot['traits']['efficiency']['mean'])
-            adaptability_means.append(snapshot['traits']['adaptability']['mean'])
-        else:
-            efficiency_means.append(0)
-            adaptability_means.append(0)
+    efficiency_means = snapshots.column('traits.efficiency.mean')
+    adaptability_means = snapshots.column('traits.adaptability.mean')
     
     ax6.plot(times, efficiency_means, 'cyan', linewidth=2, label='Efficiency')
     ax6.plot(times, adaptability_means, 'magenta', linewidth=2, label='Adaptability')
@@ -283,15 +274,8 @@ def create_enhanced_analysis_plots(sim, analyzer):
     
     # 7. Predator-Prey Dynamics
     ax7 = plt.subplot(3, 3, 7)
-    aggression_means = []
-    caution_means = []
-    for snapshot in sim.trait_snapshots:
-        if 'traits' in snapshot and 'aggression' in snapshot['traits']:
-            aggression_means.append(snapshot['traits']['aggression']['mean'])
-            caution_means.append(snapshot['traits']['caution']['mean'])
-        else:
-            aggression_means.append(0)
-            caution_means.append(0)
+    aggression_means = snapshots.column('traits.aggression.mean')
+    caution_means = snapshots.column('traits.caution.mean')
     
     ax7.plot(times, aggression_means, 'red', linewidth=2, label='Aggression (Predators)')
     ax7.plot(times, caution_means, 'green', linewidth=2, label='Caution (Prey)')
@@ -303,18 +287,9 @@ def create_enhanced_analysis_plots(sim, analyzer):
     
     # 8. Protective Features Evolution
     ax8 = plt.subplot(3, 3, 8)
-    camouflage_means = []
-    toxicity_means = []
-    armor_means = []
-    for snapshot in sim.trait_snapshots:
-        if 'traits' in snapshot and 'camouflage' in snapshot['traits']:
-            camouflage_means.append(snapshot['traits']['camouflage']['mean'])
-            toxicity_means.append(snapshot['traits']['toxicity']['mean'])
-            armor_means.append(snapshot['traits']['armor']['mean'])
-        else:
-            camouflage_means.append(0)
-            toxicity_means.append(0)
-            armor_means.append(0)
+    camouflage_means = snapshots.column('traits.camouflage.mean')
+    toxicity_means = snapshots.column('traits.toxicity.mean')
+    armor_means = snapshots.column('traits.armor.mean')
     
     ax8.plot(times, camouflage_means, 'brown', linewidth=2, label='Camouflage')
     ax8.plot(times, toxicity_means, 'purple', linewidth=2, label='Toxicity')
@@ -327,8 +302,8 @@ def create_enhanced_analysis_plots(sim, analyzer):
     
     # 9. Fitness and Survival Analysis
     ax9 = plt.subplot(3, 3, 9)
-    fitness_scores = [s['average_fitness'] for s in sim.trait_snapshots]
-    food_density = [s['food_density'] for s in sim.trait_snapshots]
+    fitness_scores = snapshots.column('average_fitness')
+    food_density = snapshots.column('food_density')
     
     ax9.plot(times, fitness_scores, 'gold', linewidth=2, label='Average Fitness')
     ax9_twin = ax9.twinx()
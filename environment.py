@@ -1,25 +1,23 @@
-import random
-import pygame
+from rng import RandomStream
 from sim_config import SimConfig
+from spatial_grid import FoodIndex, ObstacleField
 
 class Food:
-    def __init__(self, x, y, config: SimConfig):
+    def __init__(self, x, y, config: SimConfig, index=None):
         self.x = x
         self.y = y
         self.config = config
         self.available = True
-        self.regen_timer = 0
+        
+        # food index that tracks availability and schedules regrowth
+        self.index = index
+        if index is not None:
+            index.add(self)
     
     def consume(self):
         self.available = False
-        self.regen_timer = 0
-    
-    def update(self):
-        if not self.available:
-            self.regen_timer += 1
-            if self.regen_timer >= 1 / self.config.food_regen_rate:
-                self.available = True
-                self.regen_timer = 0
+        if self.index is not None:
+            self.index.mark_consumed(self)
 
 class Obstacle:
     def __init__(self, x, y, size, config: SimConfig):
@@ -29,31 +27,38 @@ class Obstacle:
         self.config = config
 
 class Environment:
-    def __init__(self, config: SimConfig):
+    def __init__(self, config: SimConfig, rng=None):
         self.config = config
+        # the simulation's environment stream; a standalone environment gets its own
+        self.rng = rng if rng is not None else RandomStream()
         self.food_list = []
+        self.food_index = FoodIndex(config)
         self.obstacles = []
         self._generate_initial_food()
         if config.terrain_enabled:
             self._generate_obstacles()
+        
+        # obstacles never move, so avoidance can use a precomputed field
+        # that reaches as far as the largest organism (size trait caps at 2.0)
+        self.obstacle_field = ObstacleField(self.obstacles, config,
+                                            reach=config.organism_size * 2.0)
     
     def _generate_initial_food(self):
         for _ in range(self.config.initial_food_count):
-            x = random.uniform(0, self.config.world_width)
-            y = random.uniform(0, self.config.world_height)
-            self.food_list.append(Food(x, y, self.config))
+            x = self.rng.uniform(0, self.config.world_width)
+            y = self.rng.uniform(0, self.config.world_height)
+            self.food_list.append(Food(x, y, self.config, self.food_index))
     
     def _generate_obstacles(self):
         for _ in range(self.config.obstacle_count):
-            x = random.uniform(0, self.config.world_width)
-            y = random.uniform(0, self.config.world_height)
-            size = random.uniform(*self.config.obstacle_size_range)
+            x = self.rng.uniform(0, self.config.world_width)
+            y = self.rng.uniform(0, self.config.world_height)
+            size = self.rng.uniform(*self.config.obstacle_size_range)
             self.obstacles.append(Obstacle(x, y, size, self.config))
     
     def update(self, weather_system=None):
-        # update all food
-        for food in self.food_list:
-            food.update()
+        # regrow consumed food whose delay has passed
+        self.food_index.advance()
         
         # phase 5: apply seasonal food multipliers
         food_multiplier = 1.0
@@ -61,68 +66,39 @@ class Environment:
             food_multiplier = weather_system.get_food_multiplier()
         
         # improved food generation: more frequent and adaptive
-        current_food_count = len(self.get_available_food())
+        current_food_count = self.food_index.available_count()
         target_food_count = int(self.config.initial_food_count * food_multiplier)
         
         # if food is scarce, increase generation rate
         if current_food_count < target_food_count * 0.5:
             # high food scarcity - generate more food
-            if random.random() < 0.05:  # 5% chance per frame
+            if self.rng.random() < 0.05:  # 5% chance per frame
                 self._add_random_food()
         elif current_food_count < target_food_count * 0.8:
             # moderate food scarcity
-            if random.random() < 0.02:  # 2% chance per frame
+            if self.rng.random() < 0.02:  # 2% chance per frame
                 self._add_random_food()
         else:
             # normal food levels
-            if random.random() < 0.01:  # 1% chance per frame
+            if self.rng.random() < 0.01:  # 1% chance per frame
                 self._add_random_food()
     
     def _add_random_food(self):
-        x = random.uniform(0, self.config.world_width)
-        y = random.uniform(0, self.config.world_height)
-        self.food_list.append(Food(x, y, self.config))
+        x = self.rng.uniform(0, self.config.world_width)
+        y = self.rng.uniform(0, self.config.world_height)
+        self.food_list.append(Food(x, y, self.config, self.food_index))
     
     def get_available_food(self):
-        return [food for food in self.food_list if food.available]
+        return self.food_index.available_food()
+    
+    def get_available_food_count(self):
+        return self.food_index.available_count()
     
     def get_obstacles(self):
         return self.obstacles
     
     def get_food_density(self):
         """calculate food density for competition mechanics"""
-        available_food = len(self.get_available_food())
+        available_food = self.food_index.available_count()
         total_area = self.config.world_width * self.config.world_height
         return available_food / total_area
-    
-    def render(self, screen, camera_offset=(0, 0)):
-        # render obstacles
-        for obstacle in self.obstacles:
-            screen_x = int(obstacle.x - camera_offset[0])
-            screen_y = int(obstacle.y - camera_offset[1])
-            
-            # only render if on screen
-            if (0 <= screen_x <= self.config.width and 
-                0 <= screen_y <= self.config.height):
-                pygame.draw.circle(
-                    screen, 
-                    self.config.obstacle_color, 
-                    (screen_x, screen_y), 
-                    int(obstacle.size)
-                )
-        
-        # render food
-        for food in self.food_list:
-            if food.available:
-                screen_x = int(food.x - camera_offset[0])
-                screen_y = int(food.y - camera_offset[1])
-                
-                # only render if on screen
-                if (0 <= screen_x <= self.config.width and 
-                    0 <= screen_y <= self.config.height):
-                    pygame.draw.circle(
-                        screen, 
-                        self.config.food_color, 
-                        (screen_x, screen_y), 
-                        self.config.food_size
-                    ) 
\ No newline at end of file
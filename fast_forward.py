@@ -0,0 +1,72 @@
+import time
+
+
+class FastForward:
+    """runs many simulation ticks per displayed frame
+
+    when enabled, each frame runs ticks_per_frame updates back to back and
+    then renders once. ticks_per_frame is re-estimated every frame from
+    the measured tick and render times so a frame fits the wall-clock
+    frame budget, growing at most twofold per frame. a frame whose ticks
+    alone overran the budget is not drawn, so the viewer catches up
+    instead of falling further behind (at most max_skipped_frames in a
+    row, so the screen still refreshes). when disabled, a frame is one
+    update and one render, as before.
+    """
+
+    def __init__(self, sim, config):
+        self.sim = sim
+        self.config = config
+        self.enabled = config.fast_forward
+        self.ticks_per_frame = 1
+        self.skipped_frames = 0
+        self._tick_seconds = None
+        self._render_seconds = 0.0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.ticks_per_frame = 1
+        self.skipped_frames = 0
+
+    def run_frame(self):
+        """advance the simulation by one displayed frame and render it if due"""
+        if not self.enabled:
+            self.sim.update()
+            self.sim.render()
+            return 1
+
+        ticks = self.ticks_per_frame
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.sim.update()
+        elapsed = time.perf_counter() - start
+
+        if (elapsed > self.config.fast_forward_frame_budget and
+                self.skipped_frames < self.config.fast_forward_max_skipped_frames):
+            # behind budget: skip drawing and catch up
+            self.skipped_frames += 1
+        else:
+            self.skipped_frames = 0
+            start = time.perf_counter()
+            self.sim.render(extra_lines=[f"Fast-forward: {ticks} ticks/frame"])
+            self._render_seconds = _smooth(self._render_seconds, time.perf_counter() - start)
+
+        # a paused simulation does no work, so its timing says nothing
+        if not self.sim.paused:
+            self._tick_seconds = _smooth(self._tick_seconds, elapsed / ticks)
+            self._adapt()
+        return ticks
+
+    def _adapt(self):
+        budget = max(self.config.fast_forward_frame_budget - self._render_seconds,
+                     self.config.fast_forward_frame_budget * 0.1)
+        target = int(budget / max(self._tick_seconds, 1e-6))
+        self.ticks_per_frame = max(1, min(target, self.ticks_per_frame * 2,
+                                          self.config.fast_forward_max_ticks))
+
+
+def _smooth(average, value, weight=0.3):
+    """exponential moving average, seeded with the first value"""
+    if average is None:
+        return value
+    return average + weight * (value - average)
@@ -0,0 +1,126 @@
+from collections.abc import MutableMapping
+import numpy as np
+
+# single source of truth for every heritable trait, in genome vector order:
+# (name, phenotype attribute, initial range, clamp bounds, normalization factor)
+TRAIT_REGISTRY = (
+    ('speed', 'speed', (1.0, 3.0), (0.1, 3.0), 3.0),  # increased minimum speed
+    ('vision', 'vision_radius', (30, 120), (10, 150), 150.0),  # increased minimum vision
+    ('size', 'size', (0.5, 1.5), (0.3, 2.0), 2.0),
+    ('metabolism', 'metabolism_rate', (0.2, 0.8), (0.1, 2.0), 2.0),  # reduced metabolism range
+    ('reproduction_threshold', 'reproduction_threshold', (40, 80), (40, 120), 120.0),
+    ('max_age', 'max_age', (300, 1000), (100, 1000), 1000.0),  # whole frames at birth
+    ('aggression', 'aggression', (0.1, 1.0), (0.05, 1.5), 1.5),  # for predators
+    ('caution', 'caution', (0.1, 1.0), (0.05, 1.5), 1.5),        # for prey
+    ('stamina', 'stamina', (0.8, 2.0), (0.2, 2.0), 2.0),         # increased stamina
+    # phase 5: weather adaptation traits
+    ('cold_resistance', 'cold_resistance', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('heat_resistance', 'heat_resistance', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('night_vision', 'night_vision', (0.1, 1.0), (0.05, 1.5), 1.5),
+    # phase 6: behavioral evolution traits
+    ('intelligence', 'intelligence', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('social_behavior', 'social_behavior', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('exploration_rate', 'exploration_rate', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('memory_capacity', 'memory_capacity', (0.1, 1.0), (0.05, 1.5), 1.5),
+    # phase 6: prey protective traits
+    ('camouflage', 'camouflage', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('toxicity', 'toxicity', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('armor', 'armor', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('warning_signals', 'warning_signals', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('group_cohesion', 'group_cohesion', (0.1, 1.0), (0.05, 1.5), 1.5),
+    # phase 6: predator hunting traits
+    ('hunting_strategy', 'hunting_strategy', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('patience', 'patience', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('cooperation', 'cooperation', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('learning_rate', 'learning_rate', (0.1, 1.0), (0.05, 1.5), 1.5),
+    # new: enhanced trait interactions
+    ('efficiency', 'efficiency', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('adaptability', 'adaptability', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('resilience', 'resilience', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('specialization', 'specialization', (0.1, 1.0), (0.05, 1.5), 1.5),
+    ('innovation', 'innovation', (0.1, 1.0), (0.05, 1.5), 1.5),
+)
+
+TRAIT_NAMES = tuple(entry[0] for entry in TRAIT_REGISTRY)
+TRAIT_COUNT = len(TRAIT_NAMES)
+TRAIT_INDEX = {name: i for i, name in enumerate(TRAIT_NAMES)}
+PHENOTYPE_ATTRIBUTES = tuple(entry[1] for entry in TRAIT_REGISTRY)
+
+INIT_LOW = np.array([entry[2][0] for entry in TRAIT_REGISTRY], dtype=float)
+INIT_HIGH = np.array([entry[2][1] for entry in TRAIT_REGISTRY], dtype=float)
+CLAMP_MIN = np.array([entry[3][0] for entry in TRAIT_REGISTRY], dtype=float)
+CLAMP_MAX = np.array([entry[3][1] for entry in TRAIT_REGISTRY], dtype=float)
+NORMALIZATION = np.array([entry[4] for entry in TRAIT_REGISTRY], dtype=float)
+
+# traits drawn as whole numbers at birth (inclusive upper bound)
+INTEGER_TRAITS = np.array([name == 'max_age' for name in TRAIT_NAMES])
+
+
+def random_genome(generator):
+    """draw a founder genome from the registry's initial ranges with a numpy Generator"""
+    genome = generator.uniform(INIT_LOW, INIT_HIGH)
+    genome[INTEGER_TRAITS] = generator.integers(INIT_LOW[INTEGER_TRAITS].astype(int),
+                                                INIT_HIGH[INTEGER_TRAITS].astype(int) + 1)
+    return genome
+
+
+def mutate_genome(parent_genome, mutation_rate, mutation_magnitude, generator):
+    """copy a genome, apply per-trait gaussian mutation and clamp to bounds"""
+    genome = parent_genome.copy()
+    mutated = generator.random(TRAIT_COUNT) < mutation_rate
+    genome[mutated] += generator.normal(0.0, mutation_magnitude, int(mutated.sum()))
+    np.clip(genome, CLAMP_MIN, CLAMP_MAX, out=genome)
+    return genome
+
+
+def genetic_diversity(genomes):
+    """mean genetic distance over all unordered pairs of genomes
+
+    the distance is a mean of per-trait normalized absolute differences, so
+    it splits by trait: after sorting a column, sum_{i<j} |v_j - v_i| equals
+    sum_i v_i * (2i - n + 1). exact, and O(n log n) instead of O(n^2).
+    """
+    n = len(genomes)
+    if n < 2:
+        return 0.0
+    ordered = np.sort(genomes, axis=0)
+    weights = 2.0 * np.arange(n) - (n - 1)
+    pair_sums = weights @ ordered  # per-trait sum of pairwise differences
+    pair_count = n * (n - 1) / 2.0
+    return float(np.mean(pair_sums / (pair_count * NORMALIZATION)))
+
+
+def phenotype_scales(config):
+    """per-trait factors that turn a genome into phenotype attribute values"""
+    scales = np.ones(TRAIT_COUNT)
+    scales[TRAIT_INDEX['size']] = config.organism_size
+    scales[TRAIT_INDEX['metabolism']] = config.energy_decay_rate
+    return scales
+
+
+class TraitView(MutableMapping):
+    """dict-style compatibility view over a genome vector"""
+
+    def __init__(self, genome):
+        self.genome = genome
+
+    def __getitem__(self, name):
+        return float(self.genome[TRAIT_INDEX[name]])
+
+    def __setitem__(self, name, value):
+        self.genome[TRAIT_INDEX[name]] = value
+
+    def __delitem__(self, name):
+        raise TypeError("genome traits cannot be removed")
+
+    def __iter__(self):
+        return iter(TRAIT_NAMES)
+
+    def __len__(self):
+        return TRAIT_COUNT
+
+    def __contains__(self, name):
+        return name in TRAIT_INDEX
+
+    def __repr__(self):
+        return repr(dict(self.items()))
@@ -1,6 +1,9 @@
 import pygame
+import os
 import sys
 from simulation import Simulation
+from renderer import create_window_renderer
+from fast_forward import FastForward
 from sim_config import SimConfig
 
 def main():
@@ -12,6 +15,8 @@ def main():
     
     # create simulation
     sim = Simulation(config)
+    sim.attach_renderer(create_window_renderer(config))
+    fast_forward = FastForward(sim, config)
     
     # main game loop
     running = True
@@ -29,16 +34,20 @@ def main():
                     sim.toggle_pause()
                 elif event.key == pygame.K_r:
                     sim.reset()
+                elif event.key == pygame.K_f:
+                    fast_forward.toggle()
+                elif event.key == pygame.K_s:
+                    sim.save_checkpoint(config.checkpoint_path)
+                elif event.key == pygame.K_l and os.path.exists(config.checkpoint_path):
+                    sim.load_checkpoint(config.checkpoint_path)
         
-        # update simulation
-        sim.update()
+        # update and render the simulation, many ticks per frame when fast-forwarding
+        fast_forward.run_frame()
         
-        # render
-        sim.render()
-        
-        # control frame rate
-        clock.tick(config.fps)
+        # control frame rate; fast-forward runs as fast as the cpu allows
+        clock.tick(0 if fast_forward.enabled else config.fps)
     
+    sim.close()
     pygame.quit()
     sys.exit()
 
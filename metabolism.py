@@ -0,0 +1,66 @@
+import numpy as np
+
+# temperature organisms are adapted to; colder or hotter costs energy
+OPTIMAL_TEMPERATURE = 20
+
+
+def apply_metabolism(store, weather_system, config, active_count):
+    """apply weather effects, energy use and death by energy or age to a whole population store"""
+    count = store.count
+    if not count:
+        return np.empty(0, dtype=int)
+
+    columns = store.columns
+    temperature = columns['current_temperature'][:count]
+    stress = columns['temperature_stress'][:count]
+    cold_resistance = columns['cold_resistance'][:count]
+    heat_resistance = columns['heat_resistance'][:count]
+
+    # temperature at every position
+    temperature[:] = weather_system.get_temperatures_at(columns['x'][:count], columns['y'][:count])
+    cold = temperature < OPTIMAL_TEMPERATURE
+    hot = temperature > OPTIMAL_TEMPERATURE
+
+    # temperature stress: set by cold or heat the organism does not resist,
+    # recovering slowly at the optimal temperature
+    cold_stress = (OPTIMAL_TEMPERATURE - temperature) * (1.0 - cold_resistance) * 0.1
+    heat_stress = (temperature - OPTIMAL_TEMPERATURE) * (1.0 - heat_resistance) * 0.1
+    stress[:] = np.maximum(0, np.where(cold, cold_stress, np.where(hot, heat_stress, stress - 0.05)))
+
+    # weather adaptation: resistance to the current temperature, night vision in low light
+    adaptation = np.where(cold, cold_resistance, np.where(hot, heat_resistance, 1.0))
+    if weather_system.get_light_level() < 0.5:
+        adaptation = adaptation * columns['night_vision'][:count]
+    columns['weather_adaptation_score'][:count] = adaptation
+
+    # energy use of the organisms still alive after their update
+    rows = np.flatnonzero(store.alive[:active_count])
+    energy = columns['energy'][rows]
+    consumption = columns['metabolism_rate'][rows]
+
+    # reduce consumption when energy is low (survival mode)
+    consumption = consumption * np.where(energy < config.initial_energy * 0.3, 0.5, 1.0)
+
+    # increase consumption when moving fast
+    dx = columns['dx'][rows]
+    dy = columns['dy'][rows]
+    current_speed = np.sqrt(dx * dx + dy * dy)
+    consumption = consumption * np.where(current_speed > columns['speed'][rows] * 0.8, 1.2, 1.0)
+
+    # cold and heat both raise metabolism (warming up, cooling down)
+    row_temperature = temperature[rows]
+    temp_effect = config.temperature_effect_on_metabolism
+    cold_factor = (OPTIMAL_TEMPERATURE - row_temperature) * temp_effect * (1.0 - cold_resistance[rows])
+    heat_factor = (row_temperature - OPTIMAL_TEMPERATURE) * temp_effect * (1.0 - heat_resistance[rows])
+    consumption = consumption * np.where(cold[rows], 1.0 + cold_factor, np.where(hot[rows], 1.0 + heat_factor, 1.0))
+
+    # temperature stress increases energy consumption
+    consumption = consumption * (1.0 + stress[rows])
+
+    energy -= consumption
+    columns['energy'][rows] = energy
+
+    # death by energy or age
+    died = rows[(energy <= 0) | (columns['age'][rows] >= columns['max_age'][rows])]
+    store.alive[died] = False
+    return died
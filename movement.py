@@ -0,0 +1,27 @@
+import numpy as np
+
+
+def integrate_positions(store, config):
+    """move every organism in the store by its queued steps and wrap around the world"""
+    count = store.count
+    if not count:
+        return
+
+    columns = store.columns
+    x = columns['x'][:count]
+    y = columns['y'][:count]
+    move_x = columns['move_x'][:count]
+    move_y = columns['move_y'][:count]
+    walk_x = columns['walk_x'][:count]
+    walk_y = columns['walk_y'][:count]
+
+    walk_speed = columns['speed'][:count] * np.minimum(1.0, columns['energy'][:count] / config.initial_energy)
+    x += move_x + walk_x * walk_speed
+    y += move_y + walk_y * walk_speed
+    np.mod(x, config.world_width, out=x)
+    np.mod(y, config.world_height, out=y)
+
+    move_x[:] = 0.0
+    move_y[:] = 0.0
+    walk_x[:] = 0.0
+    walk_y[:] = 0.0
@@ -1,181 +1,44 @@
-import random
 import math
 import numpy as np
 from sim_config import SimConfig
+from rng import RandomStreams
+from population import PopulationStore, column_property, alive_property
+from timeseries import RingBuffer
+from genome import (TRAIT_INDEX, NORMALIZATION, TraitView, random_genome, mutate_genome,
+                    phenotype_scales)
 
 class DNA:
-    def __init__(self, config: SimConfig, parent_dna=None):
+    def __init__(self, config: SimConfig, parent_dna=None, rng=None):
         self.config = config
+        # numpy generator for trait draws; standalone dna gets fresh entropy
+        self.rng = rng if rng is not None else np.random.default_rng()
         
         if parent_dna:
             # inherit from parent with mutation
-            self.traits = self._inherit_with_mutation(parent_dna.traits)
+            self.genome = self._inherit_with_mutation(parent_dna.genome)
         else:
             # generate random initial traits
-            self.traits = self._generate_random_traits()
+            self.genome = self._generate_random_traits()
+        
+        # dict-style access for compatibility; hot paths index the genome directly
+        self.traits = TraitView(self.genome)
     
     def _generate_random_traits(self):
-        return {
-            'speed': random.uniform(1.0, 3.0),  # increased minimum speed
-            'vision': random.uniform(30, 120),   # increased minimum vision
-            'size': random.uniform(0.5, 1.5),
-            'metabolism': random.uniform(0.2, 0.8),  # reduced metabolism range
-            'reproduction_threshold': random.uniform(40, 80),  # reduced threshold
-            'max_age': random.randint(300, 1000),  # increased minimum age
-            'aggression': random.uniform(0.1, 1.0),  # for predators
-            'caution': random.uniform(0.1, 1.0),     # for prey
-            'stamina': random.uniform(0.8, 2.0),     # increased stamina
-            # phase 5: weather adaptation traits
-            'cold_resistance': random.uniform(0.1, 1.0),  # resistance to cold temperatures
-            'heat_resistance': random.uniform(0.1, 1.0),  # resistance to hot temperatures
-            'night_vision': random.uniform(0.1, 1.0),     # ability to see in low light
-            # phase 6: behavioral evolution traits
-            'intelligence': random.uniform(0.1, 1.0),     # decision making ability
-            'social_behavior': random.uniform(0.1, 1.0),  # group behavior tendency
-            'exploration_rate': random.uniform(0.1, 1.0), # tendency to explore new areas
-            'memory_capacity': random.uniform(0.1, 1.0),  # ability to remember past events
-            # phase 6: prey protective traits
-            'camouflage': random.uniform(0.1, 1.0),       # ability to hide from predators
-            'toxicity': random.uniform(0.1, 1.0),         # poisonous/repellent to predators
-            'armor': random.uniform(0.1, 1.0),            # physical protection
-            'warning_signals': random.uniform(0.1, 1.0),  # ability to signal danger to others
-            'group_cohesion': random.uniform(0.1, 1.0),   # tendency to stay in groups
-            # phase 6: predator hunting traits
-            'hunting_strategy': random.uniform(0.1, 1.0), # different hunting approaches
-            'patience': random.uniform(0.1, 1.0),         # willingness to wait for prey
-            'cooperation': random.uniform(0.1, 1.0),      # ability to hunt in groups
-            'learning_rate': random.uniform(0.1, 1.0),     # ability to adapt hunting strategies
-            # new: enhanced trait interactions
-            'efficiency': random.uniform(0.1, 1.0),  # energy efficiency
-            'adaptability': random.uniform(0.1, 1.0),  # ability to adapt to changes
-            'resilience': random.uniform(0.1, 1.0),  # ability to recover from damage
-            'specialization': random.uniform(0.1, 1.0),  # specialization vs generalization
-            'innovation': random.uniform(0.1, 1.0)  # ability to develop new strategies
-        }
+        # initial ranges, clamp bounds and normalization live in the trait registry
+        return random_genome(self.rng)
     
-    def _inherit_with_mutation(self, parent_traits):
-        traits = {}
-        for trait_name, parent_value in parent_traits.items():
-            # gaussian mutation with configurable rate and magnitude
-            mutation_rate = self.config.mutation_rate
-            mutation_magnitude = self.config.mutation_magnitude
-            
-            if random.random() < mutation_rate:
-                # apply gaussian mutation
-                mutation = random.gauss(0, mutation_magnitude)
-                traits[trait_name] = parent_value + mutation
-            else:
-                traits[trait_name] = parent_value
-            
-            # ensure traits stay within reasonable bounds
-            traits[trait_name] = self._clamp_trait(trait_name, traits[trait_name])
-        
-        return traits
-    
-    def _clamp_trait(self, trait_name, value):
-        # define bounds for each trait
-        bounds = {
-            'speed': (0.1, 3.0),
-            'vision': (10, 150),
-            'size': (0.3, 2.0),
-            'metabolism': (0.1, 2.0),
-            'reproduction_threshold': (40, 120),
-            'max_age': (100, 1000),
-            'aggression': (0.05, 1.5),
-            'caution': (0.05, 1.5),
-            'stamina': (0.2, 2.0),
-            # phase 5: weather adaptation trait bounds
-            'cold_resistance': (0.05, 1.5),
-            'heat_resistance': (0.05, 1.5),
-            'night_vision': (0.05, 1.5),
-            # phase 6: behavioral evolution trait bounds
-            'intelligence': (0.05, 1.5),
-            'social_behavior': (0.05, 1.5),
-            'exploration_rate': (0.05, 1.5),
-            'memory_capacity': (0.05, 1.5),
-            # phase 6: prey protective trait bounds
-            'camouflage': (0.05, 1.5),
-            'toxicity': (0.05, 1.5),
-            'armor': (0.05, 1.5),
-            'warning_signals': (0.05, 1.5),
-            'group_cohesion': (0.05, 1.5),
-            # phase 6: predator hunting trait bounds
-            'hunting_strategy': (0.05, 1.5),
-            'patience': (0.05, 1.5),
-            'cooperation': (0.05, 1.5),
-            'learning_rate': (0.05, 1.5),
-            # new: enhanced trait bounds
-            'efficiency': (0.05, 1.5),
-            'adaptability': (0.05, 1.5),
-            'resilience': (0.05, 1.5),
-            'specialization': (0.05, 1.5),
-            'innovation': (0.05, 1.5)
-        }
-        
-        min_val, max_val = bounds.get(trait_name, (0, float('inf')))
-        return max(min_val, min(max_val, value))
+    def _inherit_with_mutation(self, parent_genome):
+        # gaussian mutation with configurable rate and magnitude, clamped to trait bounds
+        return mutate_genome(parent_genome, self.config.mutation_rate,
+                             self.config.mutation_magnitude, self.rng)
     
     def calculate_genetic_distance(self, other_dna):
         """calculate genetic distance between two dna sequences"""
         if not other_dna:
             return float('inf')
         
-        total_distance = 0
-        trait_count = 0
-        
-        for trait_name in self.traits.keys():
-            if trait_name in other_dna.traits:
-                # normalize trait values to 0-1 range for comparison
-                my_value = self.traits[trait_name]
-                other_value = other_dna.traits[trait_name]
-                
-                # calculate normalized difference
-                # use trait-specific normalization based on typical ranges
-                normalization_factors = {
-                    'speed': 3.0,
-                    'vision': 150.0,
-                    'size': 2.0,
-                    'metabolism': 2.0,
-                    'reproduction_threshold': 120.0,
-                    'max_age': 1000.0,
-                    'aggression': 1.5,
-                    'caution': 1.5,
-                    'stamina': 2.0,
-                    # phase 5: weather adaptation normalization
-                    'cold_resistance': 1.5,
-                    'heat_resistance': 1.5,
-                    'night_vision': 1.5,
-                    # phase 6: behavioral evolution normalization
-                    'intelligence': 1.5,
-                    'social_behavior': 1.5,
-                    'exploration_rate': 1.5,
-                    'memory_capacity': 1.5,
-                    # phase 6: prey protective trait normalization
-                    'camouflage': 1.5,
-                    'toxicity': 1.5,
-                    'armor': 1.5,
-                    'warning_signals': 1.5,
-                    'group_cohesion': 1.5,
-                    # phase 6: predator hunting trait normalization
-                    'hunting_strategy': 1.5,
-                    'patience': 1.5,
-                    'cooperation': 1.5,
-                    'learning_rate': 1.5,
-                    # new: enhanced trait normalization
-                    'efficiency': 1.5,
-                    'adaptability': 1.5,
-                    'resilience': 1.5,
-                    'specialization': 1.5,
-                    'innovation': 1.5
-                }
-                
-                norm_factor = normalization_factors.get(trait_name, 1.0)
-                normalized_diff = abs(my_value - other_value) / norm_factor
-                total_distance += normalized_diff
-                trait_count += 1
-        
-        # return average distance across all traits
-        return total_distance / max(1, trait_count)
+        # average normalized difference across all traits
+        return float(np.mean(np.abs(self.genome - other_dna.genome) / NORMALIZATION))
     
     def calculate_trait_synergies(self):
         """calculate trait synergies and conflicts"""
@@ -205,21 +68,21 @@ class DNA:
             ('social_behavior', 'exploration_rate')  # social vs exploration
         ]
         
+        genome = self.genome
+        
         # calculate synergy scores
         for trait1, trait2 in synergy_pairs:
-            if trait1 in self.traits and trait2 in self.traits:
-                value1 = self.traits[trait1]
-                value2 = self.traits[trait2]
-                synergy_score = (value1 + value2) / 2.0
-                synergies.append((trait1, trait2, synergy_score))
+            value1 = float(genome[TRAIT_INDEX[trait1]])
+            value2 = float(genome[TRAIT_INDEX[trait2]])
+            synergy_score = (value1 + value2) / 2.0
+            synergies.append((trait1, trait2, synergy_score))
         
         # calculate conflict scores
         for trait1, trait2 in conflict_pairs:
-            if trait1 in self.traits and trait2 in self.traits:
-                value1 = self.traits[trait1]
-                value2 = self.traits[trait2]
-                conflict_score = abs(value1 - value2)
-                conflicts.append((trait1, trait2, conflict_score))
+            value1 = float(genome[TRAIT_INDEX[trait1]])
+            value2 = float(genome[TRAIT_INDEX[trait2]])
+            conflict_score = abs(value1 - value2)
+            conflicts.append((trait1, trait2, conflict_score))
         
         return synergies, conflicts
 
@@ -235,15 +98,22 @@ class BehaviorState:
     GROUP_BEHAVIOR = "group_behavior"
 
 class Organism:
-    def __init__(self, x, y, config: SimConfig, parent_dna=None, species_type='prey', parent_id=None):
+    def __init__(self, x, y, config: SimConfig, parent_dna=None, species_type='prey', parent_id=None,
+                 store=None, rng=None):
+        # numeric state lives in a population store row; standalone organisms get their own
+        self._store = store if store is not None else PopulationStore(capacity=1)
+        self._row = self._store.add(self)
+        # the simulation's random streams; standalone organisms get their own
+        self.rng = rng if rng is not None else RandomStreams()
+        
         self.x = x
         self.y = y
         self.config = config
-        self.dna = DNA(config, parent_dna)
+        self.dna = DNA(config, parent_dna, self.rng.reproduction.np)
         self.energy = config.initial_energy
         self.alive = True
         self.age = 0
-        self.id = self._generate_id()
+        self.id = self._store.register(self)
         self.species_type = species_type  # 'predator' or 'prey'
         
         # phase 4: lineage tracking
@@ -253,8 +123,8 @@ class Organism:
         self.generation = self._calculate_generation()
         
         # movement direction (random initial direction)
-        self.dx = random.uniform(-1, 1)
-        self.dy = random.uniform(-1, 1)
+        self.dx = self.rng.organisms.uniform(-1, 1)
+        self.dy = self.rng.organisms.uniform(-1, 1)
         self._normalize_direction()
         
         # phenotype mapping - convert dna traits to actual behavior
@@ -281,7 +151,7 @@ class Organism:
         self.current_state = BehaviorState.IDLE
         self.state_timer = 0
         self.state_duration = 0
-        self.perception_memory = []  # remember recent perceptions
+        self.perception_memory = RingBuffer(int(self.memory_capacity * 10) + 5, dtype=object)  # remember recent perceptions
         self.behavior_weights = self._initialize_behavior_weights()
         self.last_decision_time = 0
         self.decision_cooldown = 30  # frames between decisions
@@ -294,7 +164,7 @@ class Organism:
         self.group_members = []  # nearby organisms of same type
         
         # phase 6: predator hunting features
-        self.hunting_target = None
+        self.hunting_target_id = None
         self.hunting_strategy_cooldown = 0
         self.learned_behaviors = {}  # remember successful strategies
         
@@ -317,7 +187,7 @@ class Organism:
         self.velocity_y = 0.0
         
         # new: learning and memory tracking
-        self.experience_memory = []
+        self.experience_memory = RingBuffer(int(self.memory_capacity * 5), dtype=object)
         self.learned_strategies = {}
         self.behavioral_adaptations = {}
         
@@ -326,9 +196,33 @@ class Organism:
         self.territory_radius = 0
         self.resource_claims = []
         
+        # neighbors from the simulation's per-tick perception pass
+        self.neighborhood = None
+        
         # calculate initial trait interactions
         self._calculate_trait_interactions()
     
+    @property
+    def current_state(self):
+        return self._current_state
+    
+    @current_state.setter
+    def current_state(self, state):
+        # keep the population's state counts in step with every transition
+        self._store.aggregates.change_state(getattr(self, '_current_state', None), state)
+        self._current_state = state
+    
+    @property
+    def hunting_target(self):
+        # held by id so a removed organism is never kept around as a target
+        if self.hunting_target_id is None:
+            return None
+        return self._store.get(self.hunting_target_id)
+    
+    @hunting_target.setter
+    def hunting_target(self, organism):
+        self.hunting_target_id = organism.id if organism is not None else None
+    
     def _calculate_trait_interactions(self):
         """calculate trait synergies and conflicts"""
         self.trait_synergies, self.trait_conflicts = self.dna.calculate_trait_synergies()
@@ -340,16 +234,12 @@ class Organism:
         self.adaptation_score = max(0.1, 1.0 + synergy_bonus - conflict_penalty)
         
         # calculate energy efficiency based on traits
-        efficiency_trait = self.dna.traits.get('efficiency', 0.5)
-        metabolism_trait = self.dna.traits.get('metabolism', 0.5)
+        efficiency_trait = self.efficiency
+        metabolism_trait = self.dna.genome[TRAIT_INDEX['metabolism']]
         
         # efficiency reduces energy costs, metabolism increases them
         self.energy_efficiency = efficiency_trait / (1.0 + metabolism_trait)
     
-    def _generate_id(self):
-        # simple id generation for tracking
-        return random.randint(1000000, 9999999)
-    
     def _initialize_ancestors(self, parent_id):
         """initialize ancestry tracking"""
         if parent_id is None:
@@ -377,58 +267,20 @@ class Organism:
     def _initialize_behavior_weights(self):
         """phase 6: initialize behavior decision weights"""
         return {
-            'seek_food_weight': self.dna.traits['intelligence'] * 0.5 + 0.5,
-            'evade_weight': self.dna.traits['caution'] * 0.8 + 0.2,
-            'rest_weight': (1.0 - self.dna.traits['stamina']) * 0.6 + 0.4,
-            'explore_weight': self.dna.traits['exploration_rate'] * 0.7 + 0.3,
-            'social_weight': self.dna.traits['social_behavior'] * 0.8 + 0.2,
-            'hunt_weight': self.dna.traits['aggression'] * 0.8 + 0.2,
-            'patience_weight': self.dna.traits['patience'] * 0.6 + 0.4,
-            'cooperation_weight': self.dna.traits['cooperation'] * 0.7 + 0.3
+            'seek_food_weight': self.intelligence * 0.5 + 0.5,
+            'evade_weight': self.caution * 0.8 + 0.2,
+            'rest_weight': (1.0 - self.stamina) * 0.6 + 0.4,
+            'explore_weight': self.exploration_rate * 0.7 + 0.3,
+            'social_weight': self.social_behavior * 0.8 + 0.2,
+            'hunt_weight': self.aggression * 0.8 + 0.2,
+            'patience_weight': self.patience * 0.6 + 0.4,
+            'cooperation_weight': self.cooperation * 0.7 + 0.3
         }
     
     def _update_phenotype(self):
-        # convert dna traits to actual organism properties
-        self.speed = self.dna.traits['speed']
-        self.vision_radius = self.dna.traits['vision']
-        self.size = self.config.organism_size * self.dna.traits['size']
-        self.metabolism_rate = self.config.energy_decay_rate * self.dna.traits['metabolism']
-        self.reproduction_threshold = self.dna.traits['reproduction_threshold']
-        self.max_age = self.dna.traits['max_age']
-        self.aggression = self.dna.traits['aggression']
-        self.caution = self.dna.traits['caution']
-        self.stamina = self.dna.traits['stamina']
-        
-        # phase 5: weather adaptation traits
-        self.cold_resistance = self.dna.traits['cold_resistance']
-        self.heat_resistance = self.dna.traits['heat_resistance']
-        self.night_vision = self.dna.traits['night_vision']
-        
-        # phase 6: behavioral evolution traits
-        self.intelligence = self.dna.traits['intelligence']
-        self.social_behavior = self.dna.traits['social_behavior']
-        self.exploration_rate = self.dna.traits['exploration_rate']
-        self.memory_capacity = self.dna.traits['memory_capacity']
-        
-        # phase 6: prey protective traits
-        self.camouflage = self.dna.traits['camouflage']
-        self.toxicity = self.dna.traits['toxicity']
-        self.armor = self.dna.traits['armor']
-        self.warning_signals = self.dna.traits['warning_signals']
-        self.group_cohesion = self.dna.traits['group_cohesion']
-        
-        # phase 6: predator hunting traits
-        self.hunting_strategy = self.dna.traits['hunting_strategy']
-        self.patience = self.dna.traits['patience']
-        self.cooperation = self.dna.traits['cooperation']
-        self.learning_rate = self.dna.traits['learning_rate']
-        
-        # new: enhanced traits
-        self.efficiency = self.dna.traits['efficiency']
-        self.adaptability = self.dna.traits['adaptability']
-        self.resilience = self.dna.traits['resilience']
-        self.specialization = self.dna.traits['specialization']
-        self.innovation = self.dna.traits['innovation']
+        # convert dna traits to actual organism properties in one row write
+        self._store.set_genome(self._row, self.dna.genome, phenotype_scales(self.config),
+                               self.species_type)
     
     def _normalize_direction(self):
         # normalize direction vector
@@ -437,16 +289,16 @@ class Organism:
             self.dx /= length
             self.dy /= length
     
-    def update(self, food_list, other_organisms, obstacles, weather_system=None):
+    def update(self, food_index, other_organisms, obstacles, weather_system=None):
+        """behavior phase of the simulation tick; movement and metabolism follow in array kernels"""
         if not self.alive:
             return
         
         self.age += 1
         self.survival_time += 1
         
-        # phase 5: update weather effects
-        if weather_system:
-            self._update_weather_effects(weather_system)
+        # weather effects, energy use and natural death follow in
+        # metabolism.apply_metabolism; behaviors see last tick's weather values
         
         # phase 4: check for speciation periodically
         if self.age - self.last_speciation_check > self.speciation_cooldown:
@@ -454,10 +306,10 @@ class Organism:
             self.last_speciation_check = self.age
         
         # phase 6: update behavioral state machine
-        self._update_behavioral_state(food_list, other_organisms, obstacles, weather_system)
+        self._update_behavioral_state(food_index, other_organisms, obstacles, weather_system)
         
         # execute behavior based on current state
-        self._execute_behavior(food_list, other_organisms, obstacles, weather_system)
+        self._execute_behavior(food_index, other_organisms, obstacles, weather_system)
         
         # phase 6: update protective features
         self._update_protective_features(other_organisms)
@@ -474,11 +326,28 @@ class Organism:
         self._update_learning()
         self._update_territorial_behavior(other_organisms)
         self._update_evolutionary_pressure(other_organisms)
-        
-        self._consume_energy()
-        self._check_death()
     
-    def _update_behavioral_state(self, food_list, other_organisms, obstacles, weather_system=None):
+    def get_perception_radius(self):
+        """largest radius any behavior queries neighbors within this tick"""
+        # warning signals reach vision * 1.2; speciation uses a fixed radius
+        return max(self.vision_radius * 1.2, self.config.speciation_spatial_threshold)
+    
+    def _neighbors_within(self, other_organisms, radius, species_type=None):
+        """(organism, distance) pairs within radius, preferring this tick's perception data"""
+        if self.neighborhood is not None and radius <= self.neighborhood.radius:
+            return self.neighborhood.within(radius, species_type)
+        return other_organisms.query_radius(self.x, self.y, radius, species_type)
+    
+    def _nearest_neighbor(self, other_organisms, species_type=None, predicate=None):
+        """nearest matching organism, searching beyond the perception radius if needed"""
+        if self.neighborhood is not None:
+            nearest, _ = self.neighborhood.nearest(species_type, predicate)
+            if nearest is not None:
+                return nearest
+        nearest, _ = other_organisms.nearest(self.x, self.y, species_type, predicate=predicate)
+        return nearest
+    
+    def _update_behavioral_state(self, food_index, other_organisms, obstacles, weather_system=None):
         """phase 6: update behavioral state machine"""
         # update state timer
         self.state_timer += 1
@@ -486,14 +355,14 @@ class Organism:
         # check if it's time to make a new decision
         if (self.age - self.last_decision_time > self.decision_cooldown or 
             self.state_timer > self.state_duration):
-            self._make_behavioral_decision(food_list, other_organisms, weather_system)
+            self._make_behavioral_decision(food_index, other_organisms, weather_system)
             self.last_decision_time = self.age
             self.state_timer = 0
     
-    def _make_behavioral_decision(self, food_list, other_organisms, weather_system=None):
+    def _make_behavioral_decision(self, food_index, other_organisms, weather_system=None):
         """phase 6: make behavioral decision based on current situation and traits"""
         # gather perception data
-        perception = self._gather_perception_data(food_list, other_organisms, weather_system)
+        perception = self._gather_perception_data(food_index, other_organisms, weather_system)
         
         # store in memory
         self._update_perception_memory(perception)
@@ -504,7 +373,7 @@ class Organism:
         # select new state based on scores and randomness
         self._select_new_state(state_scores)
     
-    def _gather_perception_data(self, food_list, other_organisms, weather_system):
+    def _gather_perception_data(self, food_index, other_organisms, weather_system):
         """phase 6: gather perception data from environment"""
         perception = {
             'nearby_food': [],
@@ -520,35 +389,27 @@ class Organism:
         }
         
         # scan for nearby entities
-        for food in food_list:
-            if food.available:
-                distance = self._distance_to(food)
-                if distance < self.vision_radius:
-                    perception['nearby_food'].append((food, distance))
-                    perception['food_availability'] += 1.0 / max(1, distance)
-        
-        for org in other_organisms:
+        for food, distance in food_index.query_radius(self.x, self.y, self.vision_radius):
+            perception['nearby_food'].append((food, distance))
+            perception['food_availability'] += 1.0 / max(1, distance)
+        
+        for org, distance in self._neighbors_within(other_organisms, self.vision_radius):
             if org.alive and org.id != self.id:
-                distance = self._distance_to(org)
-                if distance < self.vision_radius:
-                    if org.species_type == 'predator' and self.species_type == 'prey':
-                        perception['nearby_predators'].append((org, distance))
-                        perception['threat_level'] += 1.0 / max(1, distance)
-                    elif org.species_type == 'prey' and self.species_type == 'predator':
-                        perception['nearby_prey'].append((org, distance))
-                    elif org.species_type == self.species_type:
-                        perception['nearby_allies'].append((org, distance))
+                if org.species_type == 'predator' and self.species_type == 'prey':
+                    perception['nearby_predators'].append((org, distance))
+                    perception['threat_level'] += 1.0 / max(1, distance)
+                elif org.species_type == 'prey' and self.species_type == 'predator':
+                    perception['nearby_prey'].append((org, distance))
+                elif org.species_type == self.species_type:
+                    perception['nearby_allies'].append((org, distance))
         
         return perception
     
     def _update_perception_memory(self, perception):
         """phase 6: update perception memory with recent data"""
+        # memory size is fixed by the memory capacity trait; the ring buffer
+        # drops the oldest perception once full
         self.perception_memory.append(perception)
-        
-        # limit memory size based on memory capacity trait
-        max_memory = int(self.memory_capacity * 10) + 5
-        if len(self.perception_memory) > max_memory:
-            self.perception_memory.pop(0)
     
     def _calculate_state_scores(self, perception):
         """phase 6: calculate scores for different behavioral states"""
@@ -624,7 +485,7 @@ class Organism:
         if total_score == 0:
             # fallback to idle
             self.current_state = BehaviorState.IDLE
-            self.state_duration = random.randint(30, 120)
+            self.state_duration = self.rng.organisms.randint(30, 120)
             return
         
         probabilities = {state: score / total_score for state, score in state_scores.items()}
@@ -633,7 +494,7 @@ class Organism:
         states = list(probabilities.keys())
         weights = list(probabilities.values())
         
-        self.current_state = random.choices(states, weights=weights)[0]
+        self.current_state = self.rng.organisms.choices(states, weights=weights)[0]
         
         # set state duration based on state type and traits
         self.state_duration = self._calculate_state_duration()
@@ -643,26 +504,26 @@ class Organism:
         base_duration = 60  # 1 second at 60fps
         
         if self.current_state == BehaviorState.REST:
-            return random.randint(30, 90)  # shorter rest periods
+            return self.rng.organisms.randint(30, 90)  # shorter rest periods
         elif self.current_state == BehaviorState.EVADE:
-            return random.randint(20, 60)  # short evade periods
+            return self.rng.organisms.randint(20, 60)  # short evade periods
         elif self.current_state == BehaviorState.SEEK_FOOD:
-            return random.randint(60, 180)  # longer food seeking
+            return self.rng.organisms.randint(60, 180)  # longer food seeking
         elif self.current_state == BehaviorState.EXPLORE:
-            return random.randint(120, 300)  # longer exploration
+            return self.rng.organisms.randint(120, 300)  # longer exploration
         elif self.current_state == BehaviorState.HUNT:
-            return random.randint(60, 150)  # moderate hunting periods
+            return self.rng.organisms.randint(60, 150)  # moderate hunting periods
         elif self.current_state == BehaviorState.GROUP_BEHAVIOR:
-            return random.randint(90, 240)  # longer group behavior
+            return self.rng.organisms.randint(90, 240)  # longer group behavior
         else:
-            return random.randint(30, 120)  # default duration
+            return self.rng.organisms.randint(30, 120)  # default duration
     
-    def _execute_behavior(self, food_list, other_organisms, obstacles, weather_system=None):
+    def _execute_behavior(self, food_index, other_organisms, obstacles, weather_system=None):
         """phase 6: execute behavior based on current state"""
         if self.current_state == BehaviorState.IDLE:
             self._execute_idle_behavior(obstacles)
         elif self.current_state == BehaviorState.SEEK_FOOD:
-            self._execute_seek_food_behavior(food_list, obstacles)
+            self._execute_seek_food_behavior(food_index, obstacles)
         elif self.current_state == BehaviorState.EVADE:
             self._execute_evade_behavior(other_organisms, obstacles)
         elif self.current_state == BehaviorState.REST:
@@ -679,15 +540,15 @@ class Organism:
     def _execute_idle_behavior(self, obstacles):
         """phase 6: execute idle behavior"""
         # minimal movement, conserve energy
-        if random.random() < 0.1:  # 10% chance to move
+        if self.rng.organisms.random() < 0.1:  # 10% chance to move
             self._move_randomly_improved(obstacles)
     
-    def _execute_seek_food_behavior(self, food_list, obstacles):
+    def _execute_seek_food_behavior(self, food_index, obstacles):
         """phase 6: execute food seeking behavior"""
         # actively seek food
-        if not self._eat_food(food_list):
+        if not self._eat_food(food_index):
             # move towards nearest food or explore
-            nearest_food = self._find_nearest_food(food_list)
+            nearest_food = self._find_nearest_food(food_index)
             if nearest_food:
                 self._move_towards(nearest_food.x, nearest_food.y, obstacles)
             else:
@@ -712,15 +573,15 @@ class Organism:
     def _execute_rest_behavior(self, obstacles):
         """phase 6: execute rest behavior"""
         # minimal movement, focus on energy recovery
-        if random.random() < 0.05:  # 5% chance to move
+        if self.rng.organisms.random() < 0.05:  # 5% chance to move
             self._move_randomly_improved(obstacles)
     
     def _execute_explore_behavior(self, obstacles):
         """phase 6: execute exploration behavior"""
         # move in a more exploratory pattern
-        if random.random() < 0.15:  # 15% chance to change direction
-            self.dx += random.uniform(-0.5, 0.5)
-            self.dy += random.uniform(-0.5, 0.5)
+        if self.rng.organisms.random() < 0.15:  # 15% chance to change direction
+            self.dx += self.rng.organisms.uniform(-0.5, 0.5)
+            self.dy += self.rng.organisms.uniform(-0.5, 0.5)
             self._normalize_direction()
         
         self._move_randomly_improved(obstacles)
@@ -757,10 +618,10 @@ class Organism:
     def _execute_cooperative_hunting(self, other_organisms, obstacles):
         """phase 6: execute cooperative hunting strategy"""
         # find nearby predators to hunt with
-        nearby_predators = [org for org in other_organisms 
-                          if org.species_type == 'predator' and org.id != self.id 
-                          and self._distance_to(org) < self.vision_radius * 0.8]
-        
+        nearby_predators = [org for org, _
+                            in self._neighbors_within(other_organisms, self.vision_radius * 0.8, 'predator')
+                            if org.id != self.id]
+
         nearest_prey = self._find_nearest_prey(other_organisms)
         if nearest_prey and nearby_predators:
             # coordinate attack with other predators
@@ -785,9 +646,9 @@ class Organism:
     def _execute_group_behavior(self, other_organisms, obstacles):
         """phase 6: execute group behavior"""
         # find nearby allies
-        nearby_allies = [org for org in other_organisms 
-                        if org.species_type == self.species_type and org.id != self.id 
-                        and self._distance_to(org) < self.vision_radius * 0.8]
+        nearby_allies = [org for org, _
+                         in self._neighbors_within(other_organisms, self.vision_radius * 0.8, self.species_type)
+                         if org.id != self.id]
         
         if nearby_allies:
             # move towards group center
@@ -804,14 +665,13 @@ class Organism:
     def _execute_seek_mate_behavior(self, other_organisms, obstacles):
         """phase 6: execute mate seeking behavior"""
         # find potential mates
-        potential_mates = [org for org in other_organisms 
-                         if org.species_type == self.species_type and org.id != self.id 
-                         and org.alive and org.can_reproduce()
-                         and self._distance_to(org) < self.vision_radius]
-        
+        potential_mates = [(org, distance) for org, distance
+                           in self._neighbors_within(other_organisms, self.vision_radius, self.species_type)
+                           if org.id != self.id and org.alive and org.can_reproduce()]
+
         if potential_mates:
             # move towards nearest potential mate
-            nearest_mate = min(potential_mates, key=lambda org: self._distance_to(org))
+            nearest_mate = min(potential_mates, key=lambda entry: entry[1])[0]
             self._move_towards(nearest_mate.x, nearest_mate.y, obstacles)
         else:
             # no mates nearby, return to normal behavior
@@ -840,9 +700,9 @@ class Organism:
     def _update_camouflage(self, other_organisms):
         """phase 6: update camouflage effectiveness"""
         # camouflage reduces detection by predators
-        nearby_predators = [org for org in other_organisms 
-                          if org.species_type == 'predator' and org.alive 
-                          and self._distance_to(org) < self.vision_radius]
+        nearby_predators = [org for org, _
+                            in self._neighbors_within(other_organisms, self.vision_radius, 'predator')
+                            if org.alive]
         
         if nearby_predators and self.camouflage > 0.5:
             # camouflage makes it harder for predators to detect this prey
@@ -868,15 +728,15 @@ class Organism:
         """phase 6: update warning signal behavior"""
         if self.warning_signals > 0.4 and self.warning_signal_cooldown <= 0:
             # check for nearby threats
-            nearby_threats = [org for org in other_organisms 
-                            if org.species_type == 'predator' and org.alive 
-                            and self._distance_to(org) < self.vision_radius * 0.8]
-            
+            nearby_threats = [org for org, _
+                              in self._neighbors_within(other_organisms, self.vision_radius * 0.8, 'predator')
+                              if org.alive]
+
             if nearby_threats:
                 # send warning signal to nearby prey
-                nearby_prey = [org for org in other_organisms 
-                             if org.species_type == 'prey' and org.id != self.id 
-                             and self._distance_to(org) < self.vision_radius * 1.2]
+                nearby_prey = [org for org, _
+                               in self._neighbors_within(other_organisms, self.vision_radius * 1.2, 'prey')
+                               if org.id != self.id]
                 
                 for prey in nearby_prey:
                     # trigger evade behavior in nearby prey
@@ -894,10 +754,10 @@ class Organism:
         """phase 6: update group cohesion behavior"""
         if self.group_cohesion > 0.5:
             # find nearby prey of same species
-            nearby_prey = [org for org in other_organisms 
-                          if org.species_type == 'prey' and org.id != self.id 
-                          and self._distance_to(org) < self.vision_radius * 0.8]
-            
+            nearby_prey = [org for org, _
+                           in self._neighbors_within(other_organisms, self.vision_radius * 0.8, 'prey')
+                           if org.id != self.id]
+
             self.group_members = nearby_prey
             
             # move towards group center if group exists
@@ -947,9 +807,10 @@ class Organism:
         """phase 6: update social behavior"""
         if self.social_behavior > 0.4:
             # find social connections
-            nearby_same_type = [org for org in other_organisms 
-                              if org.species_type == self.species_type and org.id != self.id 
-                              and self._distance_to(org) < self.vision_radius * 0.6]
+            nearby_same_type = [org for org, _
+                                in self._neighbors_within(other_organisms, self.vision_radius * 0.6,
+                                                          self.species_type)
+                                if org.id != self.id]
             
             self.social_connections = nearby_same_type
             
@@ -979,53 +840,34 @@ class Organism:
     
     def _find_nearest_larger_predator(self, other_organisms):
         """phase 6: find nearest larger predator (for predator-predator interactions)"""
-        nearest_larger = None
-        min_distance = float('inf')
-        
-        for org in other_organisms:
-            if (org.alive and org.species_type == 'predator' and org.id != self.id and
-                org.size > self.size * 1.2):  # 20% larger
-                distance = self._distance_to(org)
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_larger = org
+        nearest_larger = self._nearest_neighbor(
+            other_organisms, 'predator',
+            predicate=lambda org: (org.alive and org.id != self.id and
+                                   org.size > self.size * 1.2))  # 20% larger
         
         return nearest_larger
     
-    def _find_nearest_food(self, food_list):
+    def _find_nearest_food(self, food_index):
         """phase 6: find nearest available food"""
-        nearest_food = None
-        min_distance = float('inf')
-        
-        for food in food_list:
-            if food.available:
-                distance = self._distance_to(food)
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_food = food
+        nearest_food, _ = food_index.nearest(self.x, self.y)
         
         return nearest_food
     
     def _move_randomly_improved(self, obstacles):
         """phase 6: improved random movement with better exploration"""
         # improved random movement with better exploration
-        if random.random() < 0.05:  # 5% chance to change direction (reduced from 10%)
+        if self.rng.organisms.random() < 0.05:  # 5% chance to change direction (reduced from 10%)
             # more gradual direction changes
-            self.dx += random.uniform(-0.3, 0.3)
-            self.dy += random.uniform(-0.3, 0.3)
+            self.dx += self.rng.organisms.uniform(-0.3, 0.3)
+            self.dy += self.rng.organisms.uniform(-0.3, 0.3)
             self._normalize_direction()
         
         # avoid obstacles
         self._avoid_obstacles(obstacles)
         
-        # move organism using trait-based speed with stamina consideration
-        effective_speed = self.speed * min(1.0, self.energy / self.config.initial_energy)
-        self.x += self.dx * effective_speed
-        self.y += self.dy * effective_speed
-        
-        # wrap around world boundaries
-        self.x = self.x % self.config.world_width
-        self.y = self.y % self.config.world_height
+        # queue the heading; the movement phase applies speed and stamina
+        self.walk_x += self.dx
+        self.walk_y += self.dy
     
     def _check_speciation(self, other_organisms):
         """check if this organism should form a new species"""
@@ -1033,11 +875,10 @@ class Organism:
             return
         
         # find nearby organisms of the same type
-        nearby_organisms = []
-        for org in other_organisms:
-            if (org.alive and org.species_type == self.species_type and 
-                org.id != self.id and self._distance_to(org) < self.config.speciation_spatial_threshold):
-                nearby_organisms.append(org)
+        nearby_organisms = [org for org, _
+                            in self._neighbors_within(other_organisms, self.config.speciation_spatial_threshold,
+                                                      self.species_type)
+                            if org.alive and org.id != self.id]
         
         if not nearby_organisms:
             return
@@ -1060,7 +901,7 @@ class Organism:
     
     def _form_new_species(self):
         """form a new species for this organism"""
-        new_species_id = f"{self.species_type}_{self.id}_{self.age}"
+        new_species_id = f"{self.species_type}_{self.id}_{int(self.age)}"
         self.species_id = new_species_id
         
         # update generation based on speciation event
@@ -1074,28 +915,14 @@ class Organism:
         return self.dna.calculate_genetic_distance(other_organism.dna)
     
     def _find_nearest_prey(self, other_organisms):
-        nearest_prey = None
-        min_distance = float('inf')
-        
-        for org in other_organisms:
-            if org.alive and org.species_type == 'prey':
-                distance = self._distance_to(org)
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_prey = org
+        nearest_prey = self._nearest_neighbor(
+            other_organisms, 'prey', predicate=lambda org: org.alive)
         
         return nearest_prey
     
     def _find_nearest_predator(self, other_organisms):
-        nearest_predator = None
-        min_distance = float('inf')
-        
-        for org in other_organisms:
-            if org.alive and org.species_type == 'predator':
-                distance = self._distance_to(org)
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_predator = org
+        nearest_predator = self._nearest_neighbor(
+            other_organisms, 'predator', predicate=lambda org: org.alive)
         
         return nearest_predator
     
@@ -1113,13 +940,9 @@ class Organism:
             # avoid obstacles
             self._avoid_obstacles(obstacles)
             
-            # move
-            self.x += self.dx
-            self.y += self.dy
-            
-            # wrap around world boundaries
-            self.x = self.x % self.config.world_width
-            self.y = self.y % self.config.world_height
+            # queue the step; the movement phase moves and wraps
+            self.move_x += self.dx
+            self.move_y += self.dy
     
     def _flee_from(self, predator, obstacles):
         # calculate direction away from predator
@@ -1136,46 +959,35 @@ class Organism:
             # avoid obstacles
             self._avoid_obstacles(obstacles)
             
-            # move
-            self.x += self.dx
-            self.y += self.dy
-            
-            # wrap around world boundaries
-            self.x = self.x % self.config.world_width
-            self.y = self.y % self.config.world_height
+            # queue the step; the movement phase moves and wraps
+            self.move_x += self.dx
+            self.move_y += self.dy
     
     def _move_randomly(self, obstacles):
         # random walk with slight direction changes
-        if random.random() < 0.1:  # 10% chance to change direction
-            self.dx += random.uniform(-0.5, 0.5)
-            self.dy += random.uniform(-0.5, 0.5)
+        if self.rng.organisms.random() < 0.1:  # 10% chance to change direction
+            self.dx += self.rng.organisms.uniform(-0.5, 0.5)
+            self.dy += self.rng.organisms.uniform(-0.5, 0.5)
             self._normalize_direction()
         
         # avoid obstacles
         self._avoid_obstacles(obstacles)
         
-        # move organism using trait-based speed
-        self.x += self.dx * self.speed
-        self.y += self.dy * self.speed
-        
-        # wrap around world boundaries
-        self.x = self.x % self.config.world_width
-        self.y = self.y % self.config.world_height
+        # queue the step at trait-based speed; the movement phase moves and wraps
+        self.move_x += self.dx * self.speed
+        self.move_y += self.dy * self.speed
     
     def _avoid_obstacles(self, obstacles):
-        # simple obstacle avoidance
-        for obstacle in obstacles:
-            distance = self._distance_to(obstacle)
-            if distance < obstacle.size + self.size:
-                # calculate avoidance direction
-                dx = self.x - obstacle.x
-                dy = self.y - obstacle.y
-                if dx != 0 or dy != 0:
-                    # normalize and apply avoidance
-                    length = math.sqrt(dx*dx + dy*dy)
-                    self.dx += (dx / length) * 2.0
-                    self.dy += (dy / length) * 2.0
-                    self._normalize_direction()
+        # obstacle avoidance via a lookup in the precomputed obstacle field
+        if not obstacles:
+            return
+        
+        clearance, away_x, away_y = obstacles.sample(self.x, self.y)
+        if clearance < self.size and (away_x != 0 or away_y != 0):
+            # steer away from the nearest obstacle surface
+            self.dx += away_x * 2.0
+            self.dy += away_y * 2.0
+            self._normalize_direction()
     
     def _attack_prey(self, prey):
         """phase 6: predator attacks prey with protective feature handling"""
@@ -1189,14 +1001,14 @@ class Organism:
         # check armor protection
         if hasattr(prey, 'armor_protection') and prey.armor_protection > 0:
             armor_reduction = prey.armor_protection
-            if random.random() < armor_reduction:
+            if self.rng.organisms.random() < armor_reduction:
                 # armor blocks the attack
                 attack_success = False
         
         # check camouflage effectiveness
         if hasattr(prey, 'camouflage') and prey.camouflage > 0.7:
             camouflage_chance = prey.camouflage * 0.3
-            if random.random() < camouflage_chance:
+            if self.rng.organisms.random() < camouflage_chance:
                 # camouflage prevents detection/attack
                 attack_success = False
         
@@ -1219,49 +1031,10 @@ class Organism:
             self.energy -= 5
             self.last_attack_time = self.age
     
-    def _consume_energy(self):
-        # improved energy consumption based on metabolism trait and activity
-        base_consumption = self.metabolism_rate
-        
-        # reduce consumption when energy is low (survival mode)
-        if self.energy < self.config.initial_energy * 0.3:
-            base_consumption *= 0.5
-        
-        # increase consumption when moving fast
-        current_speed = math.sqrt(self.dx**2 + self.dy**2)
-        if current_speed > self.speed * 0.8:
-            base_consumption *= 1.2
-        
-        # phase 5: temperature effects on metabolism
-        if hasattr(self, 'current_temperature'):
-            temp_effect = self.config.temperature_effect_on_metabolism
-            if self.current_temperature < 20:  # cold
-                # cold increases metabolism (need more energy to stay warm)
-                cold_factor = (20 - self.current_temperature) * temp_effect * (1.0 - self.cold_resistance)
-                base_consumption *= (1.0 + cold_factor)
-            elif self.current_temperature > 20:  # hot
-                # heat can also increase metabolism (cooling down)
-                heat_factor = (self.current_temperature - 20) * temp_effect * (1.0 - self.heat_resistance)
-                base_consumption *= (1.0 + heat_factor)
-        
-        # phase 5: temperature stress increases energy consumption
-        if hasattr(self, 'temperature_stress'):
-            base_consumption *= (1.0 + self.temperature_stress)
-        
-        self.energy -= base_consumption
-    
-    def _eat_food(self, food_list):
+    def _eat_food(self, food_index):
         # improved food detection and consumption
-        nearest_food = None
-        min_distance = float('inf')
-        
         # find nearest available food within vision range
-        for food in food_list:
-            if food.available:
-                distance = self._distance_to(food)
-                if distance < self.vision_radius and distance < min_distance:
-                    min_distance = distance
-                    nearest_food = food
+        nearest_food, min_distance = food_index.nearest(self.x, self.y, self.vision_radius)
         
         # if food is found, move towards it and eat if close enough
         if nearest_food:
@@ -1281,12 +1054,6 @@ class Organism:
         dy = self.y - other.y
         return math.sqrt(dx*dx + dy*dy)
     
-    def _check_death(self):
-        # death by energy or age
-        if self.energy <= 0 or self.age >= self.max_age:
-            self.alive = False
-            self._calculate_fitness()
-    
     def _calculate_fitness(self):
         # calculate fitness based on survival time and reproduction
         survival_fitness = self.survival_time * self.config.fitness_survival_weight
@@ -1301,15 +1068,16 @@ class Organism:
             return None
         
         # create child with slight position offset
-        child_x = self.x + random.uniform(-20, 20)
-        child_y = self.y + random.uniform(-20, 20)
+        child_x = self.x + self.rng.reproduction.uniform(-20, 20)
+        child_y = self.y + self.rng.reproduction.uniform(-20, 20)
         
         # wrap around boundaries
         child_x = child_x % self.config.world_width
         child_y = child_y % self.config.world_height
         
         # pass dna to child (will be mutated in dna constructor)
-        child = Organism(child_x, child_y, self.config, self.dna, self.species_type, self.id)
+        child = Organism(child_x, child_y, self.config, self.dna, self.species_type, self.id,
+                         store=self._store, rng=self.rng)
         
         # parent loses energy for reproduction
         self.energy -= self.reproduction_threshold * 0.5
@@ -1336,53 +1104,6 @@ class Organism:
             else:
                 return self.config.prey_color
     
-    def _update_weather_effects(self, weather_system):
-        """update organism based on weather conditions"""
-        # get current temperature at organism's position
-        self.current_temperature = weather_system.get_temperature_at_position(self.x, self.y)
-        
-        # calculate temperature stress
-        self._calculate_temperature_stress()
-        
-        # update weather adaptation score
-        self._update_weather_adaptation_score(weather_system)
-    
-    def _calculate_temperature_stress(self):
-        """calculate temperature stress based on organism's resistance traits"""
-        optimal_temp = 20  # moderate temperature is optimal
-        
-        if self.current_temperature < optimal_temp:
-            # cold stress
-            cold_difference = optimal_temp - self.current_temperature
-            stress_factor = cold_difference * (1.0 - self.cold_resistance)
-            self.temperature_stress = max(0, stress_factor * 0.1)
-        elif self.current_temperature > optimal_temp:
-            # heat stress
-            heat_difference = self.current_temperature - optimal_temp
-            stress_factor = heat_difference * (1.0 - self.heat_resistance)
-            self.temperature_stress = max(0, stress_factor * 0.1)
-        else:
-            # optimal temperature - reduce stress
-            self.temperature_stress = max(0, self.temperature_stress - 0.05)
-    
-    def _update_weather_adaptation_score(self, weather_system):
-        """update how well adapted the organism is to current weather"""
-        # base adaptation score
-        adaptation = 1.0
-        
-        # temperature adaptation
-        if self.current_temperature < 20:
-            adaptation *= self.cold_resistance
-        elif self.current_temperature > 20:
-            adaptation *= self.heat_resistance
-        
-        # light adaptation (night vision)
-        light_level = weather_system.get_light_level()
-        if light_level < 0.5:  # low light conditions
-            adaptation *= self.night_vision
-        
-        self.weather_adaptation_score = adaptation 
-
     def _update_physics(self):
         """update realistic physics simulation"""
         if not self.config.collision_detection_enabled:
@@ -1404,13 +1125,9 @@ class Organism:
         if not self.config.learning_enabled:
             return
         
-        # decay old memories
-        if len(self.experience_memory) > int(self.memory_capacity * 5):
-            self.experience_memory.pop(0)
-        
         # update learned strategies
         for strategy_key in list(self.learned_strategies.keys()):
-            if random.random() < self.config.memory_decay_rate:
+            if self.rng.organisms.random() < self.config.memory_decay_rate:
                 del self.learned_strategies[strategy_key]
     
     def _update_territorial_behavior(self, other_organisms):
@@ -1423,30 +1140,24 @@ class Organism:
             self.territory_center = (self.x, self.y)
             self.territory_radius = self.vision_radius * 0.5
         
-        # defend territory from intruders
-        for org in other_organisms:
+        # defend territory from intruders of the same species
+        intruders = self._neighbors_within(other_organisms, self.territory_radius, self.species_type)
+        for org, _ in intruders:
             if org.alive and org.id != self.id:
-                distance = self._distance_to(org)
-                if distance < self.territory_radius:
-                    # territorial conflict
-                    if org.species_type == self.species_type:
-                        # same species - compete for territory
-                        if self.aggression > org.aggression:
-                            # drive away intruder
-                            self._move_towards(org.x, org.y, [])
-                        else:
-                            # retreat
-                            self._flee_from(org, [])
+                # same species - compete for territory
+                if self.aggression > org.aggression:
+                    # drive away intruder
+                    self._move_towards(org.x, org.y, [])
+                else:
+                    # retreat
+                    self._flee_from(org, [])
     
     def _update_evolutionary_pressure(self, other_organisms):
         """update evolutionary pressure based on environment"""
         # calculate pressure based on competition
-        nearby_competitors = 0
-        for org in other_organisms:
-            if org.alive and org.species_type == self.species_type:
-                distance = self._distance_to(org)
-                if distance < self.vision_radius:
-                    nearby_competitors += 1
+        nearby_competitors = sum(
+            1 for org, _ in self._neighbors_within(other_organisms, self.vision_radius, self.species_type)
+            if org.alive)
         
         # pressure increases with competition
         self.evolutionary_pressure = min(1.0, nearby_competitors * 0.1)
@@ -1476,11 +1187,12 @@ class Organism:
         if not self.config.learning_enabled:
             return
         
-        # decay old memories
-        if len(self.experience_memory) > int(self.memory_capacity * 5):
-            self.experience_memory.pop(0)
-        
         # update learned strategies
         for strategy_key in list(self.learned_strategies.keys()):
-            if random.random() < self.config.memory_decay_rate:
-                del self.learned_strategies[strategy_key] 
\ No newline at end of file
+            if self.rng.organisms.random() < self.config.memory_decay_rate:
+                del self.learned_strategies[strategy_key]
+
+# numeric organism state is stored column-wise in the population store
+for _column in PopulationStore.COLUMNS:
+    setattr(Organism, _column, column_property(_column))
+Organism.alive = alive_property()
@@ -0,0 +1,165 @@
+import numpy as np
+from genome import TRAIT_COUNT, PHENOTYPE_ATTRIBUTES
+from aggregates import AggregateRegistry
+
+
+class PopulationStore:
+    """structure-of-arrays storage for per-organism numeric state
+
+    every numeric attribute lives in a contiguous float column and each
+    organism is a lightweight view holding its row index. dead rows are
+    dropped by swapping the last row into their slot, so removal never
+    rebuilds the whole population.
+
+    the store also hands out organism ids, counting up from 1 so they never
+    repeat within a simulation, and indexes its living organisms by id.
+    """
+
+    # float columns exposed as organism attributes; move_* and walk_* hold
+    # the movement queued during a tick (see movement.integrate_positions),
+    # the weather columns are set by metabolism.apply_metabolism
+    STATE_COLUMNS = ('x', 'y', 'dx', 'dy', 'energy', 'age', 'survival_time',
+                     'move_x', 'move_y', 'walk_x', 'walk_y',
+                     'current_temperature', 'temperature_stress', 'weather_adaptation_score')
+    # phenotype columns follow the genome trait order
+    COLUMNS = STATE_COLUMNS + PHENOTYPE_ATTRIBUTES
+    PHENOTYPE_SLICE = slice(len(STATE_COLUMNS), len(COLUMNS))
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.organisms = []  # organisms[row] is the view for that row
+        self.groups = []  # groups[row] is the aggregate group, set with the genome
+        self.aggregates = AggregateRegistry(PHENOTYPE_ATTRIBUTES)
+        self.by_id = {}  # id -> organism, for every organism added and not yet removed
+        self.next_id = 1
+        self._allocate(max(1, capacity))
+
+    def __len__(self):
+        return self.count
+
+    def _allocate(self, capacity):
+        # column-major so every column is contiguous
+        data = np.zeros((capacity, len(self.COLUMNS)), order='F')
+        genomes = np.zeros((capacity, TRAIT_COUNT))
+        alive = np.zeros(capacity, dtype=bool)
+        if self.count:
+            data[:self.count] = self.data[:self.count]
+            genomes[:self.count] = self.genomes[:self.count]
+            alive[:self.count] = self.alive[:self.count]
+        self.capacity = capacity
+        self.data = data
+        self.genomes = genomes
+        self.alive = alive
+        self.columns = {name: data[:, i] for i, name in enumerate(self.COLUMNS)}
+
+    def add(self, organism):
+        """append a row for a new organism and return its row index"""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        row = self.count
+        self.data[row] = 0.0
+        self.genomes[row] = 0.0
+        self.alive[row] = True
+        self.organisms.append(organism)
+        self.groups.append(None)
+        self.count += 1
+        return row
+
+    def register(self, organism):
+        """allocate the next organism id and index organism under it"""
+        organism_id = self.next_id
+        self.next_id += 1
+        self.by_id[organism_id] = organism
+        return organism_id
+
+    def get(self, organism_id):
+        """the organism with this id, or None once it has been removed"""
+        return self.by_id.get(organism_id)
+
+    def set_genome(self, row, genome, scales, group):
+        """store a row's genome, derive its phenotype columns and count it in group"""
+        if self.groups[row] is not None:
+            self.aggregates.remove(self.groups[row], self.data[row, self.PHENOTYPE_SLICE])
+        self.genomes[row] = genome
+        self.data[row, self.PHENOTYPE_SLICE] = genome * scales
+        self.groups[row] = group
+        self.aggregates.add(group, self.data[row, self.PHENOTYPE_SLICE])
+
+    def column(self, name):
+        """view of a column over the occupied rows"""
+        if name == 'alive':
+            return self.alive[:self.count]
+        return self.columns[name][:self.count]
+
+    def remove_dead(self):
+        """swap-remove every dead row and return the number removed"""
+        dead_rows = np.flatnonzero(~self.alive[:self.count])
+
+        # highest rows first, so the last row is always alive when it is moved
+        for row in dead_rows[::-1]:
+            row = int(row)
+            self._release(row)
+            self.by_id.pop(self.organisms[row].id, None)
+            self._detach(self.organisms[row])
+            last = self.count - 1
+            if row != last:
+                self.data[row] = self.data[last]
+                self.genomes[row] = self.genomes[last]
+                self.alive[row] = self.alive[last]
+                self.groups[row] = self.groups[last]
+                moved = self.organisms[last]
+                moved._row = row
+                self.organisms[row] = moved
+            self.organisms.pop()
+            self.groups.pop()
+            self.count -= 1
+
+        return len(dead_rows)
+
+    def _release(self, row):
+        """drop a row's contribution to the running aggregates"""
+        if self.groups[row] is not None:
+            self.aggregates.remove(self.groups[row], self.data[row, self.PHENOTYPE_SLICE])
+        state = getattr(self.organisms[row], 'current_state', None)
+        self.aggregates.change_state(state, None)
+
+    def _detach(self, organism):
+        """move a removed organism into a private one-row store
+
+        other organisms may still hold references to it (hunting targets,
+        group members), so its values must survive the row being reused.
+        """
+        private = PopulationStore(capacity=1)
+        private.data[0] = self.data[organism._row]
+        private.genomes[0] = self.genomes[organism._row]
+        private.alive[0] = self.alive[organism._row]
+        private.organisms.append(organism)
+        private.groups.append(self.groups[organism._row])
+        private.count = 1
+        if private.groups[0] is not None:
+            private.aggregates.add(private.groups[0], private.data[0, self.PHENOTYPE_SLICE])
+        private.aggregates.change_state(None, getattr(organism, 'current_state', None))
+        organism._store = private
+        organism._row = 0
+
+
+def column_property(name):
+    """organism attribute backed by a population store column"""
+    def getter(self):
+        return self._store.columns[name][self._row]
+
+    def setter(self, value):
+        self._store.columns[name][self._row] = value
+
+    return property(getter, setter)
+
+
+def alive_property():
+    """organism alive flag backed by the population store"""
+    def getter(self):
+        return bool(self._store.alive[self._row])
+
+    def setter(self, value):
+        self._store.alive[self._row] = value
+
+    return property(getter, setter)
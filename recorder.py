@@ -0,0 +1,307 @@
+import os
+import numpy as np
+from trait_exporter import BEHAVIOR_STATES
+
+SPECIES_TYPES = ('prey', 'predator')
+SEASONS = ('spring', 'summer', 'autumn', 'winter')
+NO_STATE = 255
+
+# one fixed-width record per organism per recorded tick
+RECORD_DTYPE = np.dtype([
+    ('id', '<i8'),
+    ('x', '<f4'), ('y', '<f4'), ('energy', '<f4'),
+    ('size', '<f4'), ('vision_radius', '<f4'),
+    ('adaptation_score', '<f4'), ('energy_efficiency', '<f4'),
+    ('intelligence', '<f4'), ('efficiency', '<f4'),
+    ('camouflage', '<f4'), ('toxicity', '<f4'), ('armor', '<f4'),
+    ('color', 'u1', (3,)),
+    ('species', 'u1'),
+    ('state', 'u1'),
+])
+
+# record fields copied straight from population store columns
+STORE_FIELDS = ('x', 'y', 'energy', 'size', 'vision_radius', 'intelligence', 'efficiency',
+                'camouflage', 'toxicity', 'armor')
+
+# available food and (static) obstacles
+FOOD_DTYPE = np.dtype([('x', '<f4'), ('y', '<f4')])
+OBSTACLE_DTYPE = np.dtype([('x', '<f4'), ('y', '<f4'), ('size', '<f4')])
+
+# simulation stats shown in the hud, recorded with every tick
+HUD_COUNTS = ('alive_organisms', 'predators', 'prey', 'available_food', 'generation', 'total_births',
+              'total_deaths', 'predator_kills', 'species_count', 'speciation_events', 'lineage_depth')
+HUD_VALUES = ('average_fitness', 'food_density', 'average_genetic_distance', 'average_intelligence',
+              'average_social_behavior', 'average_exploration_rate', 'average_memory_capacity',
+              'average_adaptation_score', 'average_energy_efficiency', 'evolutionary_pressure',
+              'population_diversity', 'environmental_stress', 'resource_competition_level')
+
+# one index entry per recorded tick: its organisms are records[start:start + count]
+# and its available food food[food_start:food_start + food_count]
+INDEX_DTYPE = np.dtype([
+    ('time_step', '<i8'),
+    ('start', '<i8'), ('count', '<i8'),
+    ('food_start', '<i8'), ('food_count', '<i8'),
+    ('is_night', 'u1'), ('season', 'u1'),
+    ('temperature_modifier', '<i4'), ('food_multiplier', '<f4'),
+    ('speed_mean', '<f4'), ('vision_mean', '<f4'),
+] + [(name, '<i8') for name in HUD_COUNTS] + [(name, '<f8') for name in HUD_VALUES])
+
+SPECIES_CODES = {species: i for i, species in enumerate(SPECIES_TYPES)}
+STATE_CODES = {state: i for i, state in enumerate(BEHAVIOR_STATES)}
+SEASON_CODES = {season: i for i, season in enumerate(SEASONS)}
+
+
+def index_path(path):
+    return path + '.index'
+
+
+def food_path(path):
+    return path + '.food'
+
+
+def obstacles_path(path):
+    return path + '.obstacles'
+
+
+def _read_index(path):
+    """index entries written so far; a partly written trailing entry is ignored"""
+    if not os.path.exists(path):
+        return np.zeros(0, dtype=INDEX_DTYPE)
+    with open(path, 'rb') as file:
+        data = file.read()
+    usable = len(data) - len(data) % INDEX_DTYPE.itemsize
+    return np.frombuffer(data[:usable], dtype=INDEX_DTYPE)
+
+
+def _map(path, dtype, length, current):
+    """read-only mapping of the first length items of a file, reusing current if it fits"""
+    if length == len(current):
+        return current
+    if not length:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=(length,))
+
+
+def _used(index, start, count):
+    """items referenced by an index, i.e. the end of its last entry"""
+    return int(index[start][-1] + index[count][-1]) if len(index) else 0
+
+
+class _MappedColumn:
+    """fixed-width records in a file, mapped read-write and grown by doubling"""
+
+    def __init__(self, path, dtype, used, capacity):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.used = used
+        self.array = None
+        self.capacity = 0
+        self._map(max(1, int(capacity), used))
+
+    def _map(self, capacity):
+        self.array = None
+        with open(self.path, 'r+b') as file:
+            file.truncate(capacity * self.dtype.itemsize)
+        self.array = np.memmap(self.path, dtype=self.dtype, mode='r+', shape=(capacity,))
+        self.capacity = capacity
+
+    def reserve(self, count):
+        """the next count slots, to be filled in place"""
+        end = self.used + count
+        if end > self.capacity:
+            self._map(max(end, self.capacity * 2))
+        block = self.array[self.used:end]
+        self.used = end
+        return block
+
+    def flush(self):
+        self.array.flush()
+
+    def close(self):
+        """unmap and trim the file to its used length"""
+        self.array.flush()
+        self.array = None
+        with open(self.path, 'r+b') as file:
+            file.truncate(self.used * self.dtype.itemsize)
+
+
+class TrajectoryRecorder:
+    """appends per-tick organism records to a memory-mapped file
+
+    the records file is grown in doubling steps and mapped read-write, so
+    a tick is written straight into the mapping with one column copy per
+    field. available food goes to a second mapped file the same way. the
+    index entry for a tick (offsets, weather and hud stats) is appended to
+    the index file only after its records are in place, so readers never
+    see a tick that is not fully written. close() trims the files to their
+    used length.
+    """
+
+    def __init__(self, path, obstacles=(), capacity=4096, append=False, keep_ticks=None):
+        self.path = path
+        self.index_path = index_path(path)
+
+        index = np.zeros(0, dtype=INDEX_DTYPE)
+        if append and os.path.exists(path):
+            index = _read_index(self.index_path)
+            if keep_ticks is not None:
+                # drop ticks recorded after the point being resumed from
+                index = index[:keep_ticks]
+        else:
+            open(path, 'wb').close()
+            open(food_path(path), 'wb').close()
+            obstacle_records = np.array([(obstacle.x, obstacle.y, obstacle.size) for obstacle in obstacles],
+                                        dtype=OBSTACLE_DTYPE)
+            with open(obstacles_path(path), 'wb') as file:
+                file.write(obstacle_records.tobytes())
+        self.ticks_written = len(index)
+
+        with open(self.index_path, 'wb') as file:
+            file.write(index.tobytes())
+        self.index_file = open(self.index_path, 'ab')
+
+        self.records = _MappedColumn(path, RECORD_DTYPE, _used(index, 'start', 'count'), capacity)
+        self.food = _MappedColumn(food_path(path), FOOD_DTYPE, _used(index, 'food_start', 'food_count'),
+                                  capacity)
+
+    def record(self, time_step, population, food, weather, stats, trait_means=None):
+        """append one tick: organisms, available food, weather phase and hud stats"""
+        count = len(population)
+        start = self.records.used
+        block = self.records.reserve(count)
+        for name in STORE_FIELDS:
+            block[name] = population.column(name)
+        organisms = population.organisms[:count]
+        block['id'] = [organism.id for organism in organisms]
+        block['adaptation_score'] = [organism.adaptation_score for organism in organisms]
+        block['energy_efficiency'] = [organism.energy_efficiency for organism in organisms]
+        block['color'] = [organism.get_color() for organism in organisms]
+        block['species'] = [SPECIES_CODES[organism.species_type] for organism in organisms]
+        block['state'] = [STATE_CODES.get(organism.current_state, NO_STATE) for organism in organisms]
+
+        food = list(food)
+        food_start = self.food.used
+        food_block = self.food.reserve(len(food))
+        food_block['x'] = [item.x for item in food]
+        food_block['y'] = [item.y for item in food]
+
+        entry = np.zeros(1, dtype=INDEX_DTYPE)
+        entry['time_step'] = time_step
+        entry['start'] = start
+        entry['count'] = count
+        entry['food_start'] = food_start
+        entry['food_count'] = len(food)
+        entry['is_night'] = weather.is_night
+        entry['season'] = SEASON_CODES[weather.current_season]
+        entry['temperature_modifier'] = weather.current_temperature_modifier
+        entry['food_multiplier'] = weather.current_food_multiplier
+        entry['speed_mean'], entry['vision_mean'] = trait_means if trait_means is not None else (np.nan, np.nan)
+        for name in HUD_COUNTS + HUD_VALUES:
+            entry[name] = stats[name]
+
+        self.index_file.write(entry.tobytes())
+        self.index_file.flush()
+        self.ticks_written += 1
+
+    def flush(self):
+        """force recorded ticks onto disk"""
+        self.records.flush()
+        self.food.flush()
+        self.index_file.flush()
+        os.fsync(self.index_file.fileno())
+
+    def close(self):
+        if self.index_file.closed:
+            return
+        self.flush()
+        self.index_file.close()
+        self.records.close()
+        self.food.close()
+
+
+class TrajectoryReader:
+    """zero-copy numpy views of a recorded trajectory
+
+    the records and food files are memory-mapped read-only; every query
+    returns a slice of the mapping rather than a copy. call refresh() to
+    pick up ticks appended since the reader was opened, e.g. while a run
+    is still recording.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = index_path(path)
+        self.index = np.zeros(0, dtype=INDEX_DTYPE)
+        self.records = np.zeros(0, dtype=RECORD_DTYPE)
+        self.food = np.zeros(0, dtype=FOOD_DTYPE)
+        self.obstacles = np.fromfile(obstacles_path(path), dtype=OBSTACLE_DTYPE)
+        self.refresh()
+
+    def refresh(self):
+        """remap the index and data files to the ticks written so far"""
+        size = os.path.getsize(self.index_path) if os.path.exists(self.index_path) else 0
+        self.index = _map(self.index_path, INDEX_DTYPE, size // INDEX_DTYPE.itemsize, self.index)
+        self.records = _map(self.path, RECORD_DTYPE, _used(self.index, 'start', 'count'), self.records)
+        self.food = _map(food_path(self.path), FOOD_DTYPE, _used(self.index, 'food_start', 'food_count'),
+                         self.food)
+        return len(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def time_steps(self):
+        """time step of every recorded tick, in recording order"""
+        return self.index['time_step']
+
+    def frame(self, position):
+        """organism records of the position-th recorded tick"""
+        entry = self.index[position]
+        return self.records[entry['start']:entry['start'] + entry['count']]
+
+    def frame_food(self, position):
+        """available food of the position-th recorded tick"""
+        entry = self.index[position]
+        return self.food[entry['food_start']:entry['food_start'] + entry['food_count']]
+
+    def frame_stats(self, position):
+        """hud statistics of the position-th recorded tick, as a stats dict"""
+        entry = self.index[position]
+        return {name: entry[name].item() for name in HUD_COUNTS + HUD_VALUES}
+
+    def position(self, time_step):
+        """position of the last recorded tick at or before time_step, found by bisection"""
+        return max(0, int(np.searchsorted(self.time_steps, time_step, side='right')) - 1)
+
+    def at(self, time_step):
+        """records of the tick recorded at time_step, empty if it was not recorded"""
+        position = self.position(time_step)
+        if not len(self.index) or self.time_steps[position] != time_step:
+            return self.records[:0]
+        return self.frame(position)
+
+    def range(self, start_time, end_time):
+        """records and index entries of every tick in [start_time, end_time)
+
+        ticks are stored back to back, so the records form one contiguous
+        view; entries['start'] - entries['start'][0] locates each tick in it.
+        """
+        first = int(np.searchsorted(self.time_steps, start_time, side='left'))
+        last = int(np.searchsorted(self.time_steps, end_time, side='left'))
+        entries = self.index[first:max(first, last)]
+        if not len(entries):
+            return self.records[:0], entries
+        start = int(entries['start'][0])
+        end = int(entries['start'][-1] + entries['count'][-1])
+        return self.records[start:end], entries
+
+    def organism(self, organism_id, start_time=None, end_time=None):
+        """time steps and records of one organism over [start_time, end_time)"""
+        if start_time is None:
+            start_time = self.time_steps[0] if len(self.index) else 0
+        if end_time is None:
+            end_time = self.time_steps[-1] + 1 if len(self.index) else 0
+        records, entries = self.range(start_time, end_time)
+        mask = records['id'] == organism_id
+        ticks = np.repeat(entries['time_step'], entries['count'])
+        return ticks[mask], records[mask]
@@ -0,0 +1,442 @@
+import pygame
+
+
+def create_window_renderer(config, caption=None):
+    """open the pygame display window and return a renderer drawing into it"""
+    screen = pygame.display.set_mode((config.width, config.height))
+    pygame.display.set_caption(caption or config.title)
+    return Renderer(config, screen)
+
+
+class Renderer:
+    """draws simulation frames onto a pygame screen
+
+    everything drawn is passed in, so the same paths render a live
+    simulation and a recorded one. organisms only need the attributes read
+    here (position, size, energy, state, species, a few traits and
+    get_color()); food needs x and y, obstacles x, y and size, and the
+    weather its day/night and season fields.
+    """
+
+    def __init__(self, config, screen):
+        self.config = config
+        self.screen = screen
+        self.fonts = {}
+
+    def _font(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, organisms, food, obstacles, weather, stats, time_step, paused=False,
+               trait_means=None, camera=(0, 0), extra_lines=()):
+        """draw one full frame and flip the display
+
+        food is the available food, trait_means the latest (speed, vision)
+        trait means shown in the hud, or None. extra_lines are appended to
+        the hud text.
+        """
+        # clear screen
+        self.screen.fill(self.config.background_color)
+
+        # render environment
+        self.render_environment(food, obstacles, camera)
+
+        # phase 5: render weather effects
+        self.render_weather_effects(weather)
+
+        # render organisms with species-based colors
+        for organism in organisms:
+            if organism.alive:
+                self.render_organism(organism, camera)
+
+        # render statistics
+        self.render_stats(stats, time_step, paused, trait_means, extra_lines)
+
+        # phase 5: render weather ui
+        self.render_weather_ui(weather)
+
+        # new: render enhanced evolution indicators
+        if self.config.show_evolutionary_pressure:
+            self.render_evolutionary_indicators(stats)
+
+        # update display
+        pygame.display.flip()
+
+    def render_environment(self, food, obstacles, camera=(0, 0)):
+        # render obstacles
+        for obstacle in obstacles:
+            screen_x = int(obstacle.x - camera[0])
+            screen_y = int(obstacle.y - camera[1])
+
+            # only render if on screen
+            if (0 <= screen_x <= self.config.width and
+                0 <= screen_y <= self.config.height):
+                pygame.draw.circle(
+                    self.screen,
+                    self.config.obstacle_color,
+                    (screen_x, screen_y),
+                    int(obstacle.size)
+                )
+
+        # render available food
+        for item in food:
+            screen_x = int(item.x - camera[0])
+            screen_y = int(item.y - camera[1])
+
+            # only render if on screen
+            if (0 <= screen_x <= self.config.width and
+                0 <= screen_y <= self.config.height):
+                pygame.draw.circle(
+                    self.screen,
+                    self.config.food_color,
+                    (screen_x, screen_y),
+                    self.config.food_size
+                )
+
+    def render_organism(self, organism, camera=(0, 0)):
+        screen_x = int(organism.x - camera[0])
+        screen_y = int(organism.y - camera[1])
+
+        # only render if on screen
+        if not (0 <= screen_x <= self.config.width and
+                0 <= screen_y <= self.config.height):
+            return
+
+        # use species-based color for phase 4
+        color = organism.get_color()
+
+        # phase 6: modify color based on behavioral state and protective features
+        if self.config.behavioral_evolution_enabled:
+            color = self._get_behavioral_color(organism, color)
+
+        # new: modify color based on enhanced traits
+        if self.config.show_trait_indicators:
+            color = self._get_enhanced_trait_color(organism, color)
+
+        size = int(organism.size)
+
+        pygame.draw.circle(
+            self.screen,
+            color,
+            (screen_x, screen_y),
+            size
+        )
+
+        # new: render energy bars
+        if self.config.show_energy_bars:
+            self._render_energy_bar(screen_x, screen_y, organism)
+
+        # phase 6: draw behavioral state indicators
+        if self.config.show_behavior_states and hasattr(organism, 'current_state'):
+            self._draw_behavioral_indicator(screen_x, screen_y, organism)
+
+        # new: draw trait indicators
+        if self.config.show_trait_indicators:
+            self._draw_trait_indicators(screen_x, screen_y, organism)
+
+        # draw vision radius for debugging (optional)
+        if self.config.show_vision_radius:
+            pygame.draw.circle(
+                self.screen,
+                (100, 100, 100),
+                (screen_x, screen_y),
+                int(organism.vision_radius),
+                1
+            )
+
+    def _get_enhanced_trait_color(self, organism, base_color):
+        """new: modify organism color based on enhanced traits"""
+        color = list(base_color)
+
+        # modify based on adaptation score
+        if hasattr(organism, 'adaptation_score'):
+            adaptation = organism.adaptation_score
+            if adaptation > 1.2:
+                # well adapted - add green tint
+                color[1] = min(255, color[1] + 30)
+            elif adaptation < 0.8:
+                # poorly adapted - add red tint
+                color[0] = min(255, color[0] + 30)
+
+        # modify based on energy efficiency
+        if hasattr(organism, 'energy_efficiency'):
+            efficiency = organism.energy_efficiency
+            if efficiency > 0.8:
+                # efficient - add blue tint
+                color[2] = min(255, color[2] + 20)
+            elif efficiency < 0.4:
+                # inefficient - add yellow tint
+                color[0] = min(255, color[0] + 20)
+                color[1] = min(255, color[1] + 20)
+
+        return tuple(color)
+
+    def _render_energy_bar(self, x, y, organism):
+        """new: render energy bar above organism"""
+        if not self.config.show_energy_bars:
+            return
+
+        bar_width = 20
+        bar_height = 3
+        energy_ratio = organism.energy / self.config.initial_energy
+
+        # energy bar background
+        pygame.draw.rect(
+            self.screen,
+            (50, 50, 50),
+            (x - bar_width//2, y - organism.size - 10, bar_width, bar_height)
+        )
+
+        # energy bar fill
+        fill_width = int(bar_width * energy_ratio)
+        if fill_width > 0:
+            energy_color = (0, 255, 0) if energy_ratio > 0.5 else (255, 255, 0) if energy_ratio > 0.2 else (255, 0, 0)
+            pygame.draw.rect(
+                self.screen,
+                energy_color,
+                (x - bar_width//2, y - organism.size - 10, fill_width, bar_height)
+            )
+
+    def _draw_trait_indicators(self, x, y, organism):
+        """new: draw trait-based visual indicators"""
+        if not self.config.show_trait_indicators:
+            return
+
+        # draw small indicators for key traits
+        indicator_size = 2
+        y_offset = -organism.size - 15
+
+        # intelligence indicator
+        if hasattr(organism, 'intelligence') and organism.intelligence > 0.7:
+            pygame.draw.circle(self.screen, (255, 255, 0), (x - 8, y + y_offset), indicator_size)
+
+        # efficiency indicator
+        if hasattr(organism, 'efficiency') and organism.efficiency > 0.8:
+            pygame.draw.circle(self.screen, (0, 255, 255), (x, y + y_offset), indicator_size)
+
+        # adaptation indicator
+        if hasattr(organism, 'adaptation_score') and organism.adaptation_score > 1.1:
+            pygame.draw.circle(self.screen, (0, 255, 0), (x + 8, y + y_offset), indicator_size)
+
+    def render_evolutionary_indicators(self, stats):
+        """new: render evolutionary pressure indicators"""
+        if not self.config.show_evolutionary_pressure:
+            return
+
+        # render pressure level indicator
+        pressure = stats['evolutionary_pressure']
+        if pressure > 0.5:
+            # high pressure - render warning indicator
+            font = self._font(20)
+            warning_text = f"High Evolutionary Pressure: {pressure:.2f}"
+            warning_surface = font.render(warning_text, True, (255, 100, 100))
+            self.screen.blit(warning_surface, (10, self.config.height - 60))
+
+    def _get_behavioral_color(self, organism, base_color):
+        """phase 6: modify organism color based on behavioral state and traits"""
+        color = list(base_color)
+
+        # modify color based on behavioral state
+        if hasattr(organism, 'current_state'):
+            if organism.current_state == 'evade':
+                # add blue tint for evading organisms
+                color[2] = min(255, color[2] + 50)
+            elif organism.current_state == 'hunt':
+                # add red tint for hunting predators
+                color[0] = min(255, color[0] + 30)
+            elif organism.current_state == 'rest':
+                # add gray tint for resting organisms
+                for i in range(3):
+                    color[i] = max(0, color[i] - 30)
+            elif organism.current_state == 'group_behavior':
+                # add yellow tint for group behavior
+                color[1] = min(255, color[1] + 30)
+
+        # modify color based on protective traits (for prey)
+        if organism.species_type == 'prey':
+            if hasattr(organism, 'camouflage') and organism.camouflage > 0.7:
+                # darker color for camouflaged prey
+                for i in range(3):
+                    color[i] = max(0, color[i] - 40)
+            if hasattr(organism, 'toxicity') and organism.toxicity > 0.7:
+                # bright purple for toxic prey
+                color = [200, 0, 200]
+            if hasattr(organism, 'armor') and organism.armor > 0.7:
+                # metallic gray for armored prey
+                color = [150, 150, 150]
+
+        return tuple(color)
+
+    def _draw_behavioral_indicator(self, x, y, organism):
+        """phase 6: draw behavioral state indicators"""
+        if not hasattr(organism, 'current_state'):
+            return
+
+        # draw small indicator based on behavioral state
+        indicator_size = 3
+        indicator_color = (255, 255, 255)  # white
+
+        if organism.current_state == 'evade':
+            indicator_color = (0, 0, 255)  # blue
+        elif organism.current_state == 'hunt':
+            indicator_color = (255, 0, 0)  # red
+        elif organism.current_state == 'rest':
+            indicator_color = (128, 128, 128)  # gray
+        elif organism.current_state == 'group_behavior':
+            indicator_color = (255, 255, 0)  # yellow
+        elif organism.current_state == 'seek_food':
+            indicator_color = (0, 255, 0)  # green
+        elif organism.current_state == 'explore':
+            indicator_color = (255, 165, 0)  # orange
+
+        # draw indicator above organism
+        pygame.draw.circle(
+            self.screen,
+            indicator_color,
+            (x, y - int(organism.size) - 5),
+            indicator_size
+        )
+
+    def render_stats(self, stats, time_step, paused=False, trait_means=None, extra_lines=()):
+        font = self._font(24)
+
+        # calculate population health indicators
+        population_health = "Healthy"
+        if stats['alive_organisms'] < 5:
+            population_health = "Critical"
+        elif stats['alive_organisms'] < 10:
+            population_health = "Low"
+        elif stats['alive_organisms'] < 20:
+            population_health = "Moderate"
+
+        # calculate food availability indicator
+        food_availability = "Good"
+        if stats['food_density'] < 0.0003:
+            food_availability = "Critical"
+        elif stats['food_density'] < 0.0006:
+            food_availability = "Low"
+        elif stats['food_density'] < 0.001:
+            food_availability = "Moderate"
+
+        stats_text = [
+            f"Organisms: {stats['alive_organisms']} ({population_health})",
+            f"Predators: {stats['predators']}",
+            f"Prey: {stats['prey']}",
+            f"Food: {stats['available_food']} ({food_availability})",
+            f"Time: {time_step}",
+            f"Generation: {stats['generation']}",
+            f"Births: {stats['total_births']}",
+            f"Deaths: {stats['total_deaths']}",
+            f"Kills: {stats['predator_kills']}",
+            f"Avg Fitness: {stats['average_fitness']:.1f}",
+            f"Food Density: {stats['food_density']:.4f}",
+            # phase 4: speciation stats
+            f"Species: {stats['species_count']}",
+            f"Speciation Events: {stats['speciation_events']}",
+            f"Avg Genetic Distance: {stats['average_genetic_distance']:.3f}",
+            f"Lineage Depth: {stats['lineage_depth']}",
+            # phase 6: behavioral evolution stats
+            f"Avg Intelligence: {stats['average_intelligence']:.2f}",
+            f"Avg Social Behavior: {stats['average_social_behavior']:.2f}",
+            f"Avg Exploration: {stats['average_exploration_rate']:.2f}",
+            f"Avg Memory: {stats['average_memory_capacity']:.2f}",
+            # new: enhanced evolution stats
+            f"Avg Adaptation: {stats['average_adaptation_score']:.2f}",
+            f"Avg Efficiency: {stats['average_energy_efficiency']:.2f}",
+            f"Evolutionary Pressure: {stats['evolutionary_pressure']:.2f}",
+            f"Population Diversity: {stats['population_diversity']:.3f}",
+            f"Environmental Stress: {stats['environmental_stress']:.2f}",
+            f"Resource Competition: {stats['resource_competition_level']:.3f}",
+            f"Paused: {'Yes' if paused else 'No'}"
+        ]
+
+        # add trait statistics if available
+        if trait_means is not None:
+            speed_mean, vision_mean = trait_means
+            stats_text.append(f"Avg Speed: {speed_mean:.2f}")
+            stats_text.append(f"Avg Vision: {vision_mean:.1f}")
+        stats_text.extend(extra_lines)
+
+        # render with color coding for health indicators
+        for i, text in enumerate(stats_text):
+            color = self.config.text_color
+
+            # color code health indicators
+            if "Critical" in text:
+                color = (255, 100, 100)  # red
+            elif "Low" in text:
+                color = (255, 200, 100)  # orange
+            elif "Moderate" in text:
+                color = (200, 255, 100)  # yellow-green
+            elif "Healthy" in text or "Good" in text:
+                color = (100, 255, 100)  # green
+
+            surface = font.render(text, True, color)
+            self.screen.blit(surface, (10, 10 + i * 25))
+
+    def render_weather_effects(self, weather):
+        """render weather effects on the screen"""
+        if not self.config.show_day_night_cycle and not self.config.show_temperature_zones:
+            return
+
+        # create a surface for weather effects
+        weather_surface = pygame.Surface((self.config.width, self.config.height))
+        weather_surface.set_alpha(50)  # semi-transparent
+
+        # apply day/night cycle overlay
+        if self.config.show_day_night_cycle and self.config.day_night_cycle_enabled:
+            if weather.is_night:
+                weather_surface.fill(self.config.night_color)
+                self.screen.blit(weather_surface, (0, 0))
+
+        # apply temperature zone overlays
+        if self.config.show_temperature_zones and self.config.temperature_zones_enabled:
+            self._render_temperature_zones()
+
+    def _render_temperature_zones(self):
+        """render temperature zone indicators"""
+        # render cold zone (top)
+        cold_surface = pygame.Surface((self.config.width, self.config.cold_zone_y_range[1]))
+        cold_surface.set_alpha(30)
+        cold_surface.fill(self.config.cold_zone_color)
+        self.screen.blit(cold_surface, (0, 0))
+
+        # render hot zone (bottom)
+        hot_height = self.config.world_height - self.config.hot_zone_y_range[0]
+        hot_surface = pygame.Surface((self.config.width, hot_height))
+        hot_surface.set_alpha(30)
+        hot_surface.fill(self.config.hot_zone_color)
+        self.screen.blit(hot_surface, (0, self.config.hot_zone_y_range[0]))
+
+    def render_weather_ui(self, weather):
+        """render weather information in the ui"""
+        if not self.config.show_season_indicator:
+            return
+
+        font = self._font(24)
+
+        # render day/night indicator
+        if self.config.show_day_night_cycle and self.config.day_night_cycle_enabled:
+            time_text = "Night" if weather.is_night else "Day"
+            time_color = (100, 100, 255) if weather.is_night else (255, 255, 100)
+            time_surface = font.render(f"Time: {time_text}", True, time_color)
+            self.screen.blit(time_surface, (self.config.width - 150, 10))
+
+        # render season indicator
+        if self.config.seasons_enabled:
+            season_text = f"Season: {weather.current_season.capitalize()}"
+            season_surface = font.render(season_text, True, self.config.text_color)
+            self.screen.blit(season_surface, (self.config.width - 150, 35))
+
+            # render food multiplier
+            food_text = f"Food: {weather.current_food_multiplier:.1f}x"
+            food_surface = font.render(food_text, True, self.config.text_color)
+            self.screen.blit(food_surface, (self.config.width - 150, 60))
+
+            # render temperature modifier
+            temp_text = f"Temp: {weather.current_temperature_modifier:+d}°C"
+            temp_surface = font.render(temp_text, True, self.config.text_color)
+            self.screen.blit(temp_surface, (self.config.width - 150, 85))
@@ -0,0 +1,185 @@
+import pygame
+import sys
+import numpy as np
+from sim_config import SimConfig
+from environment import Obstacle
+from renderer import create_window_renderer
+from recorder import TrajectoryReader, SPECIES_TYPES, SEASONS, NO_STATE
+from trait_exporter import BEHAVIOR_STATES
+
+# numeric record fields read by the renderer
+DRAWN_FIELDS = ('x', 'y', 'energy', 'size', 'vision_radius', 'adaptation_score', 'energy_efficiency',
+                'intelligence', 'efficiency', 'camouflage', 'toxicity', 'armor')
+
+
+class RecordedOrganism:
+    """organism as read back from a trajectory record, with the attributes the renderer draws"""
+
+    __slots__ = DRAWN_FIELDS + ('color', 'species_type', 'current_state')
+
+    alive = True
+
+    def get_color(self):
+        return self.color
+
+
+class RecordedWeather:
+    """weather phase of a recorded tick"""
+
+    def __init__(self, entry):
+        self.is_night = bool(entry['is_night'])
+        self.current_season = SEASONS[entry['season']]
+        self.current_temperature_modifier = int(entry['temperature_modifier'])
+        self.current_food_multiplier = float(entry['food_multiplier'])
+
+
+class Replay:
+    """plays a recorded trajectory back through the simulation renderer
+
+    playback follows the wall clock at speed recorded ticks per second and
+    always draws the latest recorded tick at or before the playback time,
+    so recorded ticks are skipped whenever drawing them all would fall
+    behind. seeking is a bisection over the recorded time steps; nothing
+    is re-simulated.
+    """
+
+    def __init__(self, config, reader, renderer):
+        self.config = config
+        self.reader = reader
+        self.renderer = renderer
+        self.obstacles = [Obstacle(float(x), float(y), float(size), config)
+                          for x, y, size in reader.obstacles]
+        self.speed = float(config.replay_speed)
+        self.paused = False
+        self.time = float(reader.time_steps[0]) if len(reader) else 0.0
+
+    @property
+    def first_time_step(self):
+        return int(self.reader.time_steps[0])
+
+    @property
+    def last_time_step(self):
+        return int(self.reader.time_steps[-1])
+
+    def seek(self, time_step):
+        """jump to a time step, clamped to the recorded range"""
+        self.time = float(min(max(time_step, self.first_time_step), self.last_time_step))
+
+    def step(self, frames):
+        """move by whole recorded ticks, e.g. 1 or -1"""
+        position = min(max(self.reader.position(self.time) + frames, 0), len(self.reader) - 1)
+        self.time = float(self.reader.time_steps[position])
+
+    def set_speed(self, speed):
+        self.speed = min(max(speed, self.config.replay_min_speed), self.config.replay_max_speed)
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+
+    def advance(self, seconds):
+        """move playback forward by elapsed wall-clock seconds"""
+        if self.paused:
+            return
+        self.time += self.speed * seconds
+        if self.time > self.last_time_step:
+            # the run may still be recording; pick up any new ticks
+            self.reader.refresh()
+            self.time = min(self.time, float(self.last_time_step))
+
+    def organisms(self, position):
+        """renderable organisms of a recorded tick"""
+        records = self.reader.frame(position)
+        columns = [records[name].tolist() for name in DRAWN_FIELDS]
+        colors = [tuple(color) for color in records['color'].tolist()]
+        species = [SPECIES_TYPES[code] for code in records['species'].tolist()]
+        states = [BEHAVIOR_STATES[code] if code != NO_STATE else None for code in records['state'].tolist()]
+
+        organisms = []
+        for values in zip(*columns, colors, species, states):
+            organism = RecordedOrganism()
+            for name, value in zip(RecordedOrganism.__slots__, values):
+                setattr(organism, name, value)
+            organisms.append(organism)
+        return organisms
+
+    def render(self):
+        position = self.reader.position(self.time)
+        entry = self.reader.index[position]
+        trait_means = None
+        if entry['speed_mean'] == entry['speed_mean']:  # nan before the first trait snapshot
+            trait_means = (float(entry['speed_mean']), float(entry['vision_mean']))
+
+        self.renderer.render(
+            self.organisms(position),
+            self.reader.frame_food(position).view(np.recarray),
+            self.obstacles,
+            RecordedWeather(entry),
+            self.reader.frame_stats(position),
+            int(entry['time_step']),
+            self.paused,
+            trait_means,
+            extra_lines=[f"Replay: {self.speed:g} ticks/s, tick {int(entry['time_step'])}"
+                         f" of {self.last_time_step}"]
+        )
+
+
+def main():
+    # initialize pygame
+    pygame.init()
+
+    # load configuration
+    config = SimConfig()
+    path = sys.argv[1] if len(sys.argv) > 1 else config.trajectory_path
+    if not path:
+        print("usage: python replay.py TRAJECTORY_FILE")
+        sys.exit(1)
+
+    reader = TrajectoryReader(path)
+    if not len(reader):
+        print(f"no recorded ticks in {path}")
+        sys.exit(1)
+
+    replay = Replay(config, reader, create_window_renderer(config, f"{config.title} - Replay"))
+
+    # replay loop
+    running = True
+    clock = pygame.time.Clock()
+
+    while running:
+        # handle events
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    replay.toggle_pause()
+                elif event.key == pygame.K_RIGHT:
+                    replay.seek(replay.time + config.replay_seek_step)
+                elif event.key == pygame.K_LEFT:
+                    replay.seek(replay.time - config.replay_seek_step)
+                elif event.key == pygame.K_HOME:
+                    replay.seek(replay.first_time_step)
+                elif event.key == pygame.K_END:
+                    replay.seek(replay.last_time_step)
+                elif event.key == pygame.K_UP:
+                    replay.set_speed(replay.speed * 2)
+                elif event.key == pygame.K_DOWN:
+                    replay.set_speed(replay.speed / 2)
+                elif event.key == pygame.K_PERIOD:
+                    replay.step(1)
+                elif event.key == pygame.K_COMMA:
+                    replay.step(-1)
+
+        # render
+        replay.render()
+
+        # advance playback by the real time the frame took
+        replay.advance(clock.tick(config.fps) / 1000.0)
+
+    pygame.quit()
+    sys.exit()
+
+if __name__ == "__main__":
+    main()
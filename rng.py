@@ -0,0 +1,50 @@
+import random
+import numpy as np
+
+# subsystems drawing from their own stream, so extra draws in one never shift another
+SUBSYSTEMS = ('organisms', 'environment', 'reproduction')
+
+
+class RandomStream(random.Random):
+    """a random.Random for scalar draws with a numpy Generator for batched ones (.np)
+
+    both are seeded from the same SeedSequence, so a stream is reproducible
+    as a whole.
+    """
+
+    def __init__(self, sequence=None):
+        sequence = sequence if sequence is not None else np.random.SeedSequence()
+        super().__init__(int.from_bytes(sequence.generate_state(4).tobytes(), 'little'))
+        self.np = np.random.Generator(np.random.PCG64(sequence))
+
+    def get_state(self):
+        """json-friendly state of both generators"""
+        version, internal, gauss = self.getstate()
+        return {'python': [version, list(internal), gauss], 'numpy': self.np.bit_generator.state}
+
+    def set_state(self, state):
+        version, internal, gauss = state['python']
+        self.setstate((version, tuple(internal), gauss))
+        self.np.bit_generator.state = state['numpy']
+
+
+class RandomStreams:
+    """the random streams of one simulation, one per subsystem
+
+    the same seed gives the same streams, hence the same run; seed None
+    draws fresh entropy. each subsystem's stream is an independent child of
+    the seed, so two simulations, or two subsystems, never share draws.
+    """
+
+    def __init__(self, seed=None):
+        self.seed = seed
+        children = np.random.SeedSequence(seed).spawn(len(SUBSYSTEMS))
+        for name, child in zip(SUBSYSTEMS, children):
+            setattr(self, name, RandomStream(child))
+
+    def get_state(self):
+        return {name: getattr(self, name).get_state() for name in SUBSYSTEMS}
+
+    def set_state(self, state):
+        for name in SUBSYSTEMS:
+            getattr(self, name).set_state(state[name])
@@ -6,6 +6,12 @@ class SimConfig:
         self.fps = 60
         self.title = "Natural Selection Simulator - Enhanced"
         
+        # fast-forward settings (F key): many ticks per displayed frame
+        self.fast_forward = False  # start in fast-forward mode
+        self.fast_forward_frame_budget = 1 / 30  # wall-clock seconds per displayed frame
+        self.fast_forward_max_ticks = 1000  # most ticks run per displayed frame
+        self.fast_forward_max_skipped_frames = 10  # undrawn frames in a row while catching up
+        
         # world settings
         self.world_width = 1000
         self.world_height = 600
@@ -32,10 +38,24 @@ class SimConfig:
         # simulation settings
         self.time_step = 1.0
         self.paused = False
+        self.random_seed = None  # seeds every random stream of a simulation (None = fresh each run)
         
         # trait tracking settings
         self.trait_log_interval = 100
         self.max_trait_history = 1000
+        self.max_stat_history = 1000  # samples kept per statistic history
+        self.trend_window = 50  # recent snapshots used for windowed trend slopes
+        self.trait_export_path = None  # csv file streamed at every trait snapshot (None = off)
+        self.trait_export_chunk_rows = 50  # rows between fsyncs of the export file
+        self.trajectory_path = None  # memory-mapped per-tick organism records (None = off)
+        self.trajectory_interval = 1  # ticks between recorded frames
+        self.checkpoint_path = 'simulation_checkpoint.npz'  # written with S, restored with L
+        
+        # replay settings (replay.py)
+        self.replay_speed = 60.0  # recorded ticks played per second
+        self.replay_min_speed = 1.0
+        self.replay_max_speed = 3840.0
+        self.replay_seek_step = 100  # ticks jumped by the left/right keys
         
         # visualization settings
         self.show_vision_radius = False
@@ -218,4 +238,15 @@ class SimConfig:
         self.show_trait_indicators = True  # show trait-based visual indicators
         self.show_behavior_indicators = True  # show behavioral state indicators
         self.show_environmental_effects = True  # show environmental effects
-        self.show_evolutionary_pressure = True  # show evolutionary pressure indicators 
\ No newline at end of file
+        self.show_evolutionary_pressure = True  # show evolutionary pressure indicators
+        # performance: spatial indexing
+        self.spatial_grid_cell_size = 50  # cell size for organism neighbor queries
+        self.food_grid_cell_size = 40  # cell size for food queries
+        self.obstacle_field_resolution = 2  # pixels per obstacle field cell
+        
+        # performance: statistics cadence (ticks between refreshes, 0 = only when displayed)
+        self.stats_interval_population = 1  # counts, food and fitness
+        self.stats_interval_species = 1  # species count, only after births, deaths or speciation
+        self.stats_interval_diversity = 1  # genetic diversity, only after births or deaths
+        self.stats_interval_evolution = 5  # adaptation, pressure and stress (histories still sampled every tick)
+        self.stats_interval_behavior = 1  # behavioral states and trait averages (running aggregates)
@@ -0,0 +1,378 @@
+import math
+from collections import deque
+import numpy as np
+
+
+class SpatialHashGrid:
+    """uniform spatial hash grid for point-like objects with x and y attributes"""
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size)
+        self.cells = {}
+        self._cell_of = {}  # id(item) -> cell key
+        self._items = {}    # id(item) -> item, in insertion order
+
+        # occupied cell extent, used to bound unlimited nearest searches
+        self._min_cx = self._min_cy = 0
+        self._max_cx = self._max_cy = -1
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __contains__(self, item):
+        return id(item) in self._items
+
+    def _cell_key(self, x, y):
+        return (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+
+    def _expand_extent(self, key):
+        cx, cy = key
+        if self._max_cx < self._min_cx:
+            self._min_cx = self._max_cx = cx
+            self._min_cy = self._max_cy = cy
+            return
+        self._min_cx = min(self._min_cx, cx)
+        self._max_cx = max(self._max_cx, cx)
+        self._min_cy = min(self._min_cy, cy)
+        self._max_cy = max(self._max_cy, cy)
+
+    def clear(self):
+        self.cells = {}
+        self._cell_of = {}
+        self._items = {}
+        self._min_cx = self._min_cy = 0
+        self._max_cx = self._max_cy = -1
+
+    def insert(self, item):
+        """add an item at its current position"""
+        key = self._cell_key(item.x, item.y)
+        self.cells.setdefault(key, []).append(item)
+        self._cell_of[id(item)] = key
+        self._items[id(item)] = item
+        self._expand_extent(key)
+
+    def remove(self, item):
+        """remove an item, ignoring items that are not in the grid"""
+        key = self._cell_of.pop(id(item), None)
+        if key is None:
+            return
+        del self._items[id(item)]
+        bucket = self.cells[key]
+        bucket.remove(item)
+        if not bucket:
+            del self.cells[key]
+
+    def rebuild(self, items):
+        """replace the grid contents with the given items"""
+        self.clear()
+        for item in items:
+            self.insert(item)
+
+    def query_radius(self, x, y, radius, predicate=None):
+        """return (item, distance) pairs strictly within radius of (x, y)"""
+        results = []
+        if radius <= 0 or not self.cells:
+            return results
+
+        min_cx, min_cy = self._cell_key(x - radius, y - radius)
+        max_cx, max_cy = self._cell_key(x + radius, y + radius)
+        cells = self.cells
+
+        for cx in range(max(min_cx, self._min_cx), min(max_cx, self._max_cx) + 1):
+            for cy in range(max(min_cy, self._min_cy), min(max_cy, self._max_cy) + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for item in bucket:
+                    if predicate is not None and not predicate(item):
+                        continue
+                    dx = item.x - x
+                    dy = item.y - y
+                    distance = math.sqrt(dx*dx + dy*dy)
+                    if distance < radius:
+                        results.append((item, distance))
+
+        return results
+
+    def k_nearest(self, x, y, k, max_radius=None, predicate=None):
+        """return up to k (item, distance) pairs ordered by distance"""
+        if k <= 0 or not self.cells:
+            return []
+
+        cell_size = self.cell_size
+        ccx, ccy = self._cell_key(x, y)
+
+        # rings beyond the occupied extent can never contain items
+        max_ring = max(abs(ccx - self._min_cx), abs(ccx - self._max_cx),
+                       abs(ccy - self._min_cy), abs(ccy - self._max_cy))
+        if max_radius is not None:
+            max_ring = min(max_ring, int(max_radius / cell_size) + 1)
+
+        found = []
+        cells = self.cells
+        ring = 0
+        while ring <= max_ring:
+            for key in self._ring_keys(ccx, ccy, ring):
+                bucket = cells.get(key)
+                if not bucket:
+                    continue
+                for item in bucket:
+                    if predicate is not None and not predicate(item):
+                        continue
+                    dx = item.x - x
+                    dy = item.y - y
+                    distance = math.sqrt(dx*dx + dy*dy)
+                    if max_radius is not None and distance >= max_radius:
+                        continue
+                    found.append((distance, len(found), item))
+
+            # everything in later rings is at least ring * cell_size away
+            if len(found) >= k:
+                found.sort(key=lambda entry: (entry[0], entry[1]))
+                if found[k - 1][0] <= ring * cell_size:
+                    break
+            ring += 1
+
+        found.sort(key=lambda entry: (entry[0], entry[1]))
+        return [(item, distance) for distance, _, item in found[:k]]
+
+    def nearest(self, x, y, max_radius=None, predicate=None):
+        """return the nearest (item, distance) pair, or (None, inf)"""
+        result = self.k_nearest(x, y, 1, max_radius, predicate)
+        if not result:
+            return None, float('inf')
+        return result[0]
+
+    @staticmethod
+    def _ring_keys(cx, cy, ring):
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for ix in range(cx - ring, cx + ring + 1):
+            yield (ix, cy - ring)
+            yield (ix, cy + ring)
+        for iy in range(cy - ring + 1, cy + ring):
+            yield (cx - ring, iy)
+            yield (cx + ring, iy)
+
+
+class OrganismGrid:
+    """spatial index over organisms, bucketed by species type
+
+    iterating the grid yields every indexed organism, so code that still
+    scans the whole population keeps working unchanged.
+    """
+
+    def __init__(self, cell_size, organisms=None):
+        self.cell_size = cell_size
+        self.grids = {}
+        self._organisms = []
+        if organisms is not None:
+            self.rebuild(organisms)
+
+    def __len__(self):
+        return len(self._organisms)
+
+    def __iter__(self):
+        return iter(self._organisms)
+
+    def rebuild(self, organisms):
+        """re-index the population, called once per simulation tick"""
+        self._organisms = list(organisms)
+        for grid in self.grids.values():
+            grid.clear()
+        for org in self._organisms:
+            self._grid_for(org.species_type).insert(org)
+
+    def _grid_for(self, species_type):
+        grid = self.grids.get(species_type)
+        if grid is None:
+            grid = SpatialHashGrid(self.cell_size)
+            self.grids[species_type] = grid
+        return grid
+
+    def _grids(self, species_type):
+        if species_type is None:
+            return list(self.grids.values())
+        grid = self.grids.get(species_type)
+        return [grid] if grid is not None else []
+
+    def query_radius(self, x, y, radius, species_type=None, predicate=None):
+        """return (organism, distance) pairs within radius, optionally of one species type"""
+        results = []
+        for grid in self._grids(species_type):
+            results.extend(grid.query_radius(x, y, radius, predicate))
+        return results
+
+    def k_nearest(self, x, y, k, species_type=None, max_radius=None, predicate=None):
+        """return up to k nearest (organism, distance) pairs, optionally of one species type"""
+        results = []
+        for grid in self._grids(species_type):
+            results.extend(grid.k_nearest(x, y, k, max_radius, predicate))
+        results.sort(key=lambda entry: entry[1])
+        return results[:k]
+
+    def nearest(self, x, y, species_type=None, max_radius=None, predicate=None):
+        """return the nearest (organism, distance) pair, or (None, inf)"""
+        result = self.k_nearest(x, y, 1, species_type, max_radius, predicate)
+        if not result:
+            return None, float('inf')
+        return result[0]
+
+
+class FoodIndex:
+    """spatial index over available food with scheduled regrowth
+
+    food items notify the index when they are consumed, and the index
+    makes them available again once their regrowth delay has passed, so
+    neither queries nor regrowth need to touch every food item.
+    """
+
+    def __init__(self, config, food=None):
+        self.config = config
+        self.grid = SpatialHashGrid(config.food_grid_cell_size)
+        self.time_step = 0
+        self.regrowth_delay = math.ceil(1 / config.food_regen_rate)
+        self.regrowth_queue = deque()  # (ready_time_step, food), in ready order
+        if food is not None:
+            for item in food:
+                if item.available:
+                    self.add(item)
+
+    def __len__(self):
+        return len(self.grid)
+
+    def __iter__(self):
+        return iter(self.grid)
+
+    def add(self, food):
+        """index an available food item"""
+        if food not in self.grid:
+            self.grid.insert(food)
+
+    def mark_consumed(self, food):
+        """drop a consumed food item and schedule its regrowth"""
+        self.grid.remove(food)
+        self.regrowth_queue.append((self.time_step + self.regrowth_delay, food))
+
+    def advance(self):
+        """advance one tick and restore food whose regrowth delay has passed"""
+        self.time_step += 1
+        queue = self.regrowth_queue
+        while queue and queue[0][0] <= self.time_step:
+            _, food = queue.popleft()
+            food.available = True
+            self.add(food)
+
+    def available_count(self):
+        return len(self.grid)
+
+    def available_food(self):
+        return list(self.grid)
+
+    def query_radius(self, x, y, radius):
+        """return (food, distance) pairs for available food within radius"""
+        return self.grid.query_radius(x, y, radius)
+
+    def nearest(self, x, y, max_radius=None):
+        """return the nearest available (food, distance) pair, or (None, inf)"""
+        return self.grid.nearest(x, y, max_radius)
+
+
+class ObstacleField:
+    """rasterized clearance field around static obstacles
+
+    every cell stores the distance from its center to the nearest obstacle
+    surface and the unit direction pointing away from that obstacle, so
+    avoidance is a single lookup instead of a scan over all obstacles.
+    cells farther than reach from every obstacle keep an infinite clearance.
+    """
+
+    def __init__(self, obstacles, config, reach):
+        self.config = config
+        self.resolution = config.obstacle_field_resolution
+        self.obstacle_count = len(obstacles)
+
+        self.cols = max(1, math.ceil(config.world_width / self.resolution))
+        self.rows = max(1, math.ceil(config.world_height / self.resolution))
+        self.clearance = np.full((self.rows, self.cols), np.inf)
+        self.gradient_x = np.zeros((self.rows, self.cols))
+        self.gradient_y = np.zeros((self.rows, self.cols))
+
+        for obstacle in obstacles:
+            self._rasterize(obstacle, reach)
+
+    def __len__(self):
+        return self.obstacle_count
+
+    def _rasterize(self, obstacle, reach):
+        res = self.resolution
+        radius = obstacle.size + reach
+        c0 = max(0, int((obstacle.x - radius) / res))
+        c1 = min(self.cols, int((obstacle.x + radius) / res) + 1)
+        r0 = max(0, int((obstacle.y - radius) / res))
+        r1 = min(self.rows, int((obstacle.y + radius) / res) + 1)
+        if c0 >= c1 or r0 >= r1:
+            return
+
+        # offsets from the obstacle center to each cell center in its bounding box
+        dx = (np.arange(c0, c1) + 0.5) * res - obstacle.x
+        dy = (np.arange(r0, r1) + 0.5) * res - obstacle.y
+        dx, dy = np.meshgrid(dx, dy)
+        distance = np.hypot(dx, dy)
+        clearance = distance - obstacle.size
+
+        # keep whichever obstacle surface is closest
+        window = self.clearance[r0:r1, c0:c1]
+        closer = clearance < window
+        safe_distance = np.where(distance > 0, distance, 1.0)
+        window[closer] = clearance[closer]
+        self.gradient_x[r0:r1, c0:c1][closer] = (dx / safe_distance)[closer]
+        self.gradient_y[r0:r1, c0:c1][closer] = (dy / safe_distance)[closer]
+
+    def sample(self, x, y):
+        """return (clearance, away_x, away_y) at a world position"""
+        col = min(self.cols - 1, max(0, int(x / self.resolution)))
+        row = min(self.rows - 1, max(0, int(y / self.resolution)))
+        return (self.clearance[row, col],
+                self.gradient_x[row, col],
+                self.gradient_y[row, col])
+
+
+class Neighborhood:
+    """one organism's neighbors within its largest query radius
+
+    built once per tick by the simulation's perception pass; entries are
+    (organism, distance) pairs sorted by distance, so every smaller-radius
+    query is a prefix scan with no further distance math.
+    """
+
+    def __init__(self, radius, entries):
+        self.radius = radius
+        self.entries = sorted(entries, key=lambda entry: entry[1])
+
+    def __len__(self):
+        return len(self.entries)
+
+    def within(self, radius, species_type=None):
+        """return (organism, distance) pairs closer than radius"""
+        results = []
+        for org, distance in self.entries:
+            if distance >= radius:
+                break
+            if species_type is None or org.species_type == species_type:
+                results.append((org, distance))
+        return results
+
+    def nearest(self, species_type=None, predicate=None):
+        """return the nearest matching (organism, distance) pair, or (None, inf)"""
+        for org, distance in self.entries:
+            if species_type is not None and org.species_type != species_type:
+                continue
+            if predicate is not None and not predicate(org):
+                continue
+            return org, distance
+        return None, float('inf')
@@ -0,0 +1,71 @@
+class StatMetric:
+    """one registered statistic and its cache state"""
+
+    def __init__(self, name, compute, interval, depends_on):
+        self.name = name
+        self.compute = compute
+        self.interval = interval  # ticks between refreshes, 0 = only on demand
+        self.depends_on = frozenset(depends_on)
+        self.stale = True
+        self.last_refresh = None
+
+    def is_due(self, time_step):
+        """stale and its refresh interval has elapsed"""
+        if not self.stale or self.interval <= 0:
+            return False
+        return self.last_refresh is None or time_step - self.last_refresh >= self.interval
+
+
+class StatsEngine:
+    """runs statistics at their own cadence and caches them between changes
+
+    each metric names the events that invalidate it. 'tick' means the value
+    drifts every tick (energies, ages, behavioral states); 'population' and
+    'species' are raised by the simulation on births and deaths and on
+    speciation. a metric is recomputed only when it is stale and its
+    interval has elapsed, or when a caller asks for it.
+    """
+
+    def __init__(self):
+        self.metrics = {}  # registration order is evaluation order
+        self.recomputed = []  # metric names recomputed during the current tick
+        self.refresh_counts = {}
+        self.time_step = 0
+
+    def register(self, name, compute, interval=1, depends_on=('tick',)):
+        self.metrics[name] = StatMetric(name, compute, interval, depends_on)
+        self.refresh_counts[name] = 0
+
+    def invalidate(self, *events):
+        """mark metrics stale; with no events, every metric is marked"""
+        for metric in self.metrics.values():
+            if not events or metric.depends_on.intersection(events):
+                metric.stale = True
+
+    def tick(self, time_step):
+        """refresh every metric that is due on this tick"""
+        self.time_step = time_step
+        self.recomputed = []
+        self.invalidate('tick')
+
+        for metric in self.metrics.values():
+            if metric.is_due(time_step):
+                self._run(metric)
+
+    def refresh(self, names=None):
+        """bring stale metrics up to date now, regardless of their interval"""
+        for metric in self.metrics.values():
+            if metric.stale and (names is None or metric.name in names):
+                self._run(metric)
+
+    def refresh_on_demand(self):
+        """refresh stale metrics that have no interval of their own"""
+        self.refresh([metric.name for metric in self.metrics.values()
+                      if metric.interval <= 0])
+
+    def _run(self, metric):
+        metric.compute()
+        metric.stale = False
+        metric.last_refresh = self.time_step
+        self.recomputed.append(metric.name)
+        self.refresh_counts[metric.name] += 1
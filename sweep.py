@@ -0,0 +1,189 @@
+import os
+import ast
+import json
+import random
+import hashlib
+import itertools
+import numpy as np
+from batch_runner import configure, run_jobs, print_progress, BatchResult
+
+CACHE_VERSION = 1
+
+SOURCE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# modules a headless run starts from; whatever they import from this directory
+# decides simulation results too, while the viewers and controls do not
+RUN_ENTRY_MODULES = ('batch_runner', 'simulation')
+
+
+def grid(axes):
+    """every combination of the values listed per setting, as overrides dicts
+
+    e.g. grid({'mutation_rate': [0.1, 0.2], 'carrying_capacity': [100, 150]})
+    gives four points.
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[name] for name in names))]
+
+
+def random_samples(ranges, count, seed=0):
+    """count overrides dicts drawn independently per setting
+
+    a (low, high) tuple samples uniformly, as integers when both bounds are
+    ints; a list picks one of its values. the same seed gives the same points.
+    """
+    rng = random.Random(seed)
+    points = []
+    for _ in range(count):
+        point = {}
+        for name, spec in ranges.items():
+            if isinstance(spec, list):
+                point[name] = rng.choice(spec)
+            elif isinstance(spec[0], int) and isinstance(spec[1], int):
+                point[name] = rng.randint(spec[0], spec[1])
+            else:
+                point[name] = rng.uniform(spec[0], spec[1])
+        points.append(point)
+    return points
+
+
+def run_modules():
+    """names of the local modules a headless run imports, directly or not"""
+    found = set()
+    pending = list(RUN_ENTRY_MODULES)
+    while pending:
+        name = pending.pop()
+        path = os.path.join(SOURCE_DIRECTORY, name + '.py')
+        if name in found or not os.path.exists(path):
+            continue
+        found.add(name)
+        with open(path, 'rb') as source:
+            tree = ast.parse(source.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                pending.extend(alias.name.split('.')[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                pending.append(node.module.split('.')[0])
+    return sorted(found)
+
+
+def code_version():
+    """hash of the source of the modules a headless run imports
+
+    edits to the interactive front ends (rendering, key bindings, replay)
+    leave cached sweep results valid.
+    """
+    digest = hashlib.sha256()
+    for name in run_modules():
+        digest.update(name.encode('utf-8'))
+        with open(os.path.join(SOURCE_DIRECTORY, name + '.py'), 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def config_key(overrides, seed, ticks, version):
+    """stable hash of the full resulting config, seed, run length and code version
+
+    overrides that restate a default give the same key as leaving them out.
+    """
+    config = configure(overrides)
+    config.random_seed = seed
+    description = {
+        'cache_version': CACHE_VERSION,
+        'config': vars(config),
+        'ticks': ticks,
+        'code': version
+    }
+    text = json.dumps(description, sort_keys=True, default=_plain)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _plain(value):
+    """json fallback for numpy scalars and other stray values"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return repr(value)
+
+
+class SweepCache:
+    """finished runs on disk, one .npz file per config key"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.npz')
+
+    def __contains__(self, key):
+        return os.path.exists(self.path(key))
+
+    def load(self, key):
+        """the cached run stored under key, or None"""
+        if key not in self:
+            return None
+        with np.load(self.path(key), allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            history = {name[len('history.'):]: data[name] for name in data.files
+                       if name.startswith('history.')}
+        return {
+            'history': history,
+            'generation_rows': {int(generation): rows for generation, rows in meta['generation_rows'].items()},
+            'stats': meta['stats'],
+            'elapsed': meta['elapsed']
+        }
+
+    def store(self, key, run):
+        """write a finished run; the file appears complete or not at all"""
+        meta = {name: run[name] for name in ('overrides', 'seed', 'stats', 'generation_rows', 'elapsed')}
+        arrays = {'history.' + name: values for name, values in run['history'].items()}
+        arrays['meta'] = np.array(json.dumps(meta, default=_plain))
+
+        temporary = self.path(key) + '.tmp'
+        with open(temporary, 'wb') as file:
+            np.savez_compressed(file, **arrays)
+        os.replace(temporary, self.path(key))
+
+
+def run_sweep(points, seeds, ticks, cache_dir='sweep_cache', max_workers=None, progress=print_progress,
+              progress_interval=100):
+    """run every point x seed headless, computing only the runs missing from the cache
+
+    points are overrides dicts, e.g. from grid or random_samples. cached runs
+    are loaded and marked 'cached'; the rest run in parallel through
+    batch_runner and are cached as each one succeeds, so an interrupted
+    sweep keeps its finished runs. failed runs are never cached, so a rerun
+    retries them; neither are runs with seed None, which draw fresh entropy.
+    """
+    cache = SweepCache(cache_dir)
+    version = code_version()
+
+    runs = []
+    missing = []
+    for overrides in points:
+        for seed in seeds:
+            key = config_key(overrides, seed, ticks, version) if seed is not None else None
+            run = {'index': len(runs), 'overrides': dict(overrides), 'seed': seed, 'key': key}
+            cached = cache.load(key) if key is not None else None
+            if cached is not None:
+                run.update(cached)
+                run['status'] = 'ok'
+                run['cached'] = True
+            else:
+                missing.append(run)
+            runs.append(run)
+
+    def report(job, time_step, ticks):
+        if progress is not None:
+            progress(missing[job['index']], time_step, ticks)
+
+    def finished(job):
+        run = missing[job['index']]
+        run.update((name, value) for name, value in job.items() if name != 'index')
+        run['cached'] = False
+        if run['status'] == 'ok' and run['key'] is not None:
+            cache.store(run['key'], run)
+
+    run_jobs([(run['overrides'], run['seed']) for run in missing], ticks, max_workers,
+             report, progress_interval, finished)
+    return BatchResult(runs, ticks)
@@ -0,0 +1,318 @@
+import numpy as np
+
+
+class RingBuffer:
+    """fixed-capacity numpy time series with O(1) append
+
+    every value is written twice, at its slot and one capacity further on,
+    so the chronological window is always one contiguous slice and values()
+    returns a view without copying.
+    """
+
+    def __init__(self, capacity, dtype=float):
+        self.capacity = max(1, int(capacity))
+        self.dtype = np.dtype(dtype)
+        self.buffer = np.zeros(2 * self.capacity, dtype=self.dtype)
+        self.start = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, value):
+        slot = (self.start + self.size) % self.capacity
+        self.buffer[slot] = value
+        self.buffer[slot + self.capacity] = value
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def clear(self):
+        self.start = 0
+        self.size = 0
+
+    def values(self):
+        """chronological view of the stored values, oldest first"""
+        return self.buffer[self.start:self.start + self.size]
+
+    def __getitem__(self, index):
+        return self.values()[index]
+
+    def __iter__(self):
+        return iter(self.values())
+
+
+class SnapshotSeries:
+    """bounded series of snapshot dicts with a numeric column per scalar field
+
+    nested dicts are flattened into dotted column names, so a snapshot's
+    snapshot['traits']['speed']['mean'] is read back as
+    column('traits.speed.mean'). fields missing from a snapshot are nan.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = max(1, int(capacity))
+        self.records = RingBuffer(self.capacity, dtype=object)
+        self.columns = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def append(self, snapshot):
+        fields = {}
+        _flatten(snapshot, '', fields)
+
+        for name, column in self.columns.items():
+            if name not in fields:
+                column.append(np.nan)
+
+        for name, value in fields.items():
+            column = self.columns.get(name)
+            if column is None:
+                # backfill so every column stays aligned with the records
+                column = RingBuffer(self.capacity)
+                column.extend([np.nan] * len(self.records))
+                self.columns[name] = column
+            column.append(value)
+
+        self.records.append(snapshot)
+
+    def column(self, name):
+        """chronological values of one field, oldest first"""
+        column = self.columns.get(name)
+        if column is None:
+            return np.full(len(self), np.nan)
+        return column.values()
+
+    def clear(self):
+        self.records.clear()
+        self.columns = {}
+
+
+class ColumnarSeries:
+    """unbounded snapshot series stored as growable numpy columns
+
+    each scalar field (nested dicts flattened to dotted names, as in
+    SnapshotSeries) gets a preallocated float column that doubles when
+    full. rows are appended in order and never copied into dicts.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = max(1, int(capacity))
+        self.count = 0
+        self.columns = {}
+
+    def __len__(self):
+        return self.count
+
+    def append(self, snapshot):
+        """store one snapshot as a new row and return its row index"""
+        fields = {}
+        _flatten(snapshot, '', fields)
+
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+
+        row = self.count
+        for name, value in fields.items():
+            column = self.columns.get(name)
+            if column is None:
+                column = np.full(self.capacity, np.nan)
+                self.columns[name] = column
+            column[row] = value
+
+        self.count += 1
+        return row
+
+    def _grow(self, capacity):
+        for name, column in self.columns.items():
+            grown = np.full(capacity, np.nan)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+        self.capacity = capacity
+
+    def column(self, name):
+        """values of one field for every row, nan where a snapshot lacked it"""
+        column = self.columns.get(name)
+        if column is None:
+            return np.full(self.count, np.nan)
+        return column[:self.count]
+
+    def row(self, index):
+        """one row as a flat {field: value} dict"""
+        return {name: column[index] for name, column in self.columns.items()}
+
+
+class OnlineTrend:
+    """least-squares slope of a series, updated in O(1) per value
+
+    x is the sample index, as in np.polyfit(np.arange(n), values, 1). the x
+    sums have closed forms, so only sum(y) and sum(x*y) are accumulated,
+    for the whole series and for a sliding window of recent samples. the
+    window sums are re-added from the window buffer once per window length
+    so rounding drift from subtracting old samples cannot build up.
+    mean, std, min and max are kept alongside (welford for the variance).
+    """
+
+    def __init__(self, window):
+        self.window = RingBuffer(window)
+        self.count = 0
+        self.sum_y = 0.0
+        self.sum_xy = 0.0
+        self.window_sum_y = 0.0
+        self.window_sum_xy = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def __len__(self):
+        return self.count
+
+    def add(self, y):
+        y = float(y)
+        x = self.count
+        self.count += 1
+
+        self.sum_y += y
+        self.sum_xy += x * y
+
+        capacity = self.window.capacity
+        if len(self.window) == capacity:
+            old_y = self.window[0]
+            self.window_sum_y -= old_y
+            self.window_sum_xy -= (x - capacity) * old_y
+        self.window.append(y)
+        self.window_sum_y += y
+        self.window_sum_xy += x * y
+        if self.count % capacity == 0:
+            first_x = self.count - len(self.window)
+            values = self.window.values()
+            self.window_sum_y = float(values.sum())
+            self.window_sum_xy = float(np.dot(np.arange(first_x, self.count), values))
+
+        delta = y - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (y - self.mean)
+        self.min = min(self.min, y)
+        self.max = max(self.max, y)
+
+    @property
+    def std(self):
+        return (self._m2 / self.count) ** 0.5 if self.count else 0.0
+
+    def slope(self, windowed=False):
+        """regression slope over the whole series or the recent window"""
+        if windowed:
+            n = len(self.window)
+            first_x = self.count - n
+            return _slope(first_x, n, self.window_sum_y, self.window_sum_xy)
+        return _slope(0, self.count, self.sum_y, self.sum_xy)
+
+
+class PrefixSeries:
+    """growable prefix sums of one series for O(1) range statistics
+
+    cumulative sums of y, y^2 and i*y (i the sample index) give the mean,
+    variance and regression slope of any index range [start, end) from a
+    handful of subtractions. values are stored relative to the first
+    sample to keep the squared sums small. a missing (nan) value repeats
+    the previous one so sample indices stay contiguous.
+    """
+
+    def __init__(self, capacity=256):
+        capacity = max(1, int(capacity))
+        self.count = 0
+        self.shift = None
+        self.last = np.nan
+        self.sum_y = np.zeros(capacity + 1)
+        self.sum_sq = np.zeros(capacity + 1)
+        self.sum_iy = np.zeros(capacity + 1)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, y):
+        y = float(y)
+        if np.isnan(y):
+            y = self.last
+        if np.isnan(y):
+            return
+        if self.shift is None:
+            self.shift = y
+        self.last = y
+
+        if self.count + 1 == len(self.sum_y):
+            self._grow(2 * (len(self.sum_y) - 1))
+
+        i = self.count
+        value = y - self.shift
+        self.sum_y[i + 1] = self.sum_y[i] + value
+        self.sum_sq[i + 1] = self.sum_sq[i] + value * value
+        self.sum_iy[i + 1] = self.sum_iy[i] + i * value
+        self.count += 1
+
+    def _grow(self, capacity):
+        for name in ('sum_y', 'sum_sq', 'sum_iy'):
+            grown = np.zeros(capacity + 1)
+            grown[:self.count + 1] = getattr(self, name)[:self.count + 1]
+            setattr(self, name, grown)
+
+    def range_stats(self, start, end):
+        """count, mean, std and slope of samples [start, end), or None if empty"""
+        start = max(0, start)
+        end = min(self.count, end)
+        n = end - start
+        if n <= 0:
+            return None
+
+        sum_y = self.sum_y[end] - self.sum_y[start]
+        sum_sq = self.sum_sq[end] - self.sum_sq[start]
+        # sum of (i - start) * y, i.e. x measured from the start of the range
+        sum_xy = (self.sum_iy[end] - self.sum_iy[start]) - start * sum_y
+
+        mean = sum_y / n
+        variance = max(0.0, sum_sq / n - mean * mean) if n > 1 else 0.0
+        return {
+            'count': n,
+            'mean': mean + self.shift,
+            'std': variance ** 0.5,
+            'slope': _slope(0, n, sum_y, sum_xy)
+        }
+
+
+def _slope(first_x, n, sum_y, sum_xy):
+    """least-squares slope for y sampled at x = first_x .. first_x + n - 1"""
+    if n < 2:
+        return 0.0
+    # centred on the mean x, the x variance term is n(n^2 - 1)/12 exactly
+    mean_x = first_x + (n - 1) / 2.0
+    sxx = n * (n * n - 1) / 12.0
+    return (sum_xy - mean_x * sum_y) / sxx
+
+
+def flatten_snapshot(snapshot):
+    """scalar fields of a nested snapshot dict, keyed by dotted names"""
+    fields = {}
+    _flatten(snapshot, '', fields)
+    return fields
+
+
+def _flatten(record, prefix, fields):
+    for key, value in record.items():
+        name = prefix + str(key)
+        if isinstance(value, dict):
+            _flatten(value, name + '.', fields)
+        elif isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+            fields[name] = value
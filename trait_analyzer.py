@@ -1,59 +1,147 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from collections import defaultdict
+from timeseries import ColumnarSeries, OnlineTrend, PrefixSeries
+from trait_exporter import EXPORT_FIELDS, INTEGER_FIELDS
 
 class TraitAnalyzer:
     def __init__(self, config):
         self.config = config
-        self.trait_history = []
-        self.generation_data = defaultdict(list)
+        # one growable numpy column per snapshot scalar and trait statistic
+        self.trait_history = ColumnarSeries()
+        # row indices of each generation's snapshots
+        self.generation_rows = defaultdict(list)
+        # running regression sums per tracked series, overall and windowed
+        self.trends = {}
+        # prefix sums per tracked series for time-range queries, and the
+        # trait_history row each series starts at
+        self.prefixes = {}
+        self.prefix_start_rows = {}
     
     def add_snapshot(self, snapshot):
         """add a trait snapshot from the simulation"""
-        self.trait_history.append(snapshot)
+        row = self.trait_history.append(snapshot)
+        
+        # update running trends for population counts and trait means
+        tracked = ['population', 'predators', 'prey']
+        tracked.extend(f'traits.{trait_name}.mean' for trait_name in snapshot.get('traits', {}))
+        self._track_row(row, tracked)
         
         # also track by generation
         generation = snapshot.get('generation', 0)
-        self.generation_data[generation].append(snapshot)
+        self.generation_rows[generation].append(row)
     
-    def get_trait_statistics(self, trait_name, time_range=None):
-        """get statistics for a specific trait over time"""
-        if not self.trait_history:
+    def _track_row(self, row, tracked):
+        for name in tracked:
+            value = self.trait_history.column(name)[row]
+            if np.isnan(value):
+                continue
+            if name not in self.trends:
+                self.trends[name] = OnlineTrend(self.config.trend_window)
+                self.prefixes[name] = PrefixSeries()
+                self.prefix_start_rows[name] = row
+            self.trends[name].add(value)
+        
+        # prefix rows stay aligned with trait_history rows from each series' first row
+        for name, prefix in self.prefixes.items():
+            prefix.add(self.trait_history.column(name)[row])
+    
+    def restore_columns(self, columns, generation_rows):
+        """load saved snapshot columns and replay them into the running trends"""
+        count = len(next(iter(columns.values()), []))
+        self.trait_history = ColumnarSeries(max(count, 1))
+        for name, values in columns.items():
+            self.trait_history.columns[name] = np.array(values, dtype=float)
+        self.trait_history.count = count
+        
+        self.generation_rows = defaultdict(list)
+        for generation, rows in generation_rows.items():
+            self.generation_rows[generation] = list(rows)
+        
+        self.trends = {}
+        self.prefixes = {}
+        self.prefix_start_rows = {}
+        tracked = ['population', 'predators', 'prey']
+        tracked.extend(name for name in columns
+                       if name.startswith('traits.') and name.endswith('.mean'))
+        for row in range(count):
+            self._track_row(row, tracked)
+    
+    def get_generation_rows(self, generation):
+        """row indices of the snapshots logged during a generation"""
+        return np.array(self.generation_rows.get(generation, []), dtype=int)
+    
+    def column(self, name):
+        """one snapshot field for every logged snapshot, e.g. 'traits.speed.mean'"""
+        return self.trait_history.column(name)
+    
+    def get_trend(self, name, windowed=False):
+        """slope and direction of a tracked series, over all snapshots or the recent window"""
+        trend = self.trends.get(name)
+        if trend is None:
+            return None
+        slope = trend.slope(windowed)
+        return {'slope': slope, 'trend': self._classify_trend(slope)}
+    
+    def get_row_range(self, time_range):
+        """trait_history rows logged in [start_time, end_time), found by bisection"""
+        start_time, end_time = time_range
+        times = self.column('time_step')  # snapshots are logged in time order
+        start_row = int(np.searchsorted(times, start_time, side='left'))
+        end_row = int(np.searchsorted(times, end_time, side='left'))
+        return start_row, max(start_row, end_row)
+    
+    def get_range_statistics(self, name, time_range):
+        """mean, std, min, max and slope of a tracked series over [start_time, end_time)"""
+        prefix = self.prefixes.get(name)
+        if prefix is None:
             return None
         
-        start_idx = 0
-        end_idx = len(self.trait_history)
+        start_row, end_row = self.get_row_range(time_range)
+        offset = self.prefix_start_rows[name]
+        stats = prefix.range_stats(start_row - offset, end_row - offset)
+        if stats is None:
+            return None
         
-        if time_range:
-            start_time, end_time = time_range
-            start_idx = max(0, start_time // self.config.trait_log_interval)
-            end_idx = min(len(self.trait_history), end_time // self.config.trait_log_interval)
+        # extremes have no prefix form; reduce the located slice directly
+        values = self.column(name)[max(start_row, offset):end_row]
+        stats['min'] = np.nanmin(values)
+        stats['max'] = np.nanmax(values)
+        return stats
+    
+    def get_trait_statistics(self, trait_name, time_range=None):
+        """get statistics for a specific trait over time"""
+        if not len(self.trait_history):
+            return None
         
-        values = []
-        for snapshot in self.trait_history[start_idx:end_idx]:
-            if 'traits' in snapshot and trait_name in snapshot['traits']:
-                values.append(snapshot['traits'][trait_name]['mean'])
+        # whole history: served from the running sums
+        if not time_range:
+            trend = self.trends.get(f'traits.{trait_name}.mean')
+            if trend is None:
+                return None
+            return {
+                'mean': trend.mean,
+                'std': trend.std,
+                'min': trend.min,
+                'max': trend.max,
+                'trend': self._classify_trend(trend.slope())
+            }
         
-        if not values:
+        # time window: rows located by bisection, reduced from prefix sums
+        stats = self.get_range_statistics(f'traits.{trait_name}.mean', time_range)
+        if stats is None:
             return None
         
         return {
-            'mean': np.mean(values),
-            'std': np.std(values),
-            'min': np.min(values),
-            'max': np.max(values),
-            'trend': self._calculate_trend(values)
+            'mean': stats['mean'],
+            'std': stats['std'],
+            'min': stats['min'],
+            'max': stats['max'],
+            'trend': self._classify_trend(stats['slope'])
         }
     
-    def _calculate_trend(self, values):
-        """calculate if trait is increasing, decreasing, or stable"""
-        if len(values) < 2:
-            return 'stable'
-        
-        # simple linear regression slope
-        x = np.arange(len(values))
-        slope = np.polyfit(x, values, 1)[0]
-        
+    def _classify_trend(self, slope):
+        """classify a regression slope as increasing, decreasing, or stable"""
         if abs(slope) < 0.01:
             return 'stable'
         elif slope > 0:
@@ -63,7 +151,7 @@ class TraitAnalyzer:
     
     def get_population_trends(self):
         """analyze population and trait trends over time"""
-        if not self.trait_history:
+        if not len(self.trait_history):
             return {}
         
         trends = {}
@@ -73,62 +161,39 @@ class TraitAnalyzer:
                 trends[trait_name] = {
                     'current_mean': stats['mean'],
                     'trend': stats['trend'],
+                    'recent_trend': self.get_trend(f'traits.{trait_name}.mean', windowed=True)['trend'],
                     'volatility': stats['std']
                 }
         
         # population trends
-        populations = [s['population'] for s in self.trait_history]
-        predators = [s.get('predators', 0) for s in self.trait_history]
-        prey = [s.get('prey', 0) for s in self.trait_history]
-        
-        if populations:
-            trends['population'] = {
-                'current': populations[-1],
-                'trend': self._calculate_trend(populations),
-                'max': max(populations),
-                'min': min(populations)
-            }
-        
-        if predators:
-            trends['predators'] = {
-                'current': predators[-1],
-                'trend': self._calculate_trend(predators),
-                'max': max(predators),
-                'min': min(predators)
-            }
-        
-        if prey:
-            trends['prey'] = {
-                'current': prey[-1],
-                'trend': self._calculate_trend(prey),
-                'max': max(prey),
-                'min': min(prey)
+        for name in ['population', 'predators', 'prey']:
+            trend = self.trends.get(name)
+            if trend is None:
+                continue
+            trends[name] = {
+                'current': int(trend.window[-1]),
+                'trend': self._classify_trend(trend.slope()),
+                'recent_trend': self._classify_trend(trend.slope(windowed=True)),
+                'max': int(trend.max),
+                'min': int(trend.min)
             }
         
         return trends
     
     def plot_trait_evolution(self, trait_name, save_path=None):
         """create a plot showing trait evolution over time"""
-        if not self.trait_history:
+        if not len(self.trait_history):
             return
         
-        times = [s['time_step'] for s in self.trait_history]
-        means = []
-        stds = []
-        
-        for snapshot in self.trait_history:
-            if 'traits' in snapshot and trait_name in snapshot['traits']:
-                means.append(snapshot['traits'][trait_name]['mean'])
-                stds.append(snapshot['traits'][trait_name]['std'])
-            else:
-                means.append(0)
-                stds.append(0)
+        times = self.column('time_step')
+        means = np.nan_to_num(self.column(f'traits.{trait_name}.mean'))
+        stds = np.nan_to_num(self.column(f'traits.{trait_name}.std'))
         
         plt.figure(figsize=(10, 6))
         plt.plot(times, means, 'b-', linewidth=2, label=f'{trait_name} mean')
-        plt.fill_between(times, 
-                        [m - s for m, s in zip(means, stds)],
-                        [m + s for m, s in zip(means, stds)],
+        plt.fill_between(times,
+                        means - stds,
+                        means + stds,
                         alpha=0.3, color='blue', label='±1 std dev')
         
         plt.xlabel('Time Step')
@@ -145,16 +210,16 @@ class TraitAnalyzer:
     
     def plot_population_and_traits(self, save_path=None):
         """create a comprehensive plot showing population and key traits"""
-        if not self.trait_history:
+        if not len(self.trait_history):
             return
         
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         
-        times = [s['time_step'] for s in self.trait_history]
+        times = self.column('time_step')
         
         # population by species
-        predators = [s.get('predators', 0) for s in self.trait_history]
-        prey = [s.get('prey', 0) for s in self.trait_history]
+        predators = np.nan_to_num(self.column('predators'))
+        prey = np.nan_to_num(self.column('prey'))
         
         ax1.plot(times, predators, 'r-', linewidth=2, label='Predators')
         ax1.plot(times, prey, 'g-', linewidth=2, label='Prey')
@@ -164,36 +229,21 @@ class TraitAnalyzer:
         ax1.grid(True, alpha=0.3)
         
         # speed
-        speed_means = []
-        for snapshot in self.trait_history:
-            if 'traits' in snapshot and 'speed' in snapshot['traits']:
-                speed_means.append(snapshot['traits']['speed']['mean'])
-            else:
-                speed_means.append(0)
+        speed_means = np.nan_to_num(self.column('traits.speed.mean'))
         ax2.plot(times, speed_means, 'b-', linewidth=2)
         ax2.set_title('Average Speed Over Time')
         ax2.set_ylabel('Speed')
         ax2.grid(True, alpha=0.3)
         
         # aggression (predator trait)
-        aggression_means = []
-        for snapshot in self.trait_history:
-            if 'traits' in snapshot and 'aggression' in snapshot['traits']:
-                aggression_means.append(snapshot['traits']['aggression']['mean'])
-            else:
-                aggression_means.append(0)
+        aggression_means = np.nan_to_num(self.column('traits.aggression.mean'))
         ax3.plot(times, aggression_means, 'r-', linewidth=2)
         ax3.set_title('Average Aggression Over Time')
         ax3.set_ylabel('Aggression')
         ax3.grid(True, alpha=0.3)
         
         # caution (prey trait)
-        caution_means = []
-        for snapshot in self.trait_history:
-            if 'traits' in snapshot and 'caution' in snapshot['traits']:
-                caution_means.append(snapshot['traits']['caution']['mean'])
-            else:
-                caution_means.append(0)
+        caution_means = np.nan_to_num(self.column('traits.caution.mean'))
         ax4.plot(times, caution_means, 'g-', linewidth=2)
         ax4.set_title('Average Caution Over Time')
         ax4.set_ylabel('Caution')
@@ -209,16 +259,16 @@ class TraitAnalyzer:
     
     def plot_ecological_dynamics(self, save_path=None):
         """create a plot showing ecological dynamics"""
-        if not self.trait_history:
+        if not len(self.trait_history):
             return
         
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         
-        times = [s['time_step'] for s in self.trait_history]
+        times = self.column('time_step')
         
         # predator-prey dynamics
-        predators = [s.get('predators', 0) for s in self.trait_history]
-        prey = [s.get('prey', 0) for s in self.trait_history]
+        predators = np.nan_to_num(self.column('predators'))
+        prey = np.nan_to_num(self.column('prey'))
         
         ax1.plot(times, predators, 'r-', linewidth=2, label='Predators')
         ax1.plot(times, prey, 'g-', linewidth=2, label='Prey')
@@ -228,26 +278,21 @@ class TraitAnalyzer:
         ax1.grid(True, alpha=0.3)
         
         # food density
-        food_density = [s.get('food_density', 0) for s in self.trait_history]
+        food_density = np.nan_to_num(self.column('food_density'))
         ax2.plot(times, food_density, 'y-', linewidth=2)
         ax2.set_title('Food Density Over Time')
         ax2.set_ylabel('Food Density')
         ax2.grid(True, alpha=0.3)
         
         # average fitness
-        fitness = [s.get('average_fitness', 0) for s in self.trait_history]
+        fitness = np.nan_to_num(self.column('average_fitness'))
         ax3.plot(times, fitness, 'm-', linewidth=2)
         ax3.set_title('Average Fitness Over Time')
         ax3.set_ylabel('Fitness Score')
         ax3.grid(True, alpha=0.3)
         
         # vision evolution
-        vision_means = []
-        for snapshot in self.trait_history:
-            if 'traits' in snapshot and 'vision' in snapshot['traits']:
-                vision_means.append(snapshot['traits']['vision']['mean'])
-            else:
-                vision_means.append(0)
+        vision_means = np.nan_to_num(self.column('traits.vision.mean'))
         ax4.plot(times, vision_means, 'c-', linewidth=2)
         ax4.set_title('Average Vision Over Time')
         ax4.set_ylabel('Vision Radius')
@@ -263,43 +308,20 @@ class TraitAnalyzer:
     
     def export_trait_data(self, filename):
         """export trait data to csv for external analysis"""
-        if not self.trait_history:
+        if not len(self.trait_history):
             return
         
         import csv
         
         with open(filename, 'w', newline='') as csvfile:
-            fieldnames = ['time_step', 'population', 'predators', 'prey', 'generation', 'average_fitness', 'food_density']
-            trait_names = ['speed', 'vision', 'size', 'metabolism', 'reproduction_threshold', 'max_age', 'aggression', 'caution', 'stamina']
+            # same columns as the streaming exporter: every trait plus the
+            # enhanced and behavioral stats, missing values exported as 0
+            fieldnames = [column for column, _ in EXPORT_FIELDS]
+            columns = []
+            for column, field in EXPORT_FIELDS:
+                values = np.nan_to_num(self.column(field))
+                columns.append(values.astype(int) if column in INTEGER_FIELDS else values)
             
-            for trait in trait_names:
-                fieldnames.extend([f'{trait}_mean', f'{trait}_std', f'{trait}_min', f'{trait}_max'])
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for snapshot in self.trait_history:
-                row = {
-                    'time_step': snapshot['time_step'],
-                    'population': snapshot['population'],
-                    'predators': snapshot.get('predators', 0),
-                    'prey': snapshot.get('prey', 0),
-                    'generation': snapshot.get('generation', 0),
-                    'average_fitness': snapshot.get('average_fitness', 0),
-                    'food_density': snapshot.get('food_density', 0)
-                }
-                
-                for trait in trait_names:
-                    if 'traits' in snapshot and trait in snapshot['traits']:
-                        trait_data = snapshot['traits'][trait]
-                        row[f'{trait}_mean'] = trait_data['mean']
-                        row[f'{trait}_std'] = trait_data['std']
-                        row[f'{trait}_min'] = trait_data['min']
-                        row[f'{trait}_max'] = trait_data['max']
-                    else:
-                        row[f'{trait}_mean'] = 0
-                        row[f'{trait}_std'] = 0
-                        row[f'{trait}_min'] = 0
-                        row[f'{trait}_max'] = 0
-                
-                writer.writerow(row) 
\ No newline at end of file
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(zip(*columns))
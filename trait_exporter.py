@@ -0,0 +1,99 @@
+import csv
+import os
+from genome import TRAIT_NAMES
+from organism import BehaviorState
+from timeseries import flatten_snapshot
+
+# scalar snapshot fields, exported under their own names
+SCALAR_FIELDS = [
+    'time_step', 'population', 'predators', 'prey', 'generation', 'average_fitness', 'food_density',
+    # phase 4: speciation data
+    'species_count', 'speciation_events', 'average_genetic_distance', 'lineage_depth',
+    # phase 6: behavioral evolution data
+    'average_intelligence', 'average_social_behavior', 'average_exploration_rate', 'average_memory_capacity',
+    # new: enhanced evolution data
+    'average_adaptation_score', 'average_energy_efficiency', 'evolutionary_pressure',
+    'population_diversity', 'environmental_stress', 'resource_competition_level',
+]
+
+BEHAVIOR_STATES = [value for name, value in vars(BehaviorState).items()
+                   if not name.startswith('_')]
+PREY_TRAITS = ['camouflage', 'toxicity', 'armor', 'warning_signals', 'group_cohesion']
+PREDATOR_TRAITS = ['hunting_strategy', 'patience', 'cooperation', 'learning_rate']
+TRAIT_STATS = ['mean', 'std', 'min', 'max']
+
+
+def export_fields():
+    """(csv column, flattened snapshot field) pairs for every exported value"""
+    fields = [(name, name) for name in SCALAR_FIELDS]
+    for trait in TRAIT_NAMES:
+        fields.extend((f'{trait}_{stat}', f'traits.{trait}.{stat}') for stat in TRAIT_STATS)
+    fields.extend((f'state_{state}', f'behavioral_states.{state}') for state in BEHAVIOR_STATES)
+    fields.extend((f'prey_{trait}_mean', f'prey_protective_traits.{trait}.mean') for trait in PREY_TRAITS)
+    fields.extend((f'predator_{trait}_mean', f'predator_hunting_traits.{trait}.mean')
+                  for trait in PREDATOR_TRAITS)
+    return fields
+
+
+EXPORT_FIELDS = export_fields()
+
+# csv columns holding counts, written without a decimal point
+INTEGER_FIELDS = {'time_step', 'population', 'predators', 'prey', 'generation',
+                  'species_count', 'speciation_events', 'lineage_depth'}
+INTEGER_FIELDS.update(f'state_{state}' for state in BEHAVIOR_STATES)
+
+
+class TraitExporter:
+    """streams trait snapshots to csv as they are logged
+
+    each row goes straight through to the operating system, so killing the
+    process loses nothing that was already logged. every chunk_rows rows
+    the file is also fsynced to disk. only the open file is held in memory,
+    however long the run.
+    """
+
+    def __init__(self, path, chunk_rows=50, append=False, keep_rows=None):
+        self.path = path
+        self.chunk_rows = max(1, int(chunk_rows))
+        self.rows_written = 0
+        self._unsynced_rows = 0
+
+        resume = append and os.path.exists(path) and os.path.getsize(path) > 0
+        if resume and keep_rows is not None:
+            # drop rows logged after the point being resumed from
+            self._truncate(keep_rows)
+            self.rows_written = keep_rows
+        self.file = open(path, 'a' if resume else 'w', newline='')
+        self.writer = csv.writer(self.file)
+        if not resume:
+            self.writer.writerow([column for column, _ in EXPORT_FIELDS])
+            self.file.flush()
+
+    def _truncate(self, keep_rows):
+        with open(self.path, 'r+', newline='') as file:
+            for _ in range(keep_rows + 1):  # header plus kept rows
+                if not file.readline():
+                    break
+            file.truncate(file.tell())
+
+    def write_snapshot(self, snapshot):
+        """append one snapshot row; missing values are exported as 0"""
+        values = flatten_snapshot(snapshot)
+        self.writer.writerow([values.get(field, 0) for _, field in EXPORT_FIELDS])
+        self.file.flush()
+
+        self.rows_written += 1
+        self._unsynced_rows += 1
+        if self._unsynced_rows >= self.chunk_rows:
+            self.sync()
+
+    def sync(self):
+        """force written rows onto disk"""
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self._unsynced_rows = 0
+
+    def close(self):
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
@@ -1,5 +1,5 @@
 import math
-import pygame
+import numpy as np
 from sim_config import SimConfig
 
 class WeatherSystem:
@@ -47,6 +47,10 @@ class WeatherSystem:
                     temperature = self.config.cold_temperature + progress * (self.config.hot_temperature - self.config.cold_temperature)
                 
                 self.temperature_map[(x, y)] = temperature
+        
+        # the map only varies with y: one entry per sampled row, for array lookups
+        self.temperature_rows = np.array([self.temperature_map[(0, y)]
+                                          for y in range(0, self.config.world_height, 10)], dtype=float)
     
     def update(self):
         """update weather system for current frame"""
@@ -102,7 +106,8 @@ class WeatherSystem:
     
     def _update_temperature_effects(self):
         """update temperature effects on the environment"""
-        # temperature effects are applied per-organism in the organism update
+        # temperature effects on organisms are applied to the whole population
+        # after movement, by metabolism.apply_metabolism
         pass
     
     def get_temperature_at_position(self, x, y):
@@ -123,6 +128,23 @@ class WeatherSystem:
         # apply seasonal modifier
         return base_temperature + self.current_temperature_modifier
     
+    def get_temperatures_at(self, x, y):
+        """temperatures at arrays of positions, as get_temperature_at_position gives them"""
+        if not self.config.temperature_zones_enabled:
+            return np.full(len(x), float(self.config.moderate_temperature))
+        
+        # same nearest sample and clamping as the scalar lookup
+        sample_x = np.clip((x // 10) * 10, 0, self.config.world_width - 10)
+        sample_y = np.clip((y // 10) * 10, 0, self.config.world_height - 10)
+        
+        # samples off the 10 pixel lattice are not in the map and read as moderate
+        on_map = (sample_x % 10 == 0) & (sample_y % 10 == 0)
+        rows = np.where(on_map, sample_y // 10, 0).astype(int)
+        base_temperature = np.where(on_map, self.temperature_rows[rows], self.config.moderate_temperature)
+        
+        # apply seasonal modifier
+        return base_temperature + self.current_temperature_modifier
+    
     def get_light_level(self):
         """get current light level (0.0 to 1.0)"""
         if not self.config.day_night_cycle_enabled:
@@ -152,69 +174,3 @@ class WeatherSystem:
         if not self.config.seasons_enabled:
             return 0
         return self.current_temperature_modifier
-    
-    def render_weather_effects(self, screen):
-        """render weather effects on the screen"""
-        if not self.config.show_day_night_cycle and not self.config.show_temperature_zones:
-            return
-        
-        # create a surface for weather effects
-        weather_surface = pygame.Surface((self.config.width, self.config.height))
-        weather_surface.set_alpha(50)  # semi-transparent
-        
-        # apply day/night cycle overlay
-        if self.config.show_day_night_cycle and self.config.day_night_cycle_enabled:
-            if self.is_night:
-                weather_surface.fill(self.config.night_color)
-                screen.blit(weather_surface, (0, 0))
-        
-        # apply temperature zone overlays
-        if self.config.show_temperature_zones and self.config.temperature_zones_enabled:
-            self._render_temperature_zones(screen)
-    
-    def _render_temperature_zones(self, screen):
-        """render temperature zone indicators"""
-        # render cold zone (top)
-        cold_rect = pygame.Rect(0, 0, self.config.width, self.config.cold_zone_y_range[1])
-        cold_surface = pygame.Surface((self.config.width, self.config.cold_zone_y_range[1]))
-        cold_surface.set_alpha(30)
-        cold_surface.fill(self.config.cold_zone_color)
-        screen.blit(cold_surface, (0, 0))
-        
-        # render hot zone (bottom)
-        hot_height = self.config.world_height - self.config.hot_zone_y_range[0]
-        hot_rect = pygame.Rect(0, self.config.hot_zone_y_range[0], self.config.width, hot_height)
-        hot_surface = pygame.Surface((self.config.width, hot_height))
-        hot_surface.set_alpha(30)
-        hot_surface.fill(self.config.hot_zone_color)
-        screen.blit(hot_surface, (0, self.config.hot_zone_y_range[0]))
-    
-    def render_weather_ui(self, screen):
-        """render weather information in the ui"""
-        if not self.config.show_season_indicator:
-            return
-        
-        font = pygame.font.Font(None, 24)
-        
-        # render day/night indicator
-        if self.config.show_day_night_cycle and self.config.day_night_cycle_enabled:
-            time_text = "Night" if self.is_night else "Day"
-            time_color = (100, 100, 255) if self.is_night else (255, 255, 100)
-            time_surface = font.render(f"Time: {time_text}", True, time_color)
-            screen.blit(time_surface, (self.config.width - 150, 10))
-        
-        # render season indicator
-        if self.config.seasons_enabled:
-            season_text = f"Season: {self.current_season.capitalize()}"
-            season_surface = font.render(season_text, True, self.config.text_color)
-            screen.blit(season_surface, (self.config.width - 150, 35))
-            
-            # render food multiplier
-            food_text = f"Food: {self.current_food_multiplier:.1f}x"
-            food_surface = font.render(food_text, True, self.config.text_color)
-            screen.blit(food_surface, (self.config.width - 150, 60))
-            
-            # render temperature modifier
-            temp_text = f"Temp: {self.current_temperature_modifier:+d}°C"
-            temp_surface = font.render(temp_text, True, self.config.text_color)
-            screen.blit(temp_surface, (self.config.width - 150, 85)) 
\ No newline at end of file